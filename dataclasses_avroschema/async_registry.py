@@ -0,0 +1,426 @@
+import asyncio
+import hashlib
+import json
+import time
+import typing
+import urllib.parse
+
+from dataclasses_avroschema.confluent import (
+    CONTENT_TYPE,
+    SchemaRegistryError,
+    get_subject,
+)
+from dataclasses_avroschema.schema_generator import SchemaGenerator
+
+DEFAULT_TTL = 300.0
+DEFAULT_NEGATIVE_TTL = 10.0
+
+
+class TTLCache:
+    """
+    Values that expire ttl seconds after they are stored.
+
+    Arguments:
+        ttl (float): seconds that a value is valid, None to never expire
+        clock (typing.Callable): returns the current time in seconds
+    """
+
+    def __init__(
+        self,
+        ttl: typing.Optional[float],
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.clock = clock
+        self._values: typing.Dict[typing.Any, typing.Tuple[typing.Any, float]] = {}
+
+    def get(self, key: typing.Any, default: typing.Any = None) -> typing.Any:
+        item = self._values.get(key)
+        if item is None:
+            return default
+
+        value, expires = item
+        if expires < self.clock():
+            del self._values[key]
+            return default
+        return value
+
+    def set(self, key: typing.Any, value: typing.Any) -> None:
+        expires = float("inf") if self.ttl is None else self.clock() + self.ttl
+        self._values[key] = (value, expires)
+
+    def clear(self) -> None:
+        self._values.clear()
+
+    def __contains__(self, key: typing.Any) -> bool:
+        return self.get(key, self) is not self
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+def _retrieve_exception(future: asyncio.Future) -> None:
+    # avoid the warning of an exception never retrieved when all the callers
+    # of a request were cancelled
+    if not future.cancelled():
+        future.exception()
+
+
+class Connection(typing.NamedTuple):
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+
+
+class AsyncRegistry:
+    """
+    asyncio client of a Confluent Schema Registry server.
+
+    - The ids and the schemas are cached both ways, id to schema and
+      subject and schema fingerprint to id, for ttl seconds.
+    - Concurrent requests of the same id or schema share one request
+      to the server.
+    - Failed requests are cached for negative_ttl seconds, so the server is
+      not called again while it fails.
+    - The HTTP/1.1 connections are kept alive and reused, up to
+      max_connections at the same time.
+
+    Arguments:
+        url (str): url of the server, for example http://localhost:8081
+        max_connections (int): maximum amount of open connections
+        ttl (float): seconds that the ids and schemas are cached,
+            None to cache them forever
+        negative_ttl (float): seconds that the failures are cached
+        timeout (float): timeout of the requests in seconds
+        clock (typing.Callable): returns the current time in seconds
+    """
+
+    def __init__(
+        self,
+        url: str,
+        max_connections: int = 10,
+        ttl: typing.Optional[float] = DEFAULT_TTL,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+        timeout: float = 10.0,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        parsed_url = urllib.parse.urlsplit(url)
+        if parsed_url.scheme != "http":
+            raise ValueError("Only http urls are supported")
+
+        self.url = url
+        self.host = parsed_url.hostname or "localhost"
+        self.port = parsed_url.port or 80
+        self.base_path = parsed_url.path.rstrip("/")
+        self.timeout = timeout
+        self.max_connections = max_connections
+
+        self.ids = TTLCache(ttl, clock)
+        self.schemas = TTLCache(ttl, clock)
+        self.failures = TTLCache(negative_ttl, clock)
+
+        # the semaphore, the connections and the requests in flight belong
+        # to the event loop that created them, see _get_connections
+        self._loop: typing.Optional[asyncio.AbstractEventLoop] = None
+        self._idle_connections: typing.List[Connection] = []
+        self._connections: typing.Optional[asyncio.BoundedSemaphore] = None
+        self._inflight: typing.Dict[typing.Any, asyncio.Future] = {}
+        self.requests_count = 0
+
+    async def get_schema_id(
+        self,
+        klass: typing.Any,
+        subject: typing.Optional[str] = None,
+        register: bool = True,
+    ) -> int:
+        """
+        Return the id of the schema of a class, registering it under the
+        subject if register is True or looking it up otherwise
+
+        Arguments:
+            klass (typing.Any): dataclass, python class or faust.Record
+            subject (str): the full name of the record by default
+            register (bool): register the schema if it does not exist
+        """
+        subject = subject or get_subject(klass)
+        # the json of the schema is encoded once per class, see avro_schema_bytes
+        schema_bytes = SchemaGenerator(klass).avro_schema_bytes()
+        path = self.get_path(subject, register)
+        fingerprint = self.fingerprint(schema_bytes)
+
+        cached_id = self.ids.get((subject, fingerprint))
+        if cached_id is not None:
+            return cached_id
+
+        return await self._get_id(path, subject, schema_bytes.decode(), fingerprint)
+
+    async def register(self, subject: str, schema: str) -> int:
+        """
+        Register the schema under the subject, if it is not registered yet
+
+        Returns:
+            int: the id of the schema
+        """
+        return await self._get_id(
+            self.get_path(subject, True),
+            subject,
+            schema,
+            self.fingerprint(schema.encode()),
+        )
+
+    async def lookup(self, subject: str, schema: str) -> int:
+        """
+        Return the id of a schema registered under the subject
+
+        Raises:
+            SchemaRegistryError: when the schema is not registered
+        """
+        return await self._get_id(
+            self.get_path(subject, False),
+            subject,
+            schema,
+            self.fingerprint(schema.encode()),
+        )
+
+    async def get_schema(self, schema_id: int) -> str:
+        """
+        Return the schema with the id schema_id
+        """
+        key = ("schema", schema_id)
+
+        async def fetch() -> str:
+            schema = (await self.request("GET", f"/schemas/ids/{schema_id}"))["schema"]
+            self.schemas.set(schema_id, schema)
+            return schema
+
+        return await self._cached(key, self.schemas, schema_id, fetch)
+
+    def get_path(self, subject: str, register: bool) -> str:
+        path = f"/subjects/{self.quote(subject)}"
+        return f"{path}/versions" if register else path
+
+    @staticmethod
+    def fingerprint(schema_bytes: bytes) -> str:
+        """
+        Return the MD5 of the text of a schema: the Parsing Canonical Form
+        does not have the logical types, and it is slower to compute
+        """
+        return hashlib.md5(schema_bytes).hexdigest()
+
+    async def _get_id(
+        self, path: str, subject: str, schema: str, fingerprint: str
+    ) -> int:
+        cache_key = (subject, fingerprint)
+
+        async def fetch() -> int:
+            schema_id = (await self.request("POST", path, {"schema": schema}))["id"]
+            self.ids.set(cache_key, schema_id)
+            self.schemas.set(schema_id, schema)
+            return schema_id
+
+        return await self._cached((path, fingerprint), self.ids, cache_key, fetch)
+
+    async def _cached(
+        self,
+        key: typing.Any,
+        cache: TTLCache,
+        cache_key: typing.Any,
+        fetch: typing.Callable[[], typing.Awaitable[typing.Any]],
+    ) -> typing.Any:
+        """
+        Return the value cached, or the result of fetch sharing it between
+        the concurrent calls with the same key.
+
+        fetch runs in its own task: a caller that is cancelled, for example
+        by a timeout, does not cancel the request of the other callers.
+        """
+        value = cache.get(cache_key)
+        if value is not None:
+            return value
+
+        failure = self.failures.get(key)
+        if failure is not None:
+            raise failure
+
+        # the requests in flight of another event loop can not be awaited
+        self._get_connections()
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key, fetch))
+            task.add_done_callback(_retrieve_exception)
+            self._inflight[key] = task
+
+        return await asyncio.shield(task)
+
+    async def _fetch(
+        self, key: typing.Any, fetch: typing.Callable[[], typing.Awaitable[typing.Any]]
+    ) -> typing.Any:
+        try:
+            return await fetch()
+        except SchemaRegistryError as error:
+            self.failures.set(key, error)
+            raise
+        finally:
+            del self._inflight[key]
+
+    async def request(
+        self, method: str, path: str, body: typing.Optional[typing.Dict] = None
+    ) -> typing.Dict:
+        """
+        Send a request using a pooled connection and return the json response
+        """
+        data = b"" if body is None else json.dumps(body).encode("utf-8")
+        message = (
+            f"{method} {self.base_path}{path} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            f"Accept: {CONTENT_TYPE}\r\n"
+            f"Content-Type: {CONTENT_TYPE}\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            "Connection: keep-alive\r\n\r\n"
+        ).encode("latin-1") + data
+
+        async with self._get_connections():
+            try:
+                status, content = await asyncio.wait_for(
+                    self._send(message), self.timeout
+                )
+            except (
+                OSError,
+                asyncio.TimeoutError,
+                asyncio.IncompleteReadError,
+                asyncio.LimitOverrunError,
+            ) as error:
+                raise SchemaRegistryError(f"{method} {path} failed: {error!r}")
+
+        self.requests_count += 1
+
+        if status >= 400:
+            raise SchemaRegistryError(
+                f"{method} {path} failed with status {status}: {content!r}"
+            )
+        return json.loads(content)
+
+    def _get_connections(self) -> asyncio.BoundedSemaphore:
+        """
+        Return the semaphore that limits the open connections, created in the
+        running event loop. When the client is used in another loop, the
+        connections of the previous one are dropped.
+        """
+        loop = asyncio.get_running_loop()
+
+        if self._loop is not loop:
+            for _, writer in self._idle_connections:
+                try:
+                    writer.close()
+                except RuntimeError:
+                    # the previous loop is already closed
+                    pass
+
+            self._loop = loop
+            self._idle_connections = []
+            self._inflight = {}
+            self._connections = asyncio.BoundedSemaphore(self.max_connections)
+
+        return self._connections
+
+    async def _send(self, message: bytes) -> typing.Tuple[int, bytes]:
+        while self._idle_connections:
+            connection = self._idle_connections.pop()
+            try:
+                return await self._exchange(connection, message)
+            except (OSError, asyncio.IncompleteReadError):
+                # the server closed the idle connection, try another one
+                pass
+
+        connection = Connection(*await asyncio.open_connection(self.host, self.port))
+        return await self._exchange(connection, message)
+
+    async def _exchange(
+        self, connection: Connection, message: bytes
+    ) -> typing.Tuple[int, bytes]:
+        """
+        Send a request and read its response. The connection goes back to
+        the pool only if the response was read completely, otherwise it is
+        closed, also when the request times out.
+        """
+        reader, writer = connection
+        reusable = False
+
+        try:
+            writer.write(message)
+            await writer.drain()
+
+            status_line = await reader.readuntil(b"\r\n")
+            status = int(status_line.split()[1])
+            headers = await self._read_headers(reader)
+
+            if "chunked" in headers.get("transfer-encoding", "").lower():
+                content = await self._read_chunks(reader)
+            elif "content-length" in headers:
+                content = await reader.readexactly(int(headers["content-length"]))
+            else:
+                # the end of the content is the end of the connection
+                headers["connection"] = "close"
+                content = await reader.read()
+
+            reusable = headers.get("connection", "").lower() != "close"
+        finally:
+            if reusable:
+                self._idle_connections.append(connection)
+            else:
+                writer.close()
+
+        return status, content
+
+    @staticmethod
+    async def _read_headers(reader: asyncio.StreamReader) -> typing.Dict[str, str]:
+        headers = {}
+
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                return headers
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+    @classmethod
+    async def _read_chunks(cls, reader: asyncio.StreamReader) -> bytes:
+        """
+        Read a content with the chunked transfer encoding
+        """
+        chunks = []
+
+        while True:
+            size_line = await reader.readuntil(b"\r\n")
+            # the chunk extensions after ";" are ignored
+            size = int(size_line.split(b";")[0], 16)
+            if size == 0:
+                # the trailer headers are read and ignored
+                await cls._read_headers(reader)
+                return b"".join(chunks)
+
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+
+    @staticmethod
+    def quote(subject: str) -> str:
+        return urllib.parse.quote(subject, safe="")
+
+    async def close(self) -> None:
+        """
+        Close the idle connections
+        """
+        self._get_connections()
+
+        while self._idle_connections:
+            _, writer = self._idle_connections.pop()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:  # pragma: no cover
+                pass
+
+    async def __aenter__(self) -> "AsyncRegistry":
+        return self
+
+    async def __aexit__(self, *args: typing.Any) -> None:
+        await self.close()
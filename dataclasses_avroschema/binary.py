@@ -0,0 +1,107 @@
+import struct
+import typing
+
+FLOAT_STRUCT = struct.Struct("<f")
+DOUBLE_STRUCT = struct.Struct("<d")
+
+pack_float = FLOAT_STRUCT.pack
+pack_double = DOUBLE_STRUCT.pack
+unpack_float = FLOAT_STRUCT.unpack_from
+unpack_double = DOUBLE_STRUCT.unpack_from
+
+INT_RANGE = (-(2**31), 2**31 - 1)
+LONG_RANGE = (-(2**63), 2**63 - 1)
+
+
+def write_long(buffer: bytearray, value: int) -> None:
+    """
+    Append a long to buffer using zig-zag and variable-length encoding
+
+    Raises:
+        ValueError: when the value is out of the range of a long
+    """
+    if not LONG_RANGE[0] <= value <= LONG_RANGE[1]:
+        raise ValueError(f"{value} is out of the range of a long")
+
+    value = (value << 1) ^ (value >> 63)
+
+    while value & ~0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+
+    buffer.append(value)
+
+
+def write_int(buffer: bytearray, value: int) -> None:
+    """
+    Append an int to buffer, see write_long
+
+    Raises:
+        ValueError: when the value is out of the range of an int
+    """
+    if not INT_RANGE[0] <= value <= INT_RANGE[1]:
+        raise ValueError(f"{value} is out of the range of an int")
+
+    write_long(buffer, value)
+
+
+def write_bytes(buffer: bytearray, value: bytes) -> None:
+    """
+    Append bytes to buffer: the length as long followed by the bytes
+    """
+    write_long(buffer, len(value))
+    buffer += value
+
+
+def write_string(buffer: bytearray, value: str) -> None:
+    """
+    Append a string to buffer as utf-8 encoded bytes
+    """
+    write_bytes(buffer, value.encode("utf-8"))
+
+
+def read_long(data: bytes, position: int) -> typing.Tuple[int, int]:
+    """
+    Read an int or long written with zig-zag and variable-length encoding
+
+    Returns:
+        typing.Tuple[int, int]: the value and the position after it
+    """
+    byte = data[position]
+    position += 1
+    value = byte & 0x7F
+    shift = 7
+
+    while byte & 0x80:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+
+    return (value >> 1) ^ -(value & 1), position
+
+
+def read_bytes(data: bytes, position: int) -> typing.Tuple[bytes, int]:
+    """
+    Read bytes: the length as long followed by the bytes
+
+    Returns:
+        typing.Tuple[bytes, int]: the value and the position after it
+    """
+    size, position = read_long(data, position)
+    end = position + size
+
+    return bytes(data[position:end]), end
+
+
+def read_string(data: bytes, position: int) -> typing.Tuple[str, int]:
+    """
+    Read a string encoded as utf-8 bytes
+
+    Returns:
+        typing.Tuple[str, int]: the value and the position after it
+    """
+    size, position = read_long(data, position)
+    end = position + size
+
+    return str(data[position:end], "utf-8"), end
@@ -0,0 +1,189 @@
+import collections
+import dataclasses
+import inspect
+import threading
+import typing
+
+CacheInfo = collections.namedtuple("CacheInfo", ["hits", "misses", "currsize"])
+
+
+@dataclasses.dataclass
+class CachedSchema:
+    """
+    A cache entry: the schema definition of a class and its rendered schema.
+
+    schema has the nested named types inlined, so it can be embedded in other
+    schemas. python_schema (plain dicts and lists, using references to named
+    types already defined) and json_bytes (compact JSON) are the final forms,
+    computed the first time they are needed. record_classes maps the names
+    of the records to their classes, for the compilers.
+
+    The entries loaded from a manifest have no schema_definition until the
+    fields are needed, see SchemaGenerator.get_fields.
+
+    Everything is shared by the generators that hit the entry,
+    so it must be treated as read-only.
+    """
+
+    schema_definition: typing.Any
+    schema: typing.Any
+    python_schema: typing.Any = None
+    json_bytes: typing.Optional[bytes] = None
+    canonical_form: typing.Optional[str] = None
+    fingerprints: typing.Dict[str, str] = dataclasses.field(default_factory=dict)
+    resolution_fingerprints: typing.Dict[str, str] = dataclasses.field(
+        default_factory=dict
+    )
+    record_classes: typing.Optional[typing.Dict[str, typing.Any]] = None
+
+
+Loader = typing.Callable[[typing.Tuple], typing.Optional[CachedSchema]]
+InvalidateCallback = typing.Callable[[], None]
+
+
+class SchemaCache:
+    """
+    Process-wide cache of generated schemas.
+
+    Entries are keyed by the class and the generation options
+    (for example include_schema_doc), so all the SchemaGenerator instances
+    created for a class, including the ones created to render nested records,
+    share the same introspection and rendering work.
+
+    On a miss the loaders are asked for the entry before generating it,
+    so the schemas compiled ahead of time skip the introspection, see
+    manifest.SchemaManifest.
+
+    The caches derived from the schemas, like the compiled encoders and
+    decoders, are cleared by invalidate through the invalidate callbacks.
+
+    The cache is thread-safe. The expensive work is done outside the lock,
+    so when two threads miss the same key at the same time both generate
+    the schema and the first one stored wins.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._entries: typing.Dict[typing.Tuple, CachedSchema] = {}
+        self._dataclasses: typing.Dict[typing.Any, typing.Any] = {}
+        self._loaders: typing.List[Loader] = []
+        self._invalidate_callbacks: typing.List[InvalidateCallback] = []
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(klass_or_instance: typing.Any, **options: typing.Any) -> typing.Tuple:
+        klass = (
+            klass_or_instance
+            if inspect.isclass(klass_or_instance)
+            else klass_or_instance.__class__
+        )
+        return (klass,) + tuple(sorted(options.items()))
+
+    def get_or_create(
+        self, key: typing.Tuple, factory: typing.Callable[[], CachedSchema]
+    ) -> CachedSchema:
+        """
+        Return the entry stored for key, creating it with factory on a miss.
+
+        Arguments:
+            key (typing.Tuple): key generated with make_key
+            factory (typing.Callable): called without arguments on a miss
+
+        Returns:
+            CachedSchema
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        # generating a schema may generate nested schemas, so it can not
+        # be done holding the lock
+        entry = self._load(key) or factory()
+
+        with self._lock:
+            return self._entries.setdefault(key, entry)
+
+    def _load(self, key: typing.Tuple) -> typing.Optional[CachedSchema]:
+        for loader in self._loaders:
+            entry = loader(key)
+            if entry is not None:
+                return entry
+        return None
+
+    def add_loader(self, loader: Loader) -> None:
+        """
+        Add a loader, called with the key of the entries that are not in the
+        cache. It returns the entry, or None to generate the schema.
+        """
+        with self._lock:
+            self._loaders.append(loader)
+
+    def remove_loader(self, loader: Loader) -> None:
+        with self._lock:
+            self._loaders.remove(loader)
+
+    def add_invalidate_callback(self, callback: InvalidateCallback) -> None:
+        """
+        Add a function called without arguments when entries are invalidated,
+        to clear a cache of things derived from the schemas. The derived
+        caches are cleared completely, even when only a class is invalidated.
+        """
+        with self._lock:
+            self._invalidate_callbacks.append(callback)
+
+    def get_dataclass(
+        self, klass: typing.Any, wrapper: typing.Callable[[typing.Any], typing.Any]
+    ) -> typing.Any:
+        """
+        Return the dataclass generated by wrapper for klass.
+
+        The wrapper is called only once per class, even when several threads
+        ask for the same class at the same time.
+        """
+        with self._lock:
+            try:
+                return self._dataclasses[klass]
+            except KeyError:
+                dataclass = self._dataclasses[klass] = wrapper(klass)
+                return dataclass
+
+    def invalidate(self, klass: typing.Any = None) -> None:
+        """
+        Remove the entries of klass, or all the entries if klass is None.
+
+        The schemas of the classes that embed klass as a nested record are
+        not removed, call invalidate without arguments to drop everything.
+        """
+        with self._lock:
+            if klass is None:
+                self._entries.clear()
+                self._dataclasses.clear()
+                self.hits = self.misses = 0
+            else:
+                for key in [key for key in self._entries if key[0] is klass]:
+                    del self._entries[key]
+                self._dataclasses.pop(klass, None)
+
+            callbacks = list(self._invalidate_callbacks)
+
+        # the callbacks may take their own locks, which are held while
+        # generating schemas, so they are called without holding this one
+        for callback in callbacks:
+            callback()
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, len(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: typing.Tuple) -> bool:
+        return key in self._entries
+
+
+schema_cache = SchemaCache()
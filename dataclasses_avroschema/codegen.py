@@ -0,0 +1,174 @@
+import contextlib
+import itertools
+import linecache
+import re
+import typing
+
+from dataclasses_avroschema import compiler
+
+INDENT = "    "
+
+# writes the lines that handle the python value stored in a local variable
+Emitter = typing.Callable[["CodeWriter", str], None]
+
+
+class CodeWriter:
+    """
+    Lines of python source of one generated function.
+
+    Keeps track of the indentation, the local variables names and the global
+    names used by the function, which are bound as default arguments so they
+    are loaded as locals.
+    """
+
+    def __init__(self) -> None:
+        self.lines: typing.List[str] = []
+        self.level = 1
+        self.used_names: typing.List[str] = []
+        self._counter = itertools.count()
+
+    def line(self, text: str) -> None:
+        self.lines.append(INDENT * self.level + text)
+
+    @contextlib.contextmanager
+    def indent(self) -> typing.Iterator[None]:
+        self.level += 1
+        try:
+            yield
+        finally:
+            self.level -= 1
+
+    def variable(self, prefix: str = "value") -> str:
+        return f"{prefix}{next(self._counter)}"
+
+    def use(self, name: str) -> str:
+        if name not in self.used_names:
+            self.used_names.append(name)
+        return name
+
+    def function(self, name: str, arguments: typing.Sequence[str]) -> str:
+        bound = [f"{used_name}={used_name}" for used_name in self.used_names]
+        signature = ", ".join(list(arguments) + bound)
+        lines = self.lines or [INDENT + "pass"]
+
+        return "\n".join([f"def {name}({signature}):"] + lines)
+
+
+class SourceCompiler(compiler.SchemaCompiler):
+    """
+    Compile an avro schema to python source.
+
+    Every type compiles to an emitter: a function that writes the lines that
+    handle one value into a CodeWriter. Every record becomes a generated
+    function, so the code of a record is straight-line code without any
+    dispatch over the schema at runtime.
+
+    The constants used by the generated code (classes, struct functions,
+    varint helpers, enum symbols...) are stored in the globals of the
+    generated module, see bind.
+    """
+
+    # added to the name of the generated functions, for example encode or decode
+    prefix: str = "codec"
+    # globals available to the generated code, for example the varint functions
+    helpers: typing.Dict[str, typing.Any] = {}
+    # arguments of the generated functions
+    arguments: typing.Tuple[str, ...] = ()
+
+    def __init__(self, record_classes: typing.Dict[str, typing.Any]) -> None:
+        super().__init__(record_classes)
+        self.globals: typing.Dict[str, typing.Any] = dict(self.helpers)
+        self.functions: typing.List[str] = []
+        self.record_functions: typing.Dict[str, str] = {}
+        self._counter = itertools.count()
+
+    def bind(self, value: typing.Any, name: str) -> str:
+        """
+        Store value in the globals of the generated module and return its name
+        """
+        for existing_name, existing_value in self.globals.items():
+            if existing_value is value:
+                return existing_name
+
+        name = f"{self.identifier(name)}_{next(self._counter)}"
+        self.globals[name] = value
+        return name
+
+    @staticmethod
+    def identifier(name: str) -> str:
+        return re.sub(r"\W", "_", name)
+
+    def function_name(self, fullname: str) -> str:
+        return f"{self.prefix}_{self.identifier(fullname)}_{next(self._counter)}"
+
+    def call(self, function_name: str) -> Emitter:
+        """
+        Return the emitter that calls the generated function of a record
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    def compile_record(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> Emitter:
+        fullname, namespace = self.register(avro_type, namespace)
+        function_name = self.function_name(fullname)
+        emit = self.call(function_name)
+
+        # registered before compiling the fields to support recursive records
+        self.record_functions[fullname] = function_name
+        self.compiled_named_types[fullname] = emit
+
+        writer = CodeWriter()
+        self.write_record(writer, avro_type, namespace)
+        self.functions.append(writer.function(function_name, self.arguments))
+
+        return emit
+
+    def write_record(
+        self,
+        writer: CodeWriter,
+        avro_type: typing.Dict,
+        namespace: typing.Optional[str],
+    ) -> None:
+        """
+        Write the body of the generated function of a record
+        """
+        raise NotImplementedError  # pragma: no cover
+
+    def generate(self, schema: typing.Dict) -> typing.Tuple[str, str]:
+        """
+        Generate the source of the functions of a record schema
+
+        Returns:
+            typing.Tuple[str, str]: the source and the name of the function
+                of the record
+        """
+        self.compile(schema)
+        fullname, _ = self.get_named_type(schema["name"], schema.get("namespace"))
+        source = "\n\n\n".join(self.functions) + "\n"
+
+        return source, self.record_functions[fullname]
+
+    def build(self, schema: typing.Dict, title: str) -> typing.Callable:
+        """
+        Generate the source of a record schema, compile it and return the
+        function of the record. The source is available in its __source__
+        attribute and it is registered in linecache, so the tracebacks of the
+        generated code show its lines.
+        """
+        source, function_name = self.generate(schema)
+        filename = f"<dataclasses_avroschema {self.prefix} {title}>"
+        code = compile(source, filename, "exec")
+        linecache.cache[filename] = (
+            len(source),
+            None,
+            source.splitlines(True),
+            filename,
+        )
+
+        namespace = dict(self.globals)
+        exec(code, namespace)
+
+        function = namespace[function_name]
+        function.__source__ = source
+        return function
@@ -0,0 +1,580 @@
+import array
+import concurrent.futures
+import os
+import typing
+
+from dataclasses_avroschema import binary, codegen, conversions, decoder, fields
+from dataclasses_avroschema.container import (
+    DEFAULT_BLOCK_RECORDS,
+    DEFAULT_SPLIT_SIZE,
+    ContainerReader,
+    ContainerWriter,
+    map_ranges,
+)
+from dataclasses_avroschema.schema_generator import SchemaGenerator
+
+# numpy is an optional dependency imported the first time that
+# it is needed, see get_numpy
+np: typing.Any = None
+
+
+def get_numpy() -> typing.Any:
+    """
+    Import numpy the first time it is needed.
+
+    Returns:
+        The numpy module
+    """
+    global np
+
+    if np is None:
+        np = conversions.find_numpy()
+
+        if np is None:  # pragma: no cover
+            raise ImportError(
+                "numpy is required for the columnar encoding, "
+                "install it with pip install dataclasses-avroschema[numpy]"
+            )
+
+    return np
+
+
+class ColumnType(typing.NamedTuple):
+    # typecode of the array.array used to collect the values
+    typecode: str
+    # dtype of the numpy array of the column
+    dtype: str
+    # True when the values are written as varints
+    varint: bool
+
+
+# types that can be a column keyed by (avro type, logical type). The logical
+# types are stored as the number of days, milliseconds or microseconds, which is the
+# representation of the numpy datetime64 and timedelta64 types
+COLUMN_TYPES: typing.Dict[typing.Tuple[str, typing.Optional[str]], ColumnType] = {
+    (fields.BOOLEAN, None): ColumnType("B", "bool", True),
+    (fields.INT, None): ColumnType("i", "int32", True),
+    (fields.LONG, None): ColumnType("q", "int64", True),
+    (fields.FLOAT, None): ColumnType("f", "float32", False),
+    (fields.DOUBLE, None): ColumnType("d", "float64", False),
+    (fields.INT, fields.DATE): ColumnType("q", "datetime64[D]", True),
+    (fields.INT, fields.TIME_MILLIS): ColumnType("q", "timedelta64[ms]", True),
+    (fields.LONG, fields.TIMESTAMP_MILLIS): ColumnType("q", "datetime64[ms]", True),
+    (fields.LONG, fields.TIME_MICROS): ColumnType("q", "timedelta64[us]", True),
+    (fields.LONG, fields.TIMESTAMP_MICROS): ColumnType("q", "datetime64[us]", True),
+}
+
+# conversions of the python values of the columns of logical types
+OBJECT_CONVERSIONS = {
+    "datetime64[D]": conversions.dates_to_days,
+    "timedelta64[ms]": conversions.times_to_millis,
+    "datetime64[ms]": conversions.datetimes_to_millis,
+    "timedelta64[us]": conversions.times_to_micros,
+    "datetime64[us]": conversions.datetimes_to_micros,
+}
+
+# maximum size of a varint
+MAX_VARINT_SIZE = 10
+
+# ranges of the integer columns, checked before encoding them like the
+# scalar encoder does, see binary.write_int and binary.write_long
+INTEGER_RANGES = {
+    fields.INT: (binary.INT_RANGE, "an int"),
+    fields.LONG: (binary.LONG_RANGE, "a long"),
+}
+
+
+class Column(typing.NamedTuple):
+    name: str
+    avro_type: str
+    column_type: ColumnType
+
+
+def get_columns(klass: typing.Any) -> typing.List[Column]:
+    """
+    Return the columns of the fields of a class
+
+    Raises:
+        ValueError: when a field can not be stored in a column
+    """
+    columns = []
+
+    for field in SchemaGenerator(klass).avro_schema_to_python()["fields"]:
+        avro_type = field["type"]
+
+        if isinstance(avro_type, str):
+            key = (avro_type, None)
+        elif isinstance(avro_type, dict):
+            key = (avro_type["type"], avro_type.get("logicalType"))
+        else:
+            key = None
+
+        if key not in COLUMN_TYPES:
+            raise ValueError(
+                f"The field {field['name']} of type {avro_type} can not be a column"
+            )
+
+        columns.append(Column(field["name"], key[0], COLUMN_TYPES[key]))
+
+    return columns
+
+
+def compile_columns_decoder(columns: typing.List[Column]) -> typing.Callable:
+    """
+    Generate the function that decodes records appending the value of
+    every field to its array.array.
+
+    The generated function receives the data, the position of the first
+    record, the maximum amount of records, the end of the data and the
+    append methods of the arrays, and returns the position after the
+    last record.
+    """
+    source_compiler = decoder.DecoderCompiler({})
+    writer = codegen.CodeWriter()
+    appends = [f"append{index}" for index in range(len(columns))]
+
+    writer.line("while count and position < end:")
+    with writer.indent():
+        writer.line("count -= 1")
+        for append, column in zip(appends, columns):
+            value = writer.variable()
+            decoder.PRIMITIVE_EMITTERS[column.avro_type](writer, value)
+            writer.line(f"{append}({value})")
+    writer.line("return position")
+
+    source = writer.function(
+        "decode_columns", ["data", "position", "count", "end"] + appends
+    )
+    namespace = dict(source_compiler.globals)
+    exec(compile(source, "<dataclasses_avroschema decode columns>", "exec"), namespace)
+
+    function = namespace["decode_columns"]
+    function.__source__ = source
+    return function
+
+
+class ColumnarDecoder:
+    """
+    Decode records written with the avro binary encoding to one numpy array
+    per field, without creating an instance per record.
+
+    The fields must be boolean, int, long, float, double, date, time-millis,
+    timestamp-millis, time-micros or timestamp-micros. Dates are decoded as
+    datetime64[D], timestamps as datetime64[ms] or datetime64[us] and times
+    as timedelta64[ms] or timedelta64[us].
+
+    When all the fields are written as varints (all of them except float and
+    double) the records are decoded with vectorized numpy operations.
+    Otherwise they are decoded by a generated function that collects the
+    values in arrays.
+
+    Arguments:
+        klass (typing.Any): dataclass, python class or faust.Record
+    """
+
+    def __init__(self, klass: typing.Any) -> None:
+        get_numpy()
+        self.klass = klass
+        self.columns = get_columns(klass)
+        self.vectorized = all(column.column_type.varint for column in self.columns)
+        self._decode_columns = compile_columns_decoder(self.columns)
+
+    def decode(
+        self, data: bytes, count: typing.Optional[int] = None, position: int = 0
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Decode the records encoded one after the other in data (the layout
+        of an Object Container File data block)
+
+        Arguments:
+            data (bytes): bytes, bytearray, memoryview or mmap
+            count (int): amount of records, if it is None data is read
+                until the end
+            position (int): position of the first record
+
+        Returns:
+            typing.Dict[str, numpy.ndarray]: the array of every field
+        """
+        if self.vectorized and self.columns:
+            return self.decode_varints(data, count, position)
+
+        arrays = [array.array(column.column_type.typecode) for column in self.columns]
+        if count is None:
+            # every record has at least one byte
+            count = len(data)
+
+        self._decode_columns(
+            data, position, count, len(data), *[values.append for values in arrays]
+        )
+
+        return {
+            column.name: self.to_numpy(values, column)
+            for column, values in zip(self.columns, arrays)
+        }
+
+    def decode_varints(
+        self, data: bytes, count: typing.Optional[int], position: int
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Decode records whose fields are varints.
+
+        The last byte of every varint is the only one without the highest bit,
+        so the varints are found without decoding the records one by one.
+        """
+        size = len(data) - position
+        fields_count = len(self.columns)
+        if count is not None:
+            size = min(size, count * fields_count * MAX_VARINT_SIZE)
+
+        buffer = np.frombuffer(data, dtype=np.uint8, count=size, offset=position)
+        ends = np.flatnonzero(buffer < 0x80)
+
+        if count is None:
+            if ends.size % fields_count:
+                raise ValueError("The data does not contain complete records")
+            count = ends.size // fields_count
+        elif ends.size < count * fields_count:
+            raise ValueError(f"The data does not contain {count} records")
+
+        ends = ends[: count * fields_count]
+        values = self.read_varints(buffer, ends)
+        signed = (values >> np.uint64(1)).astype(np.int64) ^ -(
+            values & np.uint64(1)
+        ).astype(np.int64)
+
+        result = {}
+        for index, column in enumerate(self.columns):
+            dtype = column.column_type.dtype
+
+            if column.avro_type == fields.BOOLEAN:
+                # booleans are one byte, 0 or 1, without zig-zag encoding
+                column_values = values[index::fields_count].astype(bool)
+            elif dtype == "int32":
+                column_values = signed[index::fields_count].astype(np.int32)
+            else:
+                column_values = np.ascontiguousarray(signed[index::fields_count])
+
+            result[column.name] = column_values.view(dtype)
+
+        return result
+
+    @staticmethod
+    def read_varints(buffer: typing.Any, ends: typing.Any) -> typing.Any:
+        """
+        Return the unsigned values of the varints that finish at ends
+        """
+        if not ends.size:
+            return np.zeros(0, dtype=np.uint64)
+
+        starts = np.empty_like(ends)
+        starts[0] = 0
+        starts[1:] = ends[:-1] + 1
+
+        used = buffer[: ends[-1] + 1]
+        lengths = ends - starts + 1
+        # position of every byte inside its varint
+        shifts = np.arange(used.size) - np.repeat(starts, lengths)
+        parts = (used & 0x7F).astype(np.uint64) << (7 * shifts).astype(np.uint64)
+
+        # the parts of a varint do not overlap, so adding them is the same as or
+        return np.add.reduceat(parts, starts)
+
+    @staticmethod
+    def to_numpy(values: array.array, column: Column) -> typing.Any:
+        dtype = column.column_type.dtype
+        if dtype == "bool":
+            return np.frombuffer(values, dtype=np.uint8).view(bool)
+        if dtype.startswith(("datetime64", "timedelta64")):
+            return np.frombuffer(values, dtype=np.int64).view(dtype)
+
+        return np.frombuffer(values, dtype=dtype)
+
+
+def to_int64(values: typing.Any, avro_type: str = fields.LONG) -> typing.Any:
+    """
+    Return the integers as an int64 array
+
+    Raises:
+        ValueError: when a value is out of the range of avro_type
+    """
+    array_values = np.asarray(values)
+
+    if array_values.dtype.kind == "u" or array_values.dtype == object:
+        # the values that do not fit in an int64 would wrap around or
+        # raise OverflowError
+        check_range(array_values, avro_type)
+
+    return array_values.astype(np.int64, copy=False)
+
+
+def is_integer_array(values: typing.Any) -> bool:
+    """
+    Return True for the arrays of integers, including the object arrays of
+    the python ints that do not fit in an int64
+    """
+    if values.dtype.kind in "iu":
+        return True
+
+    return (
+        values.dtype == object and values.size > 0 and isinstance(values.flat[0], int)
+    )
+
+
+def check_range(values: typing.Any, avro_type: str) -> None:
+    """
+    Raises:
+        ValueError: when a value is out of the range of avro_type
+    """
+    (low, high), name = INTEGER_RANGES[avro_type]
+
+    if values.size:
+        # compared as python ints, numpy may compare uint64 as floats
+        for value in (int(values.min()), int(values.max())):
+            if not low <= value <= high:
+                raise ValueError(f"{value} is out of the range of {name}")
+
+
+def encode_varints(values: typing.Any) -> typing.Tuple[typing.Any, typing.Any]:
+    """
+    Encode int64 values with zig-zag and variable-length encoding
+
+    Returns:
+        typing.Tuple: an uint8 matrix with a row per value and a boolean matrix
+            with the bytes of every row that belong to the varint
+    """
+    # the shift overflows for big values as the zig-zag encoding expects
+    zigzag = ((values << 1) ^ (values >> 63)).view(np.uint64)
+    limits = np.uint64(1) << (np.arange(1, MAX_VARINT_SIZE, dtype=np.uint64) * 7)
+    sizes = 1 + (zigzag[:, None] >= limits).sum(axis=1)
+
+    width = int(sizes.max()) if sizes.size else 1
+    positions = np.arange(width)
+    shifts = (positions * 7).astype(np.uint64)
+    # the highest bit is set in every byte of the varint except the last one
+    continuation = (positions < (sizes - 1)[:, None]).astype(np.uint64) << np.uint64(7)
+    matrix = (((zigzag[:, None] >> shifts) & np.uint64(0x7F)) | continuation).astype(
+        np.uint8
+    )
+
+    return matrix, positions < sizes[:, None]
+
+
+class ColumnarEncoder:
+    """
+    Encode records from one array or sequence per field, without creating
+    an instance per record. It is the inverse of ColumnarDecoder, with the
+    same field types.
+
+    The integers are encoded as varints and the floats are packed with
+    vectorized numpy operations.
+
+    Arguments:
+        klass (typing.Any): dataclass, python class or faust.Record
+    """
+
+    def __init__(self, klass: typing.Any) -> None:
+        get_numpy()
+        self.klass = klass
+        self.columns = get_columns(klass)
+
+    def encode(
+        self, columns: typing.Mapping[str, typing.Any]
+    ) -> typing.Tuple[bytes, int]:
+        """
+        Encode the records one after the other (the layout of an Object
+        Container File data block)
+
+        Arguments:
+            columns (typing.Mapping): numpy array or sequence of every field
+
+        Returns:
+            typing.Tuple[bytes, int]: the encoded records and the amount
+                of records
+        """
+        matrices = []
+        masks = []
+        count = None
+
+        for column in self.columns:
+            if column.name not in columns:
+                raise ValueError(f"The column {column.name} is missing")
+
+            matrix, mask = self.encode_column(column, columns[column.name])
+            if count is None:
+                count = len(matrix)
+            elif len(matrix) != count:
+                raise ValueError("All the columns must have the same length")
+
+            matrices.append(matrix)
+            masks.append(mask)
+
+        if not count:
+            return b"", 0
+
+        # the masks select the bytes of every row, column after column
+        data = np.hstack(matrices)[np.hstack(masks)]
+        return data.tobytes(), count
+
+    def encode_column(
+        self, column: Column, values: typing.Any
+    ) -> typing.Tuple[typing.Any, typing.Any]:
+        """
+        Returns:
+            typing.Tuple: an uint8 matrix with the encoded values as rows and
+                a boolean matrix with the bytes of every row that are used
+        """
+        dtype = column.column_type.dtype
+
+        if column.column_type.varint:
+            if column.avro_type == fields.BOOLEAN:
+                matrix = np.asarray(values, dtype=bool).astype(np.uint8)[:, None]
+            else:
+                integers = self.to_integers(values, dtype, column.avro_type)
+                check_range(integers, column.avro_type)
+                return encode_varints(integers)
+        else:
+            matrix = (
+                np.asarray(values, dtype=np.dtype(dtype).newbyteorder("<"))
+                .reshape(-1, 1)
+                .view(np.uint8)
+            )
+
+        return matrix, np.ones(matrix.shape, dtype=bool)
+
+    @staticmethod
+    def to_integers(
+        values: typing.Any, dtype: str, avro_type: str = fields.LONG
+    ) -> typing.Any:
+        """
+        Return the values as int64, converting the dates, times and datetimes
+        to days, milliseconds or microseconds
+
+        Raises:
+            ValueError: when a value is out of the range of avro_type
+        """
+        if not dtype.startswith(("datetime64", "timedelta64")):
+            return to_int64(values, avro_type)
+
+        array_values = np.asarray(values)
+        if is_integer_array(array_values):
+            # already days, milliseconds or microseconds
+            return to_int64(array_values, avro_type)
+
+        if array_values.dtype == object:
+            # datetime.date, datetime.time or datetime.datetime instances, which
+            # are converted faster with integer arithmetic than by numpy
+            return to_int64(OBJECT_CONVERSIONS[dtype](values))
+
+        return array_values.astype(dtype).view(np.int64)
+
+
+def write_columns(
+    fo: typing.BinaryIO,
+    klass: typing.Any,
+    columns: typing.Mapping[str, typing.Any],
+    block_records: int = DEFAULT_BLOCK_RECORDS,
+    **options: typing.Any,
+) -> None:
+    """
+    Write the records of the columns to an avro Object Container File,
+    block_records records per block
+
+    Arguments:
+        fo (typing.BinaryIO): file opened in binary mode
+        klass (typing.Any): dataclass, python class or faust.Record
+        columns (typing.Mapping): numpy array or sequence of every field
+        block_records (int): amount of records of every block
+        options: see ContainerWriter
+    """
+    columnar_encoder = ColumnarEncoder(klass)
+    sizes = {len(values) for values in columns.values()}
+    if len(sizes) > 1:
+        raise ValueError("All the columns must have the same length")
+
+    arrays = {name: np.asarray(values) for name, values in columns.items()}
+
+    with ContainerWriter(fo, klass, block_records=block_records, **options) as writer:
+        for start in range(0, sizes.pop() if sizes else 0, block_records):
+            end = start + block_records
+            block = {name: values[start:end] for name, values in arrays.items()}
+            writer.write_encoded(*columnar_encoder.encode(block))
+
+
+def concatenate_columns(
+    columns: typing.List[Column], blocks: typing.List[typing.Dict[str, typing.Any]]
+) -> typing.Dict[str, typing.Any]:
+    """
+    Concatenate the arrays of the columns of several blocks
+    """
+    return {
+        column.name: np.concatenate(
+            [block[column.name] for block in blocks]
+            or [np.zeros(0, dtype=column.column_type.dtype)]
+        )
+        for column in columns
+    }
+
+
+def read_columns(
+    source: typing.Union[str, os.PathLike, typing.BinaryIO, bytes],
+    klass: typing.Any,
+    start: typing.Optional[int] = None,
+    end: typing.Optional[int] = None,
+) -> typing.Dict[str, typing.Any]:
+    """
+    Read an avro Object Container File to one numpy array per field.
+    The schema of the file must be the schema of the class.
+
+    Arguments:
+        source (str, os.PathLike, typing.BinaryIO or bytes): path of the file,
+            file opened in binary mode or the content of the file
+        klass (typing.Any): dataclass, python class or faust.Record
+        start (int): position of the first block to read, see
+            ContainerReader.split
+        end (int): position after the last block to read
+
+    Returns:
+        typing.Dict[str, numpy.ndarray]: the array of every field
+    """
+    columnar_decoder = ColumnarDecoder(klass)
+    blocks = []
+
+    with ContainerReader(source, klass) as reader:
+        reader.check_schema()
+        for count, data, position in reader.read_blocks(start, end):
+            blocks.append(columnar_decoder.decode(data, count, position))
+
+    return concatenate_columns(columnar_decoder.columns, blocks)
+
+
+def read_columns_parallel(
+    path: typing.Union[str, os.PathLike],
+    klass: typing.Any,
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional[concurrent.futures.Executor] = None,
+    split_size: int = DEFAULT_SPLIT_SIZE,
+) -> typing.Dict[str, typing.Any]:
+    """
+    Read an avro Object Container File to one numpy array per field with
+    several processes, see read_container_parallel
+
+    Arguments:
+        path (str, os.PathLike): path of the file
+        klass (typing.Any): dataclass, python class or faust.Record
+        workers, executor, split_size: see map_ranges
+
+    Returns:
+        typing.Dict[str, numpy.ndarray]: the array of every field
+    """
+    get_numpy()
+    blocks = list(
+        map_ranges(
+            path,
+            klass,
+            read_columns,
+            workers=workers,
+            executor=executor,
+            split_size=split_size,
+        )
+    )
+    return concatenate_columns(get_columns(klass), blocks)
@@ -0,0 +1,240 @@
+import json
+import os
+import threading
+import typing
+
+from dataclasses_avroschema import codegen, fingerprints
+from dataclasses_avroschema.resolution import ResolvingCompiler, SchemaResolutionError
+from dataclasses_avroschema.schema_generator import SchemaGenerator
+
+# the new schema can read the data written with the old one
+BACKWARD = "BACKWARD"
+# the old schema can read the data written with the new one
+FORWARD = "FORWARD"
+# both of them
+FULL = "FULL"
+
+COMPATIBILITY_TYPES = (BACKWARD, FORWARD, FULL)
+
+# verdicts of check_resolution keyed by the fingerprints of the writer
+# and the reader schemas, None when the writer can be read by the reader
+_verdicts: typing.Dict[typing.Tuple[str, str], typing.Optional[str]] = {}
+_verdicts_lock = threading.Lock()
+
+Schema = typing.Union[str, typing.Dict, os.PathLike, typing.Any]
+
+# first characters of the json of a schema: a record, an union or a name
+JSON_STARTS = ("{", "[", '"')
+
+
+class CompatibilityResult(typing.NamedTuple):
+    compatibility: str
+    # the first incompatibility of every direction that is checked, starting
+    # with the direction and the path of the field
+    errors: typing.Tuple[str, ...]
+
+    @property
+    def compatible(self) -> bool:
+        return not self.errors
+
+
+class CompatibilityChecker(ResolvingCompiler):
+    """
+    Check that the data written with a writer schema can be read with a
+    reader schema, with the resolution rules of ResolvingCompiler, without
+    python classes for the records.
+
+    The checks are stricter than the decoder: every type of the writer
+    unions and every symbol of the writer enums must be readable, while the
+    decoder only fails when those values are found in the data.
+    """
+
+    def __init__(self, writer_schema: typing.Dict) -> None:
+        super().__init__({}, writer_schema)
+
+    def get_record_class(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> typing.Any:
+        return dict
+
+    def write_instance(
+        self,
+        writer: codegen.CodeWriter,
+        klass: typing.Any,
+        attributes: typing.List[typing.Tuple[str, str]],
+    ) -> None:
+        # the source is never compiled, only the resolution matters
+        writer.line("return None, position")
+
+    def resolve_writer_union(
+        self,
+        writer_union: typing.List,
+        reader_type: typing.Any,
+        namespace: typing.Optional[str],
+    ) -> codegen.Emitter:
+        for writer_type in writer_union:
+            if isinstance(reader_type, list):
+                branch = self.select_branch(writer_type, reader_type, namespace)
+                readable = branch is not None
+            else:
+                readable = self.matches(writer_type, reader_type, namespace, True)
+
+            if not readable:
+                raise self.error(
+                    f"{self.describe(writer_type)} of {self.describe(writer_union)}"
+                    f" can not be read as {self.describe(reader_type)}"
+                )
+
+        return super().resolve_writer_union(writer_union, reader_type, namespace)
+
+    def resolve_enum(
+        self,
+        writer_type: typing.Dict,
+        reader_type: typing.Dict,
+        namespace: typing.Optional[str],
+    ) -> codegen.Emitter:
+        if reader_type.get("default") is None:
+            for symbol in writer_type["symbols"]:
+                if symbol not in reader_type["symbols"]:
+                    raise self.error(
+                        f"the symbol {symbol} is not in the enum "
+                        f"{reader_type['name']}, which has no default"
+                    )
+
+        return super().resolve_enum(writer_type, reader_type, namespace)
+
+    def check(self, reader_schema: typing.Dict) -> None:
+        """
+        Raises:
+            SchemaResolutionError: the first incompatibility, its message
+                starts with the path of the field
+        """
+        self.generate(reader_schema)
+
+
+def load_schema(schema: Schema) -> typing.Dict:
+    """
+    Return the python representation of a schema, which can be a python
+    dict, a json string, the path of an .avsc file or a class.
+
+    The strings that start like a json schema, with {, [ or ", are json,
+    the others are paths.
+    """
+    if isinstance(schema, dict):
+        return schema
+    elif isinstance(schema, str) and schema.lstrip().startswith(JSON_STARTS):
+        return json.loads(schema)
+    elif isinstance(schema, (str, os.PathLike)):
+        with open(schema) as schema_file:
+            return json.load(schema_file)
+
+    return SchemaGenerator(schema).avro_schema_to_python()
+
+
+class SchemaVersion(typing.NamedTuple):
+    schema: typing.Dict
+    # MD5 of the resolution form, the identity of the schema as writer: the
+    # Parsing Canonical Form with the logical types, see
+    # fingerprints.resolution_form
+    writer_fingerprint: str
+    # MD5 of the whole schema: the defaults, the aliases and the enum defaults
+    # change how the data is read but they are not in the canonical form
+    reader_fingerprint: str
+
+
+def get_schema_version(schema: Schema) -> SchemaVersion:
+    """
+    Load a schema and compute the fingerprints that key its verdicts.
+    MD5 is used because it is computed in C, unlike CRC-64-AVRO.
+    """
+    schema = load_schema(schema)
+
+    return SchemaVersion(
+        schema,
+        fingerprints.fingerprint(
+            fingerprints.resolution_form(schema), fingerprints.MD5
+        ),
+        fingerprints.fingerprint(json.dumps(schema, sort_keys=True), fingerprints.MD5),
+    )
+
+
+def _check_resolution(
+    writer: SchemaVersion, reader: SchemaVersion
+) -> typing.Optional[str]:
+    key = (writer.writer_fingerprint, reader.reader_fingerprint)
+
+    if key in _verdicts:
+        return _verdicts[key]
+
+    with _verdicts_lock:
+        if key not in _verdicts:
+            try:
+                CompatibilityChecker(writer.schema).check(reader.schema)
+            except SchemaResolutionError as error:
+                _verdicts[key] = str(error)
+            else:
+                _verdicts[key] = None
+
+        return _verdicts[key]
+
+
+def check_resolution(
+    writer_schema: Schema, reader_schema: Schema
+) -> typing.Optional[str]:
+    """
+    Check if the data written with writer_schema can be read with
+    reader_schema. The verdict is computed once per pair of fingerprints.
+
+    Arguments:
+        writer_schema: dict, json string, path of an .avsc file or class
+        reader_schema: dict, json string, path of an .avsc file or class
+
+    Returns:
+        None when the schemas are compatible, otherwise the first
+            incompatibility, which starts with the path of the field
+    """
+    return _check_resolution(
+        get_schema_version(writer_schema), get_schema_version(reader_schema)
+    )
+
+
+def check_compatibility(
+    new_schema: Schema, old_schema: Schema, compatibility: str = BACKWARD
+) -> CompatibilityResult:
+    """
+    Check the compatibility of a new version of a schema with an old one,
+    for example a dataclass with the .avsc file of its previous version:
+
+    - BACKWARD: the new schema can read the data written with the old one
+    - FORWARD: the old schema can read the data written with the new one
+    - FULL: both
+
+    Arguments:
+        new_schema: dict, json string, path of an .avsc file or class
+        old_schema: dict, json string, path of an .avsc file or class
+        compatibility (str): BACKWARD, FORWARD or FULL
+
+    Returns:
+        CompatibilityResult: with the first incompatibility of every direction
+    """
+    if compatibility not in COMPATIBILITY_TYPES:
+        raise ValueError(
+            f"Invalid compatibility {compatibility}, "
+            f"the valid ones are {COMPATIBILITY_TYPES}"
+        )
+
+    new_version = get_schema_version(new_schema)
+    old_version = get_schema_version(old_schema)
+    errors = []
+
+    if compatibility in (BACKWARD, FULL):
+        error = _check_resolution(old_version, new_version)
+        if error is not None:
+            errors.append(f"{BACKWARD}: {error}")
+
+    if compatibility in (FORWARD, FULL):
+        error = _check_resolution(new_version, old_version)
+        if error is not None:
+            errors.append(f"{FORWARD}: {error}")
+
+    return CompatibilityResult(compatibility, tuple(errors))
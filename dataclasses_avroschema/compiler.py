@@ -0,0 +1,202 @@
+import abc
+import typing
+
+from dataclasses_avroschema import conversions, fields, named_types
+
+PRIMITIVE_TYPES = (
+    fields.NULL,
+    fields.BOOLEAN,
+    fields.INT,
+    fields.LONG,
+    fields.FLOAT,
+    fields.DOUBLE,
+    fields.BYTES,
+    fields.STRING,
+)
+
+# field classes that convert the python values of every logical type
+LOGICAL_TYPES_FIELDS_CLASSES = {
+    fields.DATE: fields.DateField,
+    fields.TIME_MILLIS: fields.TimeField,
+    fields.TIMESTAMP_MILLIS: fields.DatetimeField,
+    fields.TIME_MICROS: fields.TimeMicrosField,
+    fields.TIMESTAMP_MICROS: fields.DatetimeMicrosField,
+    fields.LOCAL_TIMESTAMP_MILLIS: fields.LocalDatetimeField,
+    fields.LOCAL_TIMESTAMP_MICROS: fields.LocalDatetimeMicrosField,
+    fields.DECIMAL: fields.DecimalField,
+    fields.UUID: fields.UUIDField,
+}
+
+
+def get_logical_conversions(
+    avro_type: typing.Dict,
+) -> typing.Tuple[typing.Callable, typing.Callable]:
+    """
+    Return the to_logical_type and from_logical_type functions of a logical
+    type. The conversions of the decimals depend on their precision, scale
+    and size, see conversions.decimal_converter.
+    """
+    logical_type = avro_type["logicalType"]
+
+    if logical_type == fields.DECIMAL:
+        size = avro_type.get("size") if avro_type["type"] == fields.FIXED else None
+        converter = conversions.decimal_converter(
+            int(avro_type["precision"]),
+            int(avro_type.get("scale", 0)),
+            None if size is None else int(size),
+        )
+        return converter.to_logical_type, converter.from_logical_type
+
+    field_class = LOGICAL_TYPES_FIELDS_CLASSES[logical_type]
+    return field_class.to_logical_type, field_class.from_logical_type
+
+
+def get_underlying_type(avro_type: typing.Dict) -> typing.Any:
+    """
+    Return the type annotated by a logical type. A decimal can annotate
+    a fixed, which is defined in the same schema as the logical type.
+    """
+    if avro_type["type"] == fields.FIXED:
+        return {key: value for key, value in avro_type.items() if key != "logicalType"}
+    return avro_type["type"]
+
+
+class SchemaCompiler(abc.ABC):
+    """
+    Walk an avro schema translating every type to a specialized function.
+
+    Named types are registered when they are defined, so the next
+    references to them reuse the compiled function. Records are registered
+    before their fields are compiled to support recursive records.
+
+    Arguments:
+        record_classes (typing.Dict): python classes of the records keyed
+            by name, see SchemaGenerator.get_record_classes
+    """
+
+    def __init__(self, record_classes: typing.Dict[str, typing.Any]) -> None:
+        self.record_classes = record_classes
+        self.named_types: typing.Dict[str, typing.Dict] = {}
+        self.compiled_named_types: typing.Dict[str, typing.Any] = {}
+
+    def compile(
+        self, avro_type: typing.Any, namespace: typing.Optional[str] = None
+    ) -> typing.Any:
+        if isinstance(avro_type, str):
+            if avro_type in PRIMITIVE_TYPES:
+                return self.compile_primitive(avro_type)
+
+            fullname, _ = self.get_named_type(avro_type, namespace)
+            return self.compiled_named_types[fullname]
+
+        if isinstance(avro_type, list):
+            return self.compile_union(avro_type, namespace)
+
+        type_name = avro_type["type"]
+
+        if avro_type.get("logicalType") in LOGICAL_TYPES_FIELDS_CLASSES:
+            compiled = self.compile_logical_type(avro_type, namespace)
+
+            if type_name == fields.FIXED:
+                # the references to a decimal fixed are decimals too
+                fullname = named_types.get_fullname(
+                    avro_type["name"], avro_type.get("namespace", namespace)
+                )
+                self.compiled_named_types[fullname] = compiled
+            return compiled
+        elif type_name == fields.RECORD:
+            return self.compile_record(avro_type, namespace)
+        elif type_name == fields.ENUM:
+            return self.compile_enum(avro_type, namespace)
+        elif type_name == fields.FIXED:
+            return self.compile_fixed(avro_type, namespace)
+        elif type_name == fields.ARRAY:
+            return self.compile_array(avro_type, namespace)
+        elif type_name == fields.MAP:
+            return self.compile_map(avro_type, namespace)
+
+        # primitive type in its complex form, for example {"type": "string"}
+        return self.compile(type_name, namespace)
+
+    def register(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> typing.Tuple[str, typing.Optional[str]]:
+        """
+        Register the definition of a named type.
+
+        Returns:
+            typing.Tuple: the full name of the type and the namespace
+                for the types defined inside it
+        """
+        fullname = named_types.get_fullname(
+            avro_type["name"], avro_type.get("namespace", namespace)
+        )
+        self.named_types[fullname] = avro_type
+
+        return fullname, fullname.rpartition(".")[0] or None
+
+    def get_named_type(
+        self, name: str, namespace: typing.Optional[str]
+    ) -> typing.Tuple[str, typing.Dict]:
+        for fullname in (named_types.get_fullname(name, namespace), name):
+            if fullname in self.named_types:
+                return fullname, self.named_types[fullname]
+
+        raise ValueError(f"Unknown avro type {name}")
+
+    def resolve(self, avro_type: typing.Any, namespace: typing.Optional[str]):
+        """
+        Return the definition of avro_type when it is a reference to a named type
+        """
+        if isinstance(avro_type, str) and avro_type not in PRIMITIVE_TYPES:
+            _, avro_type = self.get_named_type(avro_type, namespace)
+        return avro_type
+
+    def get_record_class(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> typing.Any:
+        name = avro_type["name"]
+        fullname = named_types.get_fullname(name, avro_type.get("namespace", namespace))
+        klass = self.record_classes.get(fullname) or self.record_classes.get(name)
+
+        if klass is None:
+            raise ValueError(f"There is not a python class for the record {name}")
+        return klass
+
+    @abc.abstractmethod
+    def compile_primitive(self, avro_type: str) -> typing.Any: ...  # pragma: no cover
+
+    @abc.abstractmethod
+    def compile_union(
+        self, avro_type: typing.List, namespace: typing.Optional[str]
+    ) -> typing.Any: ...  # pragma: no cover
+
+    @abc.abstractmethod
+    def compile_logical_type(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> typing.Any: ...  # pragma: no cover
+
+    @abc.abstractmethod
+    def compile_record(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> typing.Any: ...  # pragma: no cover
+
+    @abc.abstractmethod
+    def compile_enum(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> typing.Any: ...  # pragma: no cover
+
+    @abc.abstractmethod
+    def compile_fixed(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> typing.Any: ...  # pragma: no cover
+
+    @abc.abstractmethod
+    def compile_array(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> typing.Any: ...  # pragma: no cover
+
+    @abc.abstractmethod
+    def compile_map(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> typing.Any: ...  # pragma: no cover
@@ -0,0 +1,355 @@
+import abc
+import json
+import os
+import struct
+import threading
+import typing
+import urllib.error
+import urllib.parse
+import urllib.request
+import weakref
+
+from dataclasses_avroschema import named_types
+from dataclasses_avroschema.decoder import DecodeFunction
+from dataclasses_avroschema.encoder import BinaryEncoder
+from dataclasses_avroschema.resolution import compile_resolving_decoder
+from dataclasses_avroschema.schema_generator import SchemaGenerator
+
+MAGIC_BYTE = 0
+# magic byte followed by the schema id as a big-endian unsigned int
+HEADER_STRUCT = struct.Struct(">bI")
+HEADER_SIZE = HEADER_STRUCT.size
+
+CONTENT_TYPE = "application/vnd.schemaregistry.v1+json"
+
+
+class SchemaRegistryError(ValueError):
+    """
+    A schema could not be registered or found in the schema registry
+    """
+
+
+def frame(schema_id: int, payload: bytes) -> bytes:
+    """
+    Prefix an avro encoded payload with the magic byte and the schema id
+    """
+    return HEADER_STRUCT.pack(MAGIC_BYTE, schema_id) + payload
+
+
+def unframe(data: bytes) -> typing.Tuple[int, memoryview]:
+    """
+    Returns:
+        typing.Tuple[int, memoryview]: the schema id and the avro encoded payload
+    """
+    if len(data) < HEADER_SIZE:
+        raise ValueError("The message is too short to have the wire format header")
+
+    magic_byte, schema_id = HEADER_STRUCT.unpack_from(data)
+    if magic_byte != MAGIC_BYTE:
+        raise ValueError(f"Invalid magic byte {magic_byte}")
+
+    return schema_id, memoryview(data)[HEADER_SIZE:]
+
+
+def get_subject(klass: typing.Any) -> str:
+    """
+    Return the default subject of a class: the full name of its record
+    """
+    schema = SchemaGenerator(klass).avro_schema_to_python()
+    return named_types.get_fullname(schema["name"], schema.get("namespace"))
+
+
+class SchemaRegistry(abc.ABC):
+    """
+    Store of schemas that assigns an id to every schema
+    """
+
+    @abc.abstractmethod
+    def register(self, subject: str, schema: str) -> int:
+        """
+        Register the schema under the subject, if it is not registered yet
+
+        Returns:
+            int: the id of the schema
+        """
+
+    @abc.abstractmethod
+    def get_schema(self, schema_id: int) -> str:
+        """
+        Return the schema with the id schema_id
+
+        Raises:
+            SchemaRegistryError: when there is not a schema with the id
+        """
+
+
+class InMemoryRegistry(SchemaRegistry):
+    """
+    Schema registry stored in memory, useful for testing.
+
+    Schemas with the same text have the same id. The Parsing Canonical
+    Form is not used because it does not have the logical types.
+    """
+
+    def __init__(self) -> None:
+        self.schemas: typing.Dict[int, str] = {}
+        self.subjects: typing.Dict[str, typing.List[int]] = {}
+        self._ids: typing.Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def register(self, subject: str, schema: str) -> int:
+        with self._lock:
+            schema_id = self._ids.get(schema)
+            if schema_id is None:
+                schema_id = len(self.schemas) + 1
+                self._ids[schema] = schema_id
+                self.schemas[schema_id] = schema
+
+            versions = self.subjects.setdefault(subject, [])
+            if schema_id not in versions:
+                versions.append(schema_id)
+                self.changed()
+
+        return schema_id
+
+    def get_schema(self, schema_id: int) -> str:
+        try:
+            return self.schemas[schema_id]
+        except KeyError:
+            raise SchemaRegistryError(f"Schema {schema_id} not found")
+
+    def changed(self) -> None:
+        """
+        Called when a schema or a subject version is registered
+        """
+
+
+class FileRegistry(InMemoryRegistry):
+    """
+    Schema registry stored in a json file, useful for testing and for
+    sharing the schemas between processes without a registry server.
+
+    Arguments:
+        path (str, os.PathLike): path of the json file, created if
+            it does not exist
+    """
+
+    def __init__(self, path: typing.Union[str, os.PathLike]) -> None:
+        super().__init__()
+        self.path = path
+
+        if os.path.exists(path):
+            with open(path) as fo:
+                content = json.load(fo)
+
+            for schema_id, schema in content["schemas"].items():
+                self.schemas[int(schema_id)] = schema
+                self._ids[schema] = int(schema_id)
+            self.subjects = content["subjects"]
+
+    def changed(self) -> None:
+        content = {"schemas": self.schemas, "subjects": self.subjects}
+        temporary_path = f"{self.path}.tmp"
+
+        with open(temporary_path, "w") as fo:
+            json.dump(content, fo)
+        os.replace(temporary_path, self.path)
+
+
+class HttpRegistry(SchemaRegistry):
+    """
+    Client of a Confluent Schema Registry server.
+
+    Arguments:
+        url (str): url of the server, for example http://localhost:8081
+        timeout (float): timeout of the requests in seconds
+    """
+
+    def __init__(self, url: str, timeout: float = 10.0) -> None:
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def request(
+        self, method: str, path: str, body: typing.Optional[typing.Dict] = None
+    ) -> typing.Dict:
+        data = None if body is None else json.dumps(body).encode("utf-8")
+        request = urllib.request.Request(
+            f"{self.url}{path}",
+            data=data,
+            method=method,
+            headers={"Content-Type": CONTENT_TYPE, "Accept": CONTENT_TYPE},
+        )
+
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as error:
+            raise SchemaRegistryError(
+                f"{method} {path} failed with status {error.code}: {error.read()!r}"
+            )
+        except urllib.error.URLError as error:
+            raise SchemaRegistryError(f"{method} {path} failed: {error.reason}")
+
+    def register(self, subject: str, schema: str) -> int:
+        path = f"/subjects/{urllib.parse.quote(subject, safe='')}/versions"
+        return self.request("POST", path, {"schema": schema})["id"]
+
+    def get_schema(self, schema_id: int) -> str:
+        return self.request("GET", f"/schemas/ids/{schema_id}")["schema"]
+
+
+class SchemaIdCache:
+    """
+    Ids of the registered schemas of a registry keyed by subject and schema
+    fingerprint. The ids are assigned by the registry, so a cache must be
+    used with only one registry.
+
+    When a path is given, the ids are stored in a json file as well, so
+    a process that restarts does not register its schemas again.
+
+    Arguments:
+        path (str, os.PathLike): path of the json file
+    """
+
+    def __init__(
+        self, path: typing.Optional[typing.Union[str, os.PathLike]] = None
+    ) -> None:
+        self.path = path
+        self._ids: typing.Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        if path is not None and os.path.exists(path):
+            with open(path) as fo:
+                self._ids = json.load(fo)
+
+    @staticmethod
+    def make_key(subject: str, fingerprint: str) -> str:
+        return f"{subject}:{fingerprint}"
+
+    def get(self, subject: str, fingerprint: str) -> typing.Optional[int]:
+        return self._ids.get(self.make_key(subject, fingerprint))
+
+    def set(self, subject: str, fingerprint: str, schema_id: int) -> None:
+        with self._lock:
+            self._ids[self.make_key(subject, fingerprint)] = schema_id
+
+            if self.path is not None:
+                temporary_path = f"{self.path}.tmp"
+                with open(temporary_path, "w") as fo:
+                    json.dump(self._ids, fo)
+                os.replace(temporary_path, self.path)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+# ids cached by the serializers that do not have their own cache, one cache
+# per registry
+_id_caches: "weakref.WeakKeyDictionary[SchemaRegistry, SchemaIdCache]" = (
+    weakref.WeakKeyDictionary()
+)
+_id_caches_lock = threading.Lock()
+
+
+def get_id_cache(registry: SchemaRegistry) -> SchemaIdCache:
+    """
+    Return the cache of the schema ids of a registry, shared by the
+    serializers that do not have their own cache
+    """
+    with _id_caches_lock:
+        id_cache = _id_caches.get(registry)
+        if id_cache is None:
+            id_cache = _id_caches[registry] = SchemaIdCache()
+        return id_cache
+
+
+class ConfluentSerializer:
+    """
+    Encode instances of a class with the Confluent wire format: the magic
+    byte, the schema id as a 4 bytes big-endian integer and the avro
+    binary encoding of the instance.
+
+    The schema is registered the first time that an instance is serialized.
+    Its id is cached by subject and fingerprint of the schema in the cache of
+    the registry, so the registry is not called again for the class.
+
+    Arguments:
+        klass (typing.Any): dataclass, python class or faust.Record
+        registry (SchemaRegistry): registry of the schemas
+        subject (str): subject of the schema, the full name of the record
+            by default
+        id_cache (SchemaIdCache): cache of the schema ids of the registry,
+            shared by all the serializers of the registry by default
+    """
+
+    def __init__(
+        self,
+        klass: typing.Any,
+        registry: SchemaRegistry,
+        subject: typing.Optional[str] = None,
+        id_cache: typing.Optional[SchemaIdCache] = None,
+    ) -> None:
+        self.klass = klass
+        self.registry = registry
+        self.subject = subject or get_subject(klass)
+        self.id_cache = get_id_cache(registry) if id_cache is None else id_cache
+        self.encoder = BinaryEncoder(klass)
+        self._schema_id: typing.Optional[int] = None
+
+    @property
+    def schema_id(self) -> int:
+        if self._schema_id is None:
+            schema_generator = SchemaGenerator(self.klass)
+            # the Parsing Canonical Form does not have the logical types, the
+            # schemas that only differ in them do not have the same id
+            fingerprint = schema_generator.resolution_fingerprint()
+            schema_id = self.id_cache.get(self.subject, fingerprint)
+
+            if schema_id is None:
+                schema_id = self.registry.register(
+                    self.subject, schema_generator.avro_schema()
+                )
+                self.id_cache.set(self.subject, fingerprint, schema_id)
+
+            self._schema_id = schema_id
+
+        return self._schema_id
+
+    def serialize(self, instance: typing.Any) -> bytes:
+        return frame(self.schema_id, self.encoder.encode(instance))
+
+
+class ConfluentDeserializer:
+    """
+    Decode messages with the Confluent wire format to instances of a class.
+
+    The schemas of the ids are fetched from the registry once. The messages
+    written with other versions of the schema of the class are resolved to
+    the class, see compile_resolving_decoder.
+
+    Arguments:
+        klass (typing.Any): dataclass, python class or faust.Record
+        registry (SchemaRegistry): registry of the schemas
+    """
+
+    def __init__(self, klass: typing.Any, registry: SchemaRegistry) -> None:
+        self.klass = klass
+        self.registry = registry
+        self._decoders: typing.Dict[int, DecodeFunction] = {}
+
+    def get_decoder(self, schema_id: int) -> DecodeFunction:
+        """
+        Return the function that decodes the messages of a schema id
+        """
+        decode = self._decoders.get(schema_id)
+
+        if decode is None:
+            writer_schema = self.registry.get_schema(schema_id)
+            decode = compile_resolving_decoder(writer_schema, self.klass)
+            self._decoders[schema_id] = decode
+
+        return decode
+
+    def deserialize(self, data: bytes) -> typing.Any:
+        schema_id, payload = unframe(data)
+        return self.get_decoder(schema_id)(payload, 0)[0]
@@ -0,0 +1,676 @@
+import collections
+import concurrent.futures
+import importlib
+import io
+import itertools
+import json
+import mmap
+import os
+import struct
+import typing
+import zlib
+
+from dataclasses_avroschema import binary, fingerprints
+from dataclasses_avroschema.encoder import compile_encoder
+from dataclasses_avroschema.resolution import compile_resolving_decoder
+from dataclasses_avroschema.schema_generator import SchemaGenerator
+
+MAGIC = b"Obj\x01"
+SYNC_SIZE = 16
+
+SCHEMA_KEY = "avro.schema"
+CODEC_KEY = "avro.codec"
+
+NULL_CODEC = "null"
+DEFLATE_CODEC = "deflate"
+SNAPPY_CODEC = "snappy"
+ZSTANDARD_CODEC = "zstandard"
+
+# modules of the optional codecs, imported the first time that they are used
+OPTIONAL_CODECS = {SNAPPY_CODEC: "snappy", ZSTANDARD_CODEC: "zstandard"}
+_codec_modules: typing.Dict[str, typing.Any] = {}
+
+# the snappy blocks are followed by the CRC32 of the uncompressed data
+SNAPPY_CHECKSUM = struct.Struct(">I")
+
+# a block is written when it has this amount of records or bytes
+DEFAULT_BLOCK_RECORDS = 10000
+DEFAULT_BLOCK_SIZE = 64 * 1024
+
+# approximate size of the ranges of blocks read in parallel
+DEFAULT_SPLIT_SIZE = 16 * 1024 * 1024
+
+
+def _deflate(data: bytes) -> bytes:
+    # raw deflate data, without the zlib header and checksum
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _inflate(data: bytes) -> bytes:
+    return zlib.decompress(data, -15)
+
+
+def get_codec_module(codec: str) -> typing.Any:
+    """
+    Import the module of an optional codec the first time it is needed.
+
+    Returns:
+        The module of the codec
+    """
+    module = _codec_modules.get(codec)
+
+    if module is None:
+        module_name = OPTIONAL_CODECS[codec]
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            raise ImportError(
+                f"{module_name} is required for the {codec} codec, "
+                f"install it with pip install dataclasses-avroschema[{codec}]"
+            )
+        _codec_modules[codec] = module
+
+    return module
+
+
+def _snappy_compress(data: bytes) -> bytes:
+    snappy = get_codec_module(SNAPPY_CODEC)
+    return snappy.compress(bytes(data)) + SNAPPY_CHECKSUM.pack(zlib.crc32(data))
+
+
+def _snappy_decompress(data: bytes) -> bytes:
+    snappy = get_codec_module(SNAPPY_CODEC)
+    checksum_position = len(data) - SNAPPY_CHECKSUM.size
+    content = snappy.decompress(bytes(data[:checksum_position]))
+
+    if SNAPPY_CHECKSUM.unpack_from(data, checksum_position)[0] != zlib.crc32(content):
+        raise ValueError("Invalid checksum of a snappy block")
+    return content
+
+
+def _zstandard_compress(data: bytes) -> bytes:
+    return get_codec_module(ZSTANDARD_CODEC).ZstdCompressor().compress(data)
+
+
+def _zstandard_decompress(data: bytes) -> bytes:
+    zstandard = get_codec_module(ZSTANDARD_CODEC)
+    # the frames written by other libraries may not have the content size
+    return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+
+COMPRESSORS: typing.Dict[str, typing.Callable[[bytes], bytes]] = {
+    NULL_CODEC: bytes,
+    DEFLATE_CODEC: _deflate,
+    SNAPPY_CODEC: _snappy_compress,
+    ZSTANDARD_CODEC: _zstandard_compress,
+}
+
+# null is not included because the blocks are decoded from the file directly
+DECOMPRESSORS: typing.Dict[str, typing.Callable[[bytes], bytes]] = {
+    DEFLATE_CODEC: _inflate,
+    SNAPPY_CODEC: _snappy_decompress,
+    ZSTANDARD_CODEC: _zstandard_decompress,
+}
+
+
+class ContainerWriter:
+    """
+    Write instances of a class to an avro Object Container File.
+
+    The instances are encoded to an in memory block which is written,
+    compressed with the codec, when it has block_records records or
+    block_size bytes, so the file is not written once per record.
+
+    With workers, or an executor, the blocks are compressed in parallel
+    while the next blocks are encoded. zlib, snappy and zstandard release
+    the GIL, so a thread pool uses several cores. The blocks are written
+    in order, and at most two blocks per worker wait to be written.
+
+    Arguments:
+        fo (typing.BinaryIO): file opened in binary mode
+        klass (typing.Any): dataclass, python class or faust.Record
+        codec (str): null, deflate, snappy or zstandard
+        block_records (int): maximum amount of records of a block
+        block_size (int): size in bytes of the encoded records that
+            completes a block
+        metadata (typing.Dict[str, bytes]): extra metadata of the header
+        sync_marker (bytes): 16 bytes written after every block,
+            random by default
+        workers (int): amount of threads that compress the blocks, the
+            blocks are compressed by the caller when it is 0
+        executor (concurrent.futures.Executor): thread or process pool that
+            compresses the blocks, instead of a pool of workers threads.
+            It is not shut down when the writer is closed.
+    """
+
+    def __init__(
+        self,
+        fo: typing.BinaryIO,
+        klass: typing.Any,
+        codec: str = NULL_CODEC,
+        block_records: int = DEFAULT_BLOCK_RECORDS,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        metadata: typing.Optional[typing.Dict[str, bytes]] = None,
+        sync_marker: typing.Optional[bytes] = None,
+        workers: int = 0,
+        executor: typing.Optional[concurrent.futures.Executor] = None,
+    ) -> None:
+        if codec not in COMPRESSORS:
+            raise ValueError(f"Unsupported codec {codec}")
+        if codec in OPTIONAL_CODECS:
+            get_codec_module(codec)
+        if sync_marker is not None and len(sync_marker) != SYNC_SIZE:
+            raise ValueError(f"The sync marker must have {SYNC_SIZE} bytes")
+        assert block_records > 0 and block_size > 0, "The block limits must be positive"
+        assert workers >= 0, "The amount of workers can not be negative"
+
+        self.fo = fo
+        self.klass = klass
+        self.codec = codec
+        self.block_records = block_records
+        self.block_size = block_size
+        self.sync_marker = sync_marker or os.urandom(SYNC_SIZE)
+
+        self._compress = COMPRESSORS[codec]
+        self._encode = compile_encoder(klass)
+        self._block = bytearray()
+        self._block_count = 0
+
+        self._own_executor = False
+        if codec == NULL_CODEC:
+            # the null codec does not compress, so it is not worth a pool
+            executor = None
+        elif executor is None and workers > 0:
+            executor = concurrent.futures.ThreadPoolExecutor(workers)
+            self._own_executor = True
+
+        self.executor = executor
+        self._max_pending = 2 * (workers or os.cpu_count() or 1)
+        self._pending: typing.Deque[typing.Tuple[int, concurrent.futures.Future]] = (
+            collections.deque()
+        )
+
+        self.write_header(metadata or {})
+
+    def write_header(self, metadata: typing.Dict[str, bytes]) -> None:
+        schema = SchemaGenerator(self.klass).avro_schema()
+        metadata = dict(metadata)
+        metadata[SCHEMA_KEY] = schema.encode("utf-8")
+        metadata[CODEC_KEY] = self.codec.encode("utf-8")
+
+        header = bytearray(MAGIC)
+        binary.write_long(header, len(metadata))
+        for key, value in metadata.items():
+            binary.write_string(header, key)
+            binary.write_bytes(header, value)
+        header.append(0)
+        header += self.sync_marker
+
+        self.fo.write(header)
+
+    def write(self, instance: typing.Any) -> None:
+        """
+        Add an instance to the current block
+        """
+        self._encode(instance, self._block)
+        self._block_count += 1
+
+        if (
+            self._block_count >= self.block_records
+            or len(self._block) >= self.block_size
+        ):
+            self.flush()
+
+    def write_many(self, instances: typing.Iterable[typing.Any]) -> None:
+        """
+        Add the instances to the blocks, writing every completed block
+        """
+        encode = self._encode
+        block = self._block
+        block_records = self.block_records
+        block_size = self.block_size
+
+        for instance in instances:
+            encode(instance, block)
+            self._block_count += 1
+
+            if self._block_count >= block_records or len(block) >= block_size:
+                self.flush()
+
+    def write_encoded(self, data: bytes, count: int) -> None:
+        """
+        Write a block with count records already encoded one after the other
+        in data, after the records added with write
+        """
+        self.flush()
+        if count:
+            self.write_block(data, count)
+
+    def write_block(self, data: bytes, count: int) -> None:
+        if self.executor is None:
+            self.write_compressed(self._compress(data), count)
+            return
+
+        # data is copied because the buffer of the block is reused
+        future = self.executor.submit(self._compress, bytes(data))
+        self._pending.append((count, future))
+
+        while self._pending and (
+            len(self._pending) > self._max_pending or self._pending[0][1].done()
+        ):
+            self.write_pending()
+
+    def write_pending(self) -> None:
+        """
+        Write the oldest block sent to the executor, waiting for its compression
+        """
+        count, future = self._pending.popleft()
+        self.write_compressed(future.result(), count)
+
+    def write_compressed(self, data: bytes, count: int) -> None:
+        block_header = bytearray()
+        binary.write_long(block_header, count)
+        binary.write_long(block_header, len(data))
+
+        self.fo.write(block_header)
+        self.fo.write(data)
+        self.fo.write(self.sync_marker)
+
+    def flush(self) -> None:
+        """
+        Write the current block, if it has records
+        """
+        if not self._block_count:
+            return
+
+        self.write_block(self._block, self._block_count)
+
+        del self._block[:]
+        self._block_count = 0
+
+    def close(self) -> None:
+        """
+        Write the last block and the blocks that are being compressed.
+        The file object is not closed.
+        """
+        try:
+            self.flush()
+            while self._pending:
+                self.write_pending()
+            self.fo.flush()
+        finally:
+            for _, future in self._pending:
+                future.cancel()
+            self._pending.clear()
+
+            if self._own_executor:
+                self.executor.shutdown()
+
+    def __enter__(self) -> "ContainerWriter":
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.close()
+
+
+def write_container(
+    fo: typing.BinaryIO,
+    klass: typing.Any,
+    instances: typing.Iterable[typing.Any],
+    **options: typing.Any,
+) -> None:
+    """
+    Write the instances to an avro Object Container File
+
+    Arguments:
+        fo (typing.BinaryIO): file opened in binary mode
+        klass (typing.Any): dataclass, python class or faust.Record
+        instances (typing.Iterable): instances of klass
+        options: see ContainerWriter
+    """
+    with ContainerWriter(fo, klass, **options) as writer:
+        writer.write_many(instances)
+
+
+class ContainerReader:
+    """
+    Read instances of a class from an avro Object Container File.
+
+    The file is memory-mapped and read one block at a time, so the memory
+    used is bounded by the size of a block and not by the size of the file.
+    The blocks without compression are decoded straight from the mapped file.
+
+    The file can be written with another version of the schema of the class,
+    the data is resolved to the class, see compile_resolving_decoder.
+
+    With zero_copy, bytes and fixed are decoded as memoryview slices, see
+    BinaryDecoder. The slices of the blocks without compression point to the
+    mapped file, which stays mapped until all of them are released.
+
+    Arguments:
+        source (str, os.PathLike, typing.BinaryIO or bytes): path of the file,
+            file opened in binary mode or the content of the file
+        klass (typing.Any): dataclass, python class or faust.Record
+        zero_copy (bool): decode bytes and fixed as memoryview slices
+    """
+
+    def __init__(
+        self,
+        source: typing.Union[str, os.PathLike, typing.BinaryIO, bytes],
+        klass: typing.Any,
+        zero_copy: bool = False,
+    ) -> None:
+        self.klass = klass
+        self.zero_copy = zero_copy
+        self._file: typing.Optional[typing.BinaryIO] = None
+        self._mmap: typing.Optional[mmap.mmap] = None
+
+        if isinstance(source, (str, os.PathLike)):
+            self._file = open(source, "rb")
+            self._data = self._map(self._file)
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            self._data = source
+        else:
+            self._data = self._map(source)
+
+        self.metadata, self.sync_marker, self._position = self.read_header()
+        self.codec = self.metadata.get(CODEC_KEY, NULL_CODEC.encode()).decode()
+        self.writer_schema = json.loads(self.metadata[SCHEMA_KEY])
+
+        if self.codec != NULL_CODEC and self.codec not in DECOMPRESSORS:
+            raise ValueError(f"Unsupported codec {self.codec}")
+
+        self._decode = compile_resolving_decoder(
+            self.writer_schema, klass, zero_copy=zero_copy
+        )
+
+    def _map(self, fo: typing.BinaryIO) -> typing.Any:
+        try:
+            fileno = fo.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            # file objects in memory, for example io.BytesIO
+            return fo.read()
+
+        self._mmap = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def read_header(self) -> typing.Tuple[typing.Dict[str, bytes], bytes, int]:
+        """
+        Returns:
+            typing.Tuple: the metadata, the sync marker and the position
+                of the first block
+        """
+        data = self._data
+        if data[: len(MAGIC)] != MAGIC:
+            raise ValueError("The data is not an avro Object Container File")
+
+        metadata = {}
+        count, position = binary.read_long(data, len(MAGIC))
+
+        while count:
+            if count < 0:
+                count = -count
+                _, position = binary.read_long(data, position)
+
+            for _ in range(count):
+                key, position = binary.read_string(data, position)
+                metadata[key], position = binary.read_bytes(data, position)
+
+            count, position = binary.read_long(data, position)
+
+        end = position + SYNC_SIZE
+        return metadata, bytes(data[position:end]), end
+
+    def check_schema(self) -> None:
+        """
+        Check that the schema of the file is the schema of the class, for
+        the readers of the raw blocks that do not resolve the schema
+        """
+        writer_form = fingerprints.resolution_form(self.writer_schema)
+        reader_form = fingerprints.resolution_form(
+            SchemaGenerator(self.klass).avro_schema_to_python()
+        )
+
+        if writer_form != reader_form:
+            raise ValueError(
+                f"The schema of the file is not the schema of {self.klass.__name__}"
+            )
+
+    def split(
+        self, split_size: int = DEFAULT_SPLIT_SIZE
+    ) -> typing.List[typing.Tuple[int, int]]:
+        """
+        Split the blocks of the file in ranges of about split_size bytes. The
+        ranges end after a sync marker, so they can be read independently.
+
+        Returns:
+            typing.List[typing.Tuple[int, int]]: the start and the end of
+                every range
+        """
+        data = self._data
+        if isinstance(data, memoryview):
+            data = bytes(data)
+
+        size = len(data)
+        boundaries = [self._position]
+
+        while boundaries[-1] + split_size < size:
+            sync_position = data.find(self.sync_marker, boundaries[-1] + split_size)
+            if sync_position == -1:
+                break  # pragma: no cover
+
+            boundary = sync_position + SYNC_SIZE
+            if boundary >= size:
+                break
+            boundaries.append(boundary)
+
+        boundaries.append(size)
+        return [
+            (start, end)
+            for start, end in zip(boundaries, boundaries[1:])
+            if start < end
+        ]
+
+    def read_blocks(
+        self, start: typing.Optional[int] = None, end: typing.Optional[int] = None
+    ) -> typing.Iterator[typing.Tuple[int, typing.Any, int]]:
+        """
+        Iterate over the blocks of the file, or over the blocks between
+        the positions start and end, see split
+
+        Returns:
+            typing.Iterator: the amount of records, the decompressed data
+                and the position of the first record in the data of every block
+        """
+        data = memoryview(self._data) if self.zero_copy else self._data
+        size = len(data) if end is None else end
+        position = self._position if start is None else start
+        decompress = DECOMPRESSORS.get(self.codec)
+
+        while position < size:
+            count, position = binary.read_long(data, position)
+            block_size, position = binary.read_long(data, position)
+            end = position + block_size
+            next_position = end + SYNC_SIZE
+
+            if data[end:next_position] != self.sync_marker:
+                raise ValueError(f"Invalid sync marker after the block at {position}")
+
+            if decompress is None:
+                yield count, data, position
+            elif self.zero_copy:
+                yield count, memoryview(decompress(data[position:end])), 0
+            else:
+                yield count, decompress(data[position:end]), 0
+
+            position = next_position
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        return self.records()
+
+    def records(
+        self, start: typing.Optional[int] = None, end: typing.Optional[int] = None
+    ) -> typing.Iterator[typing.Any]:
+        """
+        Iterate over the instances of the file, or over the instances of
+        the blocks between the positions start and end, see split
+        """
+        decode = self._decode
+
+        for count, data, position in self.read_blocks(start, end):
+            for _ in range(count):
+                instance, position = decode(data, position)
+                yield instance
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # there are memoryview slices of the file alive, it is
+                # unmapped when they are released
+                pass
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self) -> "ContainerReader":
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.close()
+
+
+def read_container(
+    source: typing.Union[str, os.PathLike, typing.BinaryIO, bytes],
+    klass: typing.Any,
+    zero_copy: bool = False,
+) -> typing.Iterator[typing.Any]:
+    """
+    Yield the instances of klass stored in an avro Object Container File
+
+    Arguments:
+        source (str, os.PathLike, typing.BinaryIO or bytes): path of the file,
+            file opened in binary mode or the content of the file
+        klass (typing.Any): dataclass, python class or faust.Record
+        zero_copy (bool): decode bytes and fixed as memoryview slices
+    """
+    with ContainerReader(source, klass, zero_copy=zero_copy) as reader:
+        yield from reader
+
+
+def read_range(
+    path: typing.Union[str, os.PathLike], klass: typing.Any, start: int, end: int
+) -> typing.List[typing.Any]:
+    """
+    Return the instances of the blocks between the positions start and end
+    of an Object Container File, see ContainerReader.split
+    """
+    with ContainerReader(path, klass) as reader:
+        return list(reader.records(start, end))
+
+
+def map_ranges(
+    path: typing.Union[str, os.PathLike],
+    klass: typing.Any,
+    function: typing.Callable[..., typing.Any],
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional[concurrent.futures.Executor] = None,
+    ordered: bool = True,
+    split_size: int = DEFAULT_SPLIT_SIZE,
+) -> typing.Iterator[typing.Any]:
+    """
+    Split an Object Container File in ranges of blocks and call
+    function(path, klass, start, end) for every range in an executor.
+
+    Only a few ranges are submitted ahead of the results that are consumed,
+    so the memory used does not depend on the size of the file.
+
+    Arguments:
+        path (str, os.PathLike): path of the file
+        klass (typing.Any): dataclass, python class or faust.Record
+        function (typing.Callable): function called with every range, it must
+            be defined at the module level to be used by a process pool
+        workers (int): amount of processes, the amount of cpus by default
+        executor (concurrent.futures.Executor): executor used instead of
+            a pool of workers processes, it is not shut down
+        ordered (bool): yield the results in the order of the ranges, or as
+            soon as they are ready
+        split_size (int): approximate size in bytes of the ranges
+
+    Returns:
+        typing.Iterator: the result of every range
+    """
+    with ContainerReader(path, klass) as reader:
+        ranges = iter(reader.split(split_size))
+
+    own_executor = executor is None
+    if own_executor:
+        executor = concurrent.futures.ProcessPoolExecutor(workers)
+
+    max_pending = 2 * (workers or os.cpu_count() or 1)
+    pending: typing.List[concurrent.futures.Future] = []
+
+    def submit() -> None:
+        for start, end in itertools.islice(ranges, max_pending - len(pending)):
+            pending.append(executor.submit(function, path, klass, start, end))
+
+    try:
+        submit()
+        while pending:
+            if ordered:
+                future = pending[0]
+            else:
+                done, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                future = done.pop()
+
+            result = future.result()
+            pending.remove(future)
+            # the next ranges are read while the result is consumed
+            submit()
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown()
+
+
+def read_container_parallel(
+    path: typing.Union[str, os.PathLike],
+    klass: typing.Any,
+    workers: typing.Optional[int] = None,
+    executor: typing.Optional[concurrent.futures.Executor] = None,
+    ordered: bool = True,
+    split_size: int = DEFAULT_SPLIT_SIZE,
+) -> typing.Iterator[typing.Any]:
+    """
+    Read an Object Container File with several processes. The file is split
+    in ranges of blocks, on its sync markers, that are decoded by the workers.
+
+    The instances are pickled to be sent back from the workers, so the
+    class must be defined at the module level. Unpickling instances costs
+    about as much as decoding them, so when the instances are processed to
+    a smaller result, it is faster to do it in the workers with map_ranges.
+
+    Arguments:
+        path (str, os.PathLike): path of the file
+        klass (typing.Any): dataclass, python class or faust.Record
+        workers, executor, ordered, split_size: see map_ranges
+
+    Returns:
+        typing.Iterator: the instances of the file, in the order of the file
+            when ordered is True
+    """
+    for instances in map_ranges(
+        path,
+        klass,
+        read_range,
+        workers=workers,
+        executor=executor,
+        ordered=ordered,
+        split_size=split_size,
+    ):
+        yield from instances
@@ -0,0 +1,553 @@
+import datetime
+import decimal
+import functools
+import typing
+
+from dataclasses_avroschema import types
+
+EPOCH_DATETIME = datetime.datetime(1970, 1, 1)
+EPOCH_DATETIME_UTC = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+EPOCH_DATE_ORDINAL = EPOCH_DATETIME.toordinal()
+
+MILLISECONDS_PER_DAY = 24 * 60 * 60 * 1000
+MICROSECONDS_PER_DAY = MILLISECONDS_PER_DAY * 1000
+
+# the values that can be converted to datetime.date and datetime.datetime,
+# the numpy datetime64 values out of these ranges are converted to int by tolist
+DAYS_RANGE = (
+    datetime.date.min.toordinal() - EPOCH_DATE_ORDINAL,
+    datetime.date.max.toordinal() - EPOCH_DATE_ORDINAL,
+)
+MILLIS_RANGE = (
+    (datetime.datetime.min - EPOCH_DATETIME) // datetime.timedelta(milliseconds=1),
+    (datetime.datetime.max - EPOCH_DATETIME) // datetime.timedelta(milliseconds=1),
+)
+MICROS_RANGE = (
+    (datetime.datetime.min - EPOCH_DATETIME) // datetime.timedelta(microseconds=1),
+    (datetime.datetime.max - EPOCH_DATETIME) // datetime.timedelta(microseconds=1),
+)
+
+# numpy is used when it is installed, it is imported the first time
+# that a batch of values is converted, see find_numpy
+_numpy: typing.Any = None
+_numpy_checked = False
+
+
+def find_numpy() -> typing.Any:
+    """
+    Import numpy the first time it is needed.
+
+    Returns:
+        The numpy module, or None when it is not installed
+    """
+    global _numpy, _numpy_checked
+
+    if not _numpy_checked:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+
+        _numpy = numpy
+        _numpy_checked = True
+
+    return _numpy
+
+
+def is_datetime_array(values: typing.Any) -> bool:
+    """
+    Return True if values is a numpy array of datetime64 or timedelta64.
+    numpy is not imported to check values that are not numpy arrays.
+    """
+    return type(values).__module__ == "numpy" and values.dtype.kind in "mM"
+
+
+def date_to_days(date: datetime.date) -> int:
+    """
+    Returns the number of days from the unix epoch, 1 January 1970
+    (ISO calendar), for a given date
+
+    Arguments:
+        date (datetime.date)
+
+    Returns:
+        int
+    """
+    return date.toordinal() - EPOCH_DATE_ORDINAL
+
+
+def days_to_date(days: int) -> datetime.date:
+    """
+    Returns the date for a given number of days from the unix epoch,
+    the inverse of date_to_days
+
+    Arguments:
+        days (int)
+
+    Returns:
+        datetime.date
+    """
+    return datetime.date.fromordinal(EPOCH_DATE_ORDINAL + days)
+
+
+def time_to_millis(time: datetime.time) -> int:
+    """
+    Returns the number of milliseconds after midnight, 00:00:00.000,
+    for a given time. The microseconds are truncated.
+
+    Arguments:
+        time (datetime.time)
+
+    Returns:
+        int
+    """
+    return (
+        (time.hour * 60 + time.minute) * 60 + time.second
+    ) * 1000 + time.microsecond // 1000
+
+
+def millis_to_time(milliseconds: int) -> datetime.time:
+    """
+    Returns the time for a given number of milliseconds after midnight,
+    the inverse of time_to_millis
+
+    Arguments:
+        milliseconds (int)
+
+    Returns:
+        datetime.time
+    """
+    seconds, milliseconds = divmod(milliseconds, 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+
+    return datetime.time(hours, minutes, seconds, milliseconds * 1000)
+
+
+def datetime_to_millis(date_time: datetime.datetime) -> int:
+    """
+    Returns the number of milliseconds from the unix epoch,
+    1 January 1970 00:00:00.000 UTC, for a given datetime. Naive
+    datetimes are UTC, and the microseconds are rounded down.
+
+    Arguments:
+        date_time (datetime.datetime)
+
+    Returns:
+        int
+    """
+    if date_time.tzinfo is None:
+        delta = date_time - EPOCH_DATETIME
+    else:
+        delta = date_time - EPOCH_DATETIME_UTC
+
+    # timedelta normalizes the seconds and microseconds to positive values,
+    # so the division rounds down like for the dates before the epoch
+    return (
+        delta.days * MILLISECONDS_PER_DAY
+        + delta.seconds * 1000
+        + delta.microseconds // 1000
+    )
+
+
+def millis_to_datetime(milliseconds: int) -> datetime.datetime:
+    """
+    Returns the naive UTC datetime for a given number of milliseconds from
+    the unix epoch, the inverse of datetime_to_millis
+
+    Arguments:
+        milliseconds (int)
+
+    Returns:
+        datetime.datetime
+    """
+    seconds, milliseconds = divmod(milliseconds, 1000)
+    return EPOCH_DATETIME + datetime.timedelta(0, seconds, milliseconds * 1000)
+
+
+def time_to_micros(time: datetime.time) -> int:
+    """
+    Returns the number of microseconds after midnight, 00:00:00.000000,
+    for a given time
+
+    Arguments:
+        time (datetime.time)
+
+    Returns:
+        int
+    """
+    return (
+        (time.hour * 60 + time.minute) * 60 + time.second
+    ) * 1000000 + time.microsecond
+
+
+def micros_to_time(microseconds: int) -> datetime.time:
+    """
+    Returns the time for a given number of microseconds after midnight,
+    the inverse of time_to_micros
+
+    Arguments:
+        microseconds (int)
+
+    Returns:
+        datetime.time
+    """
+    seconds, microseconds = divmod(microseconds, 1000000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+
+    return datetime.time(hours, minutes, seconds, microseconds)
+
+
+def datetime_to_micros(date_time: datetime.datetime) -> int:
+    """
+    Returns the number of microseconds from the unix epoch,
+    1 January 1970 00:00:00.000000 UTC, for a given datetime.
+    Naive datetimes are UTC.
+
+    Arguments:
+        date_time (datetime.datetime)
+
+    Returns:
+        int
+    """
+    if date_time.tzinfo is None:
+        delta = date_time - EPOCH_DATETIME
+    else:
+        delta = date_time - EPOCH_DATETIME_UTC
+
+    return (
+        delta.days * MICROSECONDS_PER_DAY + delta.seconds * 1000000 + delta.microseconds
+    )
+
+
+def micros_to_datetime(microseconds: int) -> datetime.datetime:
+    """
+    Returns the naive UTC datetime for a given number of microseconds from
+    the unix epoch, the inverse of datetime_to_micros
+
+    Arguments:
+        microseconds (int)
+
+    Returns:
+        datetime.datetime
+    """
+    return EPOCH_DATETIME + datetime.timedelta(microseconds=microseconds)
+
+
+def local_datetime_to_millis(date_time: datetime.datetime) -> int:
+    """
+    Returns the number of milliseconds from 1 January 1970 00:00:00.000
+    for the wall clock time of a datetime, ignoring its time zone.
+    The microseconds are rounded down.
+
+    Arguments:
+        date_time (datetime.datetime)
+
+    Returns:
+        int
+    """
+    delta = date_time.replace(tzinfo=None) - EPOCH_DATETIME
+
+    return (
+        delta.days * MILLISECONDS_PER_DAY
+        + delta.seconds * 1000
+        + delta.microseconds // 1000
+    )
+
+
+def local_datetime_to_micros(date_time: datetime.datetime) -> int:
+    """
+    Returns the number of microseconds from 1 January 1970 00:00:00.000000
+    for the wall clock time of a datetime, ignoring its time zone.
+
+    Arguments:
+        date_time (datetime.datetime)
+
+    Returns:
+        int
+    """
+    delta = date_time.replace(tzinfo=None) - EPOCH_DATETIME
+
+    return (
+        delta.days * MICROSECONDS_PER_DAY + delta.seconds * 1000000 + delta.microseconds
+    )
+
+
+class DecimalConverter:
+    """
+    Convert decimal.Decimal values to the big-endian two's-complement bytes
+    of their unscaled integer, value * 10 ** scale, and back.
+
+    The quantizer, the context and the limits of a precision and scale are
+    computed once, see decimal_converter.
+
+    Arguments:
+        precision (int): maximum number of digits
+        scale (int): number of digits after the decimal point
+        size (int): size of the fixed that stores the values, None when
+            they are stored in bytes
+    """
+
+    def __init__(
+        self, precision: int, scale: int = 0, size: typing.Optional[int] = None
+    ) -> None:
+        self.precision = precision
+        self.scale = scale
+        self.size = size
+        self.quantizer = decimal.Decimal(1).scaleb(-scale)
+        # the values that are rounded or have too many digits are invalid
+        self.context = decimal.Context(
+            prec=precision, traps=[decimal.Inexact, decimal.InvalidOperation]
+        )
+
+    def to_logical_type(self, value: decimal.Decimal) -> bytes:
+        try:
+            unscaled = int(
+                value.quantize(self.quantizer, context=self.context).scaleb(
+                    self.scale, context=self.context
+                )
+            )
+        except (ArithmeticError, ValueError):
+            raise ValueError(
+                f"{value!r} is not a valid decimal of precision "
+                f"{self.precision} and scale {self.scale}"
+            ) from None
+
+        size = self.size
+        if size is None:
+            # the sign needs one more bit
+            size = (unscaled.bit_length() + 8) // 8
+
+        return unscaled.to_bytes(size, "big", signed=True)
+
+    def from_logical_type(self, data: bytes) -> decimal.Decimal:
+        return decimal.Decimal(int.from_bytes(data, "big", signed=True)).scaleb(
+            -self.scale, context=self.context
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def decimal_converter(
+    precision: int, scale: int = 0, size: typing.Optional[int] = None
+) -> DecimalConverter:
+    """
+    Return the converter of the decimals of a precision and scale, it
+    is created once and shared by all the fields with the same schema
+    """
+    return DecimalConverter(precision, scale, size)
+
+
+def dates_to_days(values: typing.Any) -> typing.Any:
+    """
+    Convert many dates at once, see date_to_days.
+
+    Arguments:
+        values: iterable of datetime.date or numpy datetime64 array
+
+    Returns:
+        list of int, or an int64 numpy array for a numpy array
+    """
+    if is_datetime_array(values):
+        numpy = find_numpy()
+        return values.astype("datetime64[D]").view(numpy.int64)
+
+    ordinal = EPOCH_DATE_ORDINAL
+    return [date.toordinal() - ordinal for date in values]
+
+
+def times_to_millis(values: typing.Any) -> typing.Any:
+    """
+    Convert many times at once, see time_to_millis.
+
+    Arguments:
+        values: iterable of datetime.time or numpy timedelta64 array
+            of the time since midnight
+
+    Returns:
+        list of int, or an int64 numpy array for a numpy array
+    """
+    if is_datetime_array(values):
+        numpy = find_numpy()
+        return values.astype("timedelta64[ms]").view(numpy.int64)
+
+    return [
+        ((time.hour * 60 + time.minute) * 60 + time.second) * 1000
+        + time.microsecond // 1000
+        for time in values
+    ]
+
+
+def datetimes_to_millis(values: typing.Any) -> typing.Any:
+    """
+    Convert many datetimes at once, see datetime_to_millis.
+
+    numpy is only used for numpy arrays: it is slower than integer
+    arithmetic to convert a list of datetime instances.
+
+    Arguments:
+        values: iterable of datetime.datetime or numpy datetime64 array
+
+    Returns:
+        list of int, or an int64 numpy array for a numpy array
+    """
+    if is_datetime_array(values):
+        numpy = find_numpy()
+        return values.astype("datetime64[ms]").view(numpy.int64)
+
+    epoch = EPOCH_DATETIME
+    millis = []
+    append = millis.append
+
+    for date_time in values:
+        if date_time.tzinfo is None:
+            delta = date_time - epoch
+        else:
+            delta = date_time - EPOCH_DATETIME_UTC
+        append(
+            delta.days * MILLISECONDS_PER_DAY
+            + delta.seconds * 1000
+            + delta.microseconds // 1000
+        )
+
+    return millis
+
+
+def times_to_micros(values: typing.Any) -> typing.Any:
+    """
+    Convert many times at once, see time_to_micros.
+
+    Arguments:
+        values: iterable of datetime.time or numpy timedelta64 array
+            of the time since midnight
+
+    Returns:
+        list of int, or an int64 numpy array for a numpy array
+    """
+    if is_datetime_array(values):
+        numpy = find_numpy()
+        return values.astype("timedelta64[us]").view(numpy.int64)
+
+    return [
+        ((time.hour * 60 + time.minute) * 60 + time.second) * 1000000 + time.microsecond
+        for time in values
+    ]
+
+
+def datetimes_to_micros(values: typing.Any) -> typing.Any:
+    """
+    Convert many datetimes at once, see datetime_to_micros and
+    datetimes_to_millis.
+
+    Arguments:
+        values: iterable of datetime.datetime or numpy datetime64 array
+
+    Returns:
+        list of int, or an int64 numpy array for a numpy array
+    """
+    if is_datetime_array(values):
+        numpy = find_numpy()
+        return values.astype("datetime64[us]").view(numpy.int64)
+
+    epoch = EPOCH_DATETIME
+    micros = []
+    append = micros.append
+
+    for date_time in values:
+        if date_time.tzinfo is None:
+            delta = date_time - epoch
+        else:
+            delta = date_time - EPOCH_DATETIME_UTC
+        append(
+            delta.days * MICROSECONDS_PER_DAY
+            + delta.seconds * 1000000
+            + delta.microseconds
+        )
+
+    return micros
+
+
+def _in_range(array: typing.Any, value_range: typing.Tuple[int, int]) -> bool:
+    return not array.size or (
+        value_range[0] <= array.min() and array.max() <= value_range[1]
+    )
+
+
+def days_to_dates(values: typing.Iterable[int]) -> typing.List[datetime.date]:
+    """
+    Convert many numbers of days to dates at once, see days_to_date.
+    numpy datetime64 is used when it is installed.
+
+    Raises:
+        ValueError: like days_to_date, when a value is out of the range
+            of datetime.date
+    """
+    numpy = find_numpy()
+
+    if numpy is not None:
+        array = numpy.asarray(values, dtype=numpy.int64)
+        if _in_range(array, DAYS_RANGE):
+            return array.view("datetime64[D]").tolist()
+        # days_to_date raises the error of the values out of range
+        values = array.tolist()
+
+    return [days_to_date(days) for days in values]
+
+
+def millis_to_datetimes(
+    values: typing.Iterable[int],
+) -> typing.List[datetime.datetime]:
+    """
+    Convert many numbers of milliseconds to datetimes at once, see
+    millis_to_datetime. numpy datetime64 is used when it is installed.
+
+    Raises:
+        OverflowError: like millis_to_datetime, when a value is out of the
+            range of datetime.datetime
+    """
+    numpy = find_numpy()
+
+    if numpy is not None:
+        array = numpy.asarray(values, dtype=numpy.int64)
+        if _in_range(array, MILLIS_RANGE):
+            return array.view("datetime64[ms]").tolist()
+        # millis_to_datetime raises the error of the values out of range
+        values = array.tolist()
+
+    return [millis_to_datetime(milliseconds) for milliseconds in values]
+
+
+def micros_to_datetimes(
+    values: typing.Iterable[int],
+) -> typing.List[datetime.datetime]:
+    """
+    Convert many numbers of microseconds to datetimes at once, see
+    micros_to_datetime. numpy datetime64 is used when it is installed.
+
+    Raises:
+        OverflowError: like micros_to_datetime, when a value is out of the
+            range of datetime.datetime
+    """
+    numpy = find_numpy()
+
+    if numpy is not None:
+        array = numpy.asarray(values, dtype=numpy.int64)
+        if _in_range(array, MICROS_RANGE):
+            return array.view("datetime64[us]").tolist()
+        # micros_to_datetime raises the error of the values out of range
+        values = array.tolist()
+
+    return [micros_to_datetime(microseconds) for microseconds in values]
+
+
+# batch conversions of the python values of the logical types, note that
+# datetime.datetime is a subclass of datetime.date so the exact type is used.
+# The values of the microseconds types are plain datetime instances, they
+# are keyed by their annotation
+BATCH_CONVERSIONS: typing.Dict[type, typing.Callable[[typing.Any], typing.Any]] = {
+    datetime.date: dates_to_days,
+    datetime.time: times_to_millis,
+    datetime.datetime: datetimes_to_millis,
+    types.TimeMicros: times_to_micros,
+    types.TimestampMicros: datetimes_to_micros,
+}
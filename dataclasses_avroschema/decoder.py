@@ -0,0 +1,416 @@
+import dataclasses
+import functools
+import typing
+
+from dataclasses_avroschema import binary, codegen, compiler, fields, schema_definition
+from dataclasses_avroschema.cache import schema_cache
+from dataclasses_avroschema.schema_generator import SchemaGenerator
+
+DecodeFunction = typing.Callable[[bytes, int], typing.Tuple[typing.Any, int]]
+
+
+def _emit_null(writer: codegen.CodeWriter, target: str) -> None:
+    writer.line(f"{target} = None")
+
+
+def _emit_boolean(writer: codegen.CodeWriter, target: str) -> None:
+    writer.line(f"{target} = data[position] == 1")
+    writer.line("position += 1")
+
+
+def _emit_long(writer: codegen.CodeWriter, target: str) -> None:
+    # the values between -64 and 63 are encoded in one byte, read without a call
+    byte = writer.variable("byte")
+    writer.line(f"{byte} = data[position]")
+    writer.line(f"if {byte} < 0x80:")
+    with writer.indent():
+        writer.line(f"{target} = ({byte} >> 1) ^ -({byte} & 1)")
+        writer.line("position += 1")
+    writer.line("else:")
+    with writer.indent():
+        writer.line(f"{target}, position = {writer.use('read_long')}(data, position)")
+
+
+def _emit_float(writer: codegen.CodeWriter, target: str) -> None:
+    writer.line(f"{target} = {writer.use('unpack_float')}(data, position)[0]")
+    writer.line("position += 4")
+
+
+def _emit_double(writer: codegen.CodeWriter, target: str) -> None:
+    writer.line(f"{target} = {writer.use('unpack_double')}(data, position)[0]")
+    writer.line("position += 8")
+
+
+def _emit_slice(writer: codegen.CodeWriter, target: str, expression: str) -> None:
+    """
+    Read the size of bytes or string and assign expression to target, where
+    the {value} field of expression is replaced by the slice of the data
+    """
+    size = writer.variable("size")
+    end = writer.variable("end")
+    _emit_long(writer, size)
+    writer.line(f"{end} = position + {size}")
+    writer.line(f"{target} = {expression.format(value=f'data[position:{end}]')}")
+    writer.line(f"position = {end}")
+
+
+def _emit_bytes(writer: codegen.CodeWriter, target: str) -> None:
+    _emit_slice(writer, target, "bytes({value})")
+
+
+def _emit_bytes_view(writer: codegen.CodeWriter, target: str) -> None:
+    _emit_slice(writer, target, "{value}")
+
+
+def _emit_string(writer: codegen.CodeWriter, target: str) -> None:
+    _emit_slice(writer, target, 'str({value}, "utf-8")')
+
+
+PRIMITIVE_EMITTERS: typing.Dict[str, codegen.Emitter] = {
+    fields.NULL: _emit_null,
+    fields.BOOLEAN: _emit_boolean,
+    fields.INT: _emit_long,
+    fields.LONG: _emit_long,
+    fields.FLOAT: _emit_float,
+    fields.DOUBLE: _emit_double,
+    fields.BYTES: _emit_bytes,
+    fields.STRING: _emit_string,
+}
+
+
+def _emit_blocks(
+    writer: codegen.CodeWriter, emit_item: typing.Callable[[], None]
+) -> None:
+    """
+    Write the loop over the blocks of an array or a map, where emit_item
+    writes the code that reads one item
+    """
+    count = writer.variable("count")
+    skipped = writer.variable("skipped")
+    _emit_long(writer, count)
+    writer.line(f"while {count}:")
+    with writer.indent():
+        writer.line(f"if {count} < 0:")
+        with writer.indent():
+            writer.line("# a negative count is followed by the size of the block")
+            writer.line(f"{count} = -{count}")
+            _emit_long(writer, skipped)
+        writer.line(f"for _ in range({count}):")
+        with writer.indent():
+            emit_item()
+        _emit_long(writer, count)
+
+
+def array_emitter(emit_item: codegen.Emitter) -> codegen.Emitter:
+    """
+    Return the emitter of an array whose items are read by emit_item
+    """
+
+    def emit_array(writer: codegen.CodeWriter, target: str) -> None:
+        item = writer.variable("item")
+
+        def emit_append() -> None:
+            emit_item(writer, item)
+            writer.line(f"{target}.append({item})")
+
+        writer.line(f"{target} = []")
+        _emit_blocks(writer, emit_append)
+
+    return emit_array
+
+
+def map_emitter(emit_value: codegen.Emitter) -> codegen.Emitter:
+    """
+    Return the emitter of a map whose values are read by emit_value
+    """
+
+    def emit_map(writer: codegen.CodeWriter, target: str) -> None:
+        key = writer.variable("key")
+        item = writer.variable("item")
+
+        def emit_item() -> None:
+            _emit_string(writer, key)
+            emit_value(writer, item)
+            writer.line(f"{target}[{key}] = {item}")
+
+        writer.line(f"{target} = {{}}")
+        _emit_blocks(writer, emit_item)
+
+    return emit_map
+
+
+def can_set_attributes(klass: typing.Any) -> bool:
+    """
+    Return True if the instances of klass can be created with __new__ setting
+    the attributes directly, which is equivalent to calling the dataclass
+    constructor when it does not run any extra code. The frozen dataclasses
+    and the classes that override __setattr__ use the constructor.
+    """
+    return (
+        dataclasses.is_dataclass(klass)
+        and not schema_definition.could_be_faust_record(klass)
+        and not klass.__dataclass_params__.frozen
+        and klass.__setattr__ is object.__setattr__
+        and not hasattr(klass, "__post_init__")
+        and "__slots__" not in klass.__dict__
+        and all(field.init for field in dataclasses.fields(klass))
+    )
+
+
+class DecoderCompiler(codegen.SourceCompiler):
+    """
+    Generate the source of the decode functions of an avro schema.
+
+    Every record is translated to a function that reads its fields from
+    a buffer and returns the instance and the position after it. Records
+    are decoded straight to instances of their classes.
+
+    With zero_copy, bytes and fixed are decoded as slices of the buffer,
+    which must be a memoryview, instead of copies.
+    """
+
+    prefix = "decode"
+    arguments = ("data", "position")
+    helpers = {
+        "read_long": binary.read_long,
+        "unpack_float": binary.unpack_float,
+        "unpack_double": binary.unpack_double,
+        "new": object.__new__,
+    }
+
+    def __init__(
+        self, record_classes: typing.Dict[str, typing.Any], zero_copy: bool = False
+    ) -> None:
+        super().__init__(record_classes)
+        self.zero_copy = zero_copy
+
+    def compile_primitive(self, avro_type: str) -> codegen.Emitter:
+        if self.zero_copy and avro_type == fields.BYTES:
+            return _emit_bytes_view
+        return PRIMITIVE_EMITTERS[avro_type]
+
+    def call(self, function_name: str) -> codegen.Emitter:
+        def emit_call(writer: codegen.CodeWriter, target: str) -> None:
+            writer.line(f"{target}, position = {function_name}(data, position)")
+
+        return emit_call
+
+    def write_record(
+        self,
+        writer: codegen.CodeWriter,
+        avro_type: typing.Dict,
+        namespace: typing.Optional[str],
+    ) -> None:
+        klass = self.get_record_class(avro_type, namespace)
+        attributes = []
+
+        for field in avro_type["fields"]:
+            emit = self.compile(field["type"], namespace)
+            target = writer.variable()
+            emit(writer, target)
+            attributes.append((field["name"], target))
+
+        self.write_instance(writer, klass, attributes)
+
+    def write_instance(
+        self,
+        writer: codegen.CodeWriter,
+        klass: typing.Any,
+        attributes: typing.List[typing.Tuple[str, str]],
+    ) -> None:
+        """
+        Write the lines that create the instance of a record and return it
+
+        Arguments:
+            klass (typing.Any): class of the record
+            attributes (typing.List): names of the fields with the local
+                variables that store their values
+        """
+        name = writer.use(self.bind(klass, klass.__name__))
+
+        if can_set_attributes(klass):
+            instance = writer.variable("instance")
+            values = ", ".join(f"{key!r}: {value}" for key, value in attributes)
+            writer.line(f"{instance} = {writer.use('new')}({name})")
+            writer.line(f"{instance}.__dict__ = {{{values}}}")
+            writer.line(f"return {instance}, position")
+        else:
+            values = ", ".join(f"{key}={value}" for key, value in attributes)
+            writer.line(f"return {name}({values}), position")
+
+    def compile_enum(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        fullname, _ = self.register(avro_type, namespace)
+        symbols = self.bind(tuple(avro_type["symbols"]), f"{avro_type['name']}_symbols")
+
+        def emit_enum(writer: codegen.CodeWriter, target: str) -> None:
+            index = writer.variable("index")
+            _emit_long(writer, index)
+            writer.line(f"{target} = {writer.use(symbols)}[{index}]")
+
+        self.compiled_named_types[fullname] = emit_enum
+        return emit_enum
+
+    def compile_fixed(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        fullname, _ = self.register(avro_type, namespace)
+        size = int(avro_type["size"])
+        expression = (
+            "data[position:{end}]" if self.zero_copy else "bytes(data[position:{end}])"
+        )
+
+        def emit_fixed(writer: codegen.CodeWriter, target: str) -> None:
+            end = writer.variable("end")
+            writer.line(f"{end} = position + {size}")
+            writer.line(f"{target} = {expression.format(end=end)}")
+            writer.line(f"position = {end}")
+
+        self.compiled_named_types[fullname] = emit_fixed
+        return emit_fixed
+
+    def compile_array(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        return array_emitter(self.compile(avro_type["items"], namespace))
+
+    def compile_map(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        return map_emitter(self.compile(avro_type["values"], namespace))
+
+    def compile_logical_type(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        logical_type = avro_type["logicalType"]
+        _, from_logical_type = compiler.get_logical_conversions(avro_type)
+        from_logical_type = self.bind(
+            from_logical_type, f"{logical_type}_from_logical_type"
+        )
+        emit = self.compile(compiler.get_underlying_type(avro_type), namespace)
+
+        def emit_logical_type(writer: codegen.CodeWriter, target: str) -> None:
+            raw = writer.variable("raw")
+            emit(writer, raw)
+            writer.line(f"{target} = {writer.use(from_logical_type)}({raw})")
+
+        return emit_logical_type
+
+    def compile_union(
+        self, avro_type: typing.List, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        branches = [self.compile(element, namespace) for element in avro_type]
+
+        def emit_union(writer: codegen.CodeWriter, target: str) -> None:
+            index = writer.variable("index")
+            _emit_long(writer, index)
+
+            for branch_index, emit in enumerate(branches):
+                keyword = "elif" if branch_index else "if"
+                writer.line(f"{keyword} {index} == {branch_index}:")
+                with writer.indent():
+                    emit(writer, target)
+
+            writer.line("else:")
+            with writer.indent():
+                writer.line(
+                    f'raise ValueError(f"Invalid index {{{index}}} of the union")'
+                )
+
+        return emit_union
+
+
+@functools.lru_cache(maxsize=None)
+def compile_decoder(klass: typing.Any, zero_copy: bool = False) -> DecodeFunction:
+    """
+    Return the decode function of a class. Its source is generated and
+    compiled once per class, and it is available in the __source__ attribute.
+
+    Arguments:
+        klass (typing.Any): dataclass, python class or faust.Record
+        zero_copy (bool): decode bytes and fixed as slices of the data,
+            which must be a memoryview
+
+    Returns:
+        typing.Callable: function that reads an instance from a buffer
+            and returns it with the position after it
+    """
+    schema_generator = SchemaGenerator(klass)
+    decoder_compiler = DecoderCompiler(
+        schema_generator.get_record_classes(), zero_copy=zero_copy
+    )
+
+    return decoder_compiler.build(
+        schema_generator.avro_schema_to_python(), klass.__name__
+    )
+
+
+schema_cache.add_invalidate_callback(compile_decoder.cache_clear)
+
+
+class BinaryDecoder:
+    """
+    Decode data written with the avro binary encoding to instances of a class.
+
+    The instances are created directly, without intermediate dicts. The
+    dataclasses that do not run extra code in the constructor (__post_init__,
+    init=False fields...) are created with __new__ setting the attributes.
+
+    With zero_copy, the bytes and fixed values are memoryview slices of the
+    decoded data instead of copies. The slices keep the data alive, so it
+    must not be modified while they are used: a bytearray can not be resized
+    and a mmap can not be closed until all the slices are released. Call
+    bytes(value) to keep a copy of a value after releasing the data.
+
+    Arguments:
+        klass (typing.Any): dataclass, python class or faust.Record
+        zero_copy (bool): decode bytes and fixed as memoryview slices
+    """
+
+    def __init__(self, klass: typing.Any, zero_copy: bool = False) -> None:
+        self.klass = klass
+        self.zero_copy = zero_copy
+        self._decode = compile_decoder(klass, zero_copy=zero_copy)
+
+    @property
+    def source(self) -> str:
+        """
+        Return the generated python source of the decoder, for inspection
+        """
+        return self._decode.__source__
+
+    def decode(self, data: bytes) -> typing.Any:
+        """
+        Return the instance encoded in data
+        """
+        if self.zero_copy:
+            data = memoryview(data)
+        return self._decode(data, 0)[0]
+
+    def decode_many(
+        self, data: bytes, count: typing.Optional[int] = None
+    ) -> typing.List[typing.Any]:
+        """
+        Return the instances encoded one after the other in data (the layout
+        of an Object Container File data block). If count is None, data is
+        read until the end.
+        """
+        decode = self._decode
+        instances = []
+        position = 0
+
+        if self.zero_copy:
+            data = memoryview(data)
+
+        if count is None:
+            size = len(data)
+            while position < size:
+                instance, position = decode(data, position)
+                instances.append(instance)
+        else:
+            for _ in range(count):
+                instance, position = decode(data, position)
+                instances.append(instance)
+
+        return instances
@@ -0,0 +1,443 @@
+import datetime
+import decimal
+import functools
+import typing
+import uuid
+
+from dataclasses_avroschema import binary, codegen, compiler, conversions, fields
+from dataclasses_avroschema.cache import schema_cache
+from dataclasses_avroschema.schema_generator import SchemaGenerator
+
+EncodeFunction = typing.Callable[[typing.Any, bytearray], None]
+
+BYTES_TYPES = (bytes, bytearray, memoryview)
+
+# expressions that check if a python value should be encoded using a type
+# when it is a branch of an union
+PRIMITIVE_PREDICATES = {
+    fields.NULL: "{value} is None",
+    fields.BOOLEAN: "{value} is True or {value} is False",
+    fields.INT: "isinstance({value}, int) and not isinstance({value}, bool)",
+    fields.LONG: "isinstance({value}, int) and not isinstance({value}, bool)",
+    fields.FLOAT: "isinstance({value}, (int, float)) and not isinstance({value}, bool)",
+    fields.DOUBLE: "isinstance({value}, (int, float)) and not isinstance({value}, bool)",
+    fields.BYTES: "isinstance({value}, BYTES_TYPES)",
+    fields.STRING: "isinstance({value}, str)",
+}
+
+LOGICAL_PREDICATES = {
+    fields.DATE: (
+        "isinstance({value}, datetime.date)"
+        " and not isinstance({value}, datetime.datetime)"
+    ),
+    fields.TIME_MILLIS: "isinstance({value}, datetime.time)",
+    fields.TIMESTAMP_MILLIS: "isinstance({value}, datetime.datetime)",
+    fields.TIME_MICROS: "isinstance({value}, datetime.time)",
+    fields.TIMESTAMP_MICROS: "isinstance({value}, datetime.datetime)",
+    fields.LOCAL_TIMESTAMP_MILLIS: "isinstance({value}, datetime.datetime)",
+    fields.LOCAL_TIMESTAMP_MICROS: "isinstance({value}, datetime.datetime)",
+    fields.DECIMAL: "isinstance({value}, decimal.Decimal)",
+    fields.UUID: "isinstance({value}, (uuid.UUID, str))",
+}
+
+# logical types whose arrays are converted at once before being written
+BATCH_LOGICAL_TYPES = {
+    fields.DATE: conversions.dates_to_days,
+    fields.TIME_MILLIS: conversions.times_to_millis,
+    fields.TIMESTAMP_MILLIS: conversions.datetimes_to_millis,
+    fields.TIME_MICROS: conversions.times_to_micros,
+    fields.TIMESTAMP_MICROS: conversions.datetimes_to_micros,
+}
+
+
+def _emit_null(writer: codegen.CodeWriter, value: str) -> None:
+    pass
+
+
+def _emit_boolean(writer: codegen.CodeWriter, value: str) -> None:
+    writer.line(f"buffer.append(1 if {value} else 0)")
+
+
+def _emit_varint(writer: codegen.CodeWriter, value: str, write: str) -> None:
+    # the values between -64 and 63 are encoded in one byte without a call,
+    # write checks the range of the others
+    writer.line(f"if -64 <= {value} < 64:")
+    with writer.indent():
+        writer.line(f"buffer.append(({value} << 1) ^ ({value} >> 63))")
+    writer.line("else:")
+    with writer.indent():
+        writer.line(f"{writer.use(write)}(buffer, {value})")
+
+
+def _emit_int(writer: codegen.CodeWriter, value: str) -> None:
+    _emit_varint(writer, value, "write_int")
+
+
+def _emit_long(writer: codegen.CodeWriter, value: str) -> None:
+    _emit_varint(writer, value, "write_long")
+
+
+def _emit_size(writer: codegen.CodeWriter, size: str) -> None:
+    # sizes are never negative, so the zig-zag encoding is size << 1
+    writer.line(f"if {size} < 64:")
+    with writer.indent():
+        writer.line(f"buffer.append({size} << 1)")
+    writer.line("else:")
+    with writer.indent():
+        writer.line(f"{writer.use('write_long')}(buffer, {size})")
+
+
+def _emit_float(writer: codegen.CodeWriter, value: str) -> None:
+    writer.line(f"buffer += {writer.use('pack_float')}({value})")
+
+
+def _emit_double(writer: codegen.CodeWriter, value: str) -> None:
+    writer.line(f"buffer += {writer.use('pack_double')}({value})")
+
+
+def _emit_bytes(writer: codegen.CodeWriter, value: str) -> None:
+    size = writer.variable("size")
+    writer.line(f"{size} = len({value})")
+    _emit_size(writer, size)
+    writer.line(f"buffer += {value}")
+
+
+def _emit_string(writer: codegen.CodeWriter, value: str) -> None:
+    encoded = writer.variable("encoded")
+    writer.line(f'{encoded} = {value}.encode("utf-8")')
+    _emit_bytes(writer, encoded)
+
+
+PRIMITIVE_EMITTERS: typing.Dict[str, codegen.Emitter] = {
+    fields.NULL: _emit_null,
+    fields.BOOLEAN: _emit_boolean,
+    fields.INT: _emit_int,
+    fields.LONG: _emit_long,
+    fields.FLOAT: _emit_float,
+    fields.DOUBLE: _emit_double,
+    fields.BYTES: _emit_bytes,
+    fields.STRING: _emit_string,
+}
+
+
+def _emit_index(writer: codegen.CodeWriter, index: int) -> None:
+    """
+    Write a constant long, for example the index of an union branch
+    """
+    if -64 <= index < 64:
+        writer.line(f"buffer.append({(index << 1) ^ (index >> 63)})")
+    else:
+        writer.line(f"{writer.use('write_long')}(buffer, {index})")
+
+
+class EncoderCompiler(codegen.SourceCompiler):
+    """
+    Generate the source of the encode functions of an avro schema.
+
+    Every record is translated to a function that reads the attributes of
+    an instance and appends their encoding to a buffer, without inspecting
+    the schema again.
+    """
+
+    prefix = "encode"
+    arguments = ("value", "buffer")
+    helpers = {
+        "write_int": binary.write_int,
+        "write_long": binary.write_long,
+        "pack_float": binary.pack_float,
+        "pack_double": binary.pack_double,
+        "BYTES_TYPES": BYTES_TYPES,
+        "datetime": datetime,
+        "decimal": decimal,
+        "uuid": uuid,
+    }
+
+    def compile_primitive(self, avro_type: str) -> codegen.Emitter:
+        return PRIMITIVE_EMITTERS[avro_type]
+
+    def call(self, function_name: str) -> codegen.Emitter:
+        def emit_call(writer: codegen.CodeWriter, value: str) -> None:
+            writer.line(f"{function_name}({value}, buffer)")
+
+        return emit_call
+
+    def write_record(
+        self,
+        writer: codegen.CodeWriter,
+        avro_type: typing.Dict,
+        namespace: typing.Optional[str],
+    ) -> None:
+        for field in avro_type["fields"]:
+            emit = self.compile(field["type"], namespace)
+            value = writer.variable()
+            writer.line(f"{value} = value.{field['name']}")
+            emit(writer, value)
+
+    def compile_enum(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        fullname, _ = self.register(avro_type, namespace)
+        name = avro_type["name"]
+        symbols = self.bind(
+            {symbol: index for index, symbol in enumerate(avro_type["symbols"])},
+            f"{name}_symbols",
+        )
+        message = f" is not a valid symbol of the enum {name}"
+
+        def emit_enum(writer: codegen.CodeWriter, value: str) -> None:
+            index = writer.variable("index")
+            writer.line("try:")
+            with writer.indent():
+                writer.line(f"{index} = {writer.use(symbols)}[{value}]")
+            writer.line("except (KeyError, TypeError):")
+            with writer.indent():
+                writer.line(f"raise ValueError(repr({value}) + {message!r})")
+            _emit_long(writer, index)
+
+        self.compiled_named_types[fullname] = emit_enum
+        return emit_enum
+
+    def compile_fixed(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        fullname, _ = self.register(avro_type, namespace)
+        size = int(avro_type["size"])
+        message = f"The fixed {avro_type['name']} must have {size} bytes"
+
+        def emit_fixed(writer: codegen.CodeWriter, value: str) -> None:
+            writer.line(f"if len({value}) != {size}:")
+            with writer.indent():
+                writer.line(f"raise ValueError({message!r})")
+            writer.line(f"buffer += {value}")
+
+        self.compiled_named_types[fullname] = emit_fixed
+        return emit_fixed
+
+    def compile_array(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        items_type = self.resolve(avro_type["items"], namespace)
+        convert = None
+
+        if isinstance(items_type, dict) and items_type.get("logicalType") in (
+            BATCH_LOGICAL_TYPES
+        ):
+            # the items are converted at once and written as plain integers
+            convert = self.bind(
+                BATCH_LOGICAL_TYPES[items_type["logicalType"]],
+                f"{items_type['logicalType']}_to_logical_types",
+            )
+            emit_item = self.compile(items_type["type"], namespace)
+        else:
+            emit_item = self.compile(avro_type["items"], namespace)
+
+        def emit_array(writer: codegen.CodeWriter, value: str) -> None:
+            item = writer.variable("item")
+            size = writer.variable("size")
+            items = value
+            writer.line(f"if {value}:")
+            with writer.indent():
+                writer.line(f"{size} = len({value})")
+                _emit_size(writer, size)
+                if convert is not None:
+                    items = writer.variable("items")
+                    writer.line(f"{items} = {writer.use(convert)}({value})")
+                writer.line(f"for {item} in {items}:")
+                with writer.indent():
+                    emit_item(writer, item)
+            writer.line("buffer.append(0)")
+
+        return emit_array
+
+    def compile_map(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        emit_value = self.compile(avro_type["values"], namespace)
+
+        def emit_map(writer: codegen.CodeWriter, value: str) -> None:
+            key = writer.variable("key")
+            item = writer.variable("item")
+            size = writer.variable("size")
+            writer.line(f"if {value}:")
+            with writer.indent():
+                writer.line(f"{size} = len({value})")
+                _emit_size(writer, size)
+                writer.line(f"for {key}, {item} in {value}.items():")
+                with writer.indent():
+                    _emit_string(writer, key)
+                    emit_value(writer, item)
+            writer.line("buffer.append(0)")
+
+        return emit_map
+
+    def compile_logical_type(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        logical_type = avro_type["logicalType"]
+        to_logical_type, _ = compiler.get_logical_conversions(avro_type)
+        to_logical_type = self.bind(to_logical_type, f"{logical_type}_to_logical_type")
+        emit = self.compile(compiler.get_underlying_type(avro_type), namespace)
+
+        def emit_logical_type(writer: codegen.CodeWriter, value: str) -> None:
+            converted = writer.variable("converted")
+            writer.line(f"{converted} = {writer.use(to_logical_type)}({value})")
+            emit(writer, converted)
+
+        return emit_logical_type
+
+    def compile_union(
+        self, avro_type: typing.List, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        branches = [
+            (
+                self.get_predicate(element, namespace),
+                self.compile(element, namespace),
+            )
+            for element in avro_type
+        ]
+        message = f" does not match any type of the union {avro_type}"
+
+        def emit_union(writer: codegen.CodeWriter, value: str) -> None:
+            for index, (predicate, emit) in enumerate(branches):
+                keyword = "elif" if index else "if"
+                writer.line(f"{keyword} {predicate(writer, value)}:")
+                with writer.indent():
+                    _emit_index(writer, index)
+                    emit(writer, value)
+
+            writer.line("else:")
+            with writer.indent():
+                writer.line(f"raise ValueError(repr({value}) + {message!r})")
+
+        return emit_union
+
+    def get_predicate(
+        self, avro_type: typing.Any, namespace: typing.Optional[str]
+    ) -> typing.Callable[[codegen.CodeWriter, str], str]:
+        """
+        Return a function that builds the expression that checks if a python
+        value should be encoded using avro_type when it is a branch of an union.
+        """
+        if isinstance(avro_type, str) and avro_type in PRIMITIVE_PREDICATES:
+            return self.format_predicate(PRIMITIVE_PREDICATES[avro_type])
+
+        avro_type = self.resolve(avro_type, namespace)
+
+        if isinstance(avro_type, list):
+            raise ValueError("Unions can not contain other unions")
+
+        type_name = avro_type["type"]
+        logical_type = avro_type.get("logicalType")
+
+        if logical_type in LOGICAL_PREDICATES:
+            return self.format_predicate(LOGICAL_PREDICATES[logical_type])
+        elif type_name == fields.RECORD:
+            klass = self.get_record_class(avro_type, namespace)
+            name = self.bind(klass, klass.__name__)
+            return self.format_predicate(f"isinstance({{value}}, {name})", name)
+        elif type_name == fields.ENUM:
+            name = self.bind(frozenset(avro_type["symbols"]), avro_type["name"])
+            return self.format_predicate(
+                f"isinstance({{value}}, str) and {{value}} in {name}", name
+            )
+        elif type_name == fields.FIXED:
+            return self.format_predicate(
+                "isinstance({value}, BYTES_TYPES)"
+                f" and len({{value}}) == {int(avro_type['size'])}"
+            )
+        elif type_name == fields.ARRAY:
+            return self.format_predicate("isinstance({value}, (list, tuple))")
+        elif type_name == fields.MAP:
+            return self.format_predicate("isinstance({value}, dict)")
+
+        return self.get_predicate(type_name, namespace)
+
+    @staticmethod
+    def format_predicate(
+        expression: str, *names: str
+    ) -> typing.Callable[[codegen.CodeWriter, str], str]:
+        def predicate(writer: codegen.CodeWriter, value: str) -> str:
+            for name in names:
+                writer.use(name)
+            return expression.format(value=value)
+
+        return predicate
+
+
+@functools.lru_cache(maxsize=None)
+def compile_encoder(klass: typing.Any) -> EncodeFunction:
+    """
+    Return the encode function of a class. Its source is generated and
+    compiled once per class, and it is available in the __source__ attribute.
+
+    Arguments:
+        klass (typing.Any): dataclass, python class or faust.Record
+
+    Returns:
+        typing.Callable: function that appends the avro binary encoding
+            of an instance to a bytearray
+    """
+    schema_generator = SchemaGenerator(klass)
+    encoder_compiler = EncoderCompiler(schema_generator.get_record_classes())
+
+    return encoder_compiler.build(
+        schema_generator.avro_schema_to_python(), klass.__name__
+    )
+
+
+schema_cache.add_invalidate_callback(compile_encoder.cache_clear)
+
+
+class BinaryEncoder:
+    """
+    Encode instances of a class using the avro binary encoding.
+
+    The encoder reads the attributes of the instances directly, without
+    converting them to dicts, and writes to a buffer reused between calls,
+    so an encoder instance must not be shared between threads.
+
+    Arguments:
+        klass (typing.Any): dataclass, python class or faust.Record
+    """
+
+    def __init__(self, klass: typing.Any) -> None:
+        self.klass = klass
+        self._encode = compile_encoder(klass)
+        self._buffer = bytearray()
+
+    @property
+    def source(self) -> str:
+        """
+        Return the generated python source of the encoder, for inspection
+        """
+        return self._encode.__source__
+
+    def encode(self, instance: typing.Any) -> bytes:
+        """
+        Return the avro binary encoding of instance
+        """
+        buffer = self._buffer
+        del buffer[:]
+        self._encode(instance, buffer)
+
+        return bytes(buffer)
+
+    def encode_into(self, instance: typing.Any, buffer: bytearray) -> None:
+        """
+        Append the avro binary encoding of instance to buffer
+        """
+        self._encode(instance, buffer)
+
+    def encode_many(self, instances: typing.Iterable[typing.Any]) -> bytes:
+        """
+        Return the avro binary encoding of all the instances, one after
+        the other (the layout of an Object Container File data block)
+        """
+        buffer = self._buffer
+        del buffer[:]
+        encode = self._encode
+
+        for instance in instances:
+            encode(instance, buffer)
+
+        return bytes(buffer)
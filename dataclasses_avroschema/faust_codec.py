@@ -0,0 +1,88 @@
+import types
+import typing
+
+from faust.serializers import codecs
+
+from dataclasses_avroschema.confluent import (
+    ConfluentDeserializer,
+    ConfluentSerializer,
+    SchemaRegistry,
+)
+from dataclasses_avroschema.decoder import BinaryDecoder
+from dataclasses_avroschema.encoder import BinaryEncoder
+
+
+class AvroCodec(codecs.Codec):
+    """
+    Faust codec that writes the instances of a faust.Record class with the
+    avro binary encoding, without the dictionaries and the json of the
+    default codecs.
+
+    The schema of the class is generated once and the encoder and decoder
+    are compiled once per class, see compile_encoder and compile_decoder.
+    The decoded values are instances of the class, which faust uses as they
+    are. With a registry the messages have the Confluent wire format, and
+    the messages written with other versions of the schema are resolved.
+
+    Arguments:
+        record_class (typing.Any): faust.Record, dataclass or python class
+        registry (SchemaRegistry): registry of the schemas, to frame the
+            messages with the schema id
+        subject (str): subject of the schema in the registry, the full name
+            of the record by default
+    """
+
+    def __init__(
+        self,
+        record_class: typing.Any,
+        registry: typing.Optional[SchemaRegistry] = None,
+        subject: typing.Optional[str] = None,
+        children: typing.Optional[typing.Tuple[codecs.CodecT, ...]] = None,
+        **kwargs: typing.Any,
+    ) -> None:
+        # the arguments are kept in kwargs to clone the codec, see Codec.clone
+        super().__init__(
+            children,
+            record_class=record_class,
+            registry=registry,
+            subject=subject,
+            **kwargs,
+        )
+        self.record_class = record_class
+
+        if registry is None:
+            self.encode = BinaryEncoder(record_class).encode
+            self.decode = BinaryDecoder(record_class).decode
+        else:
+            self.encode = ConfluentSerializer(record_class, registry, subject).serialize
+            self.decode = ConfluentDeserializer(record_class, registry).deserialize
+
+    def _dumps(self, obj: typing.Any) -> bytes:
+        if isinstance(obj, dict):
+            # faust.Record.dumps passes the fields of the record in a dictionary,
+            # the nested records are still instances, see Record.to_representation
+            obj = types.SimpleNamespace(**obj)
+        return self.encode(obj)
+
+    def _loads(self, s: bytes) -> typing.Any:
+        return self.decode(s)
+
+
+def register_codec(
+    name: str,
+    record_class: typing.Any,
+    registry: typing.Optional[SchemaRegistry] = None,
+    subject: typing.Optional[str] = None,
+) -> AvroCodec:
+    """
+    Register an AvroCodec in the faust codecs, so the topics and the records
+    can use it by name, for example app.topic("users", value_type=User,
+    value_serializer="avro-users").
+
+    Returns:
+        AvroCodec: the registered codec
+    """
+    codec = AvroCodec(record_class, registry=registry, subject=subject)
+    codecs.register(name, codec)
+
+    return codec
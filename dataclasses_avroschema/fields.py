@@ -2,21 +2,22 @@ import abc
 import collections
 import dataclasses
 import datetime
+import functools
 import json
 import typing
 import uuid
 from collections import OrderedDict
 
-import inflect
+from dataclasses_avroschema import conversions, schema_generator, types, utils
 
-from dataclasses_avroschema import schema_generator, types, utils
-
-p = inflect.engine()
+# created the first time that a singular name is needed, see get_inflect_engine
+_inflect_engine = None
 
 BOOLEAN = "boolean"
 NULL = "null"
 INT = "int"
 FLOAT = "float"
+DOUBLE = "double"
 LONG = "long"
 BYTES = "bytes"
 STRING = "string"
@@ -24,15 +25,24 @@ ARRAY = "array"
 ENUM = "enum"
 MAP = "map"
 FIXED = "fixed"
+RECORD = "record"
 DATE = "date"
 TIME_MILLIS = "time-millis"
 TIMESTAMP_MILLIS = "timestamp-millis"
+TIME_MICROS = "time-micros"
+TIMESTAMP_MICROS = "timestamp-micros"
+LOCAL_TIMESTAMP_MILLIS = "local-timestamp-millis"
+LOCAL_TIMESTAMP_MICROS = "local-timestamp-micros"
+DECIMAL = "decimal"
 UUID = "uuid"
 LOGICAL_DATE = {"type": INT, "logicalType": DATE}
 LOGICAL_TIME = {"type": INT, "logicalType": TIME_MILLIS}
 LOGICAL_DATETIME = {"type": LONG, "logicalType": TIMESTAMP_MILLIS}
 LOGICAL_UUID = {"type": STRING, "logicalType": UUID}
 
+EPOCH_DATETIME = conversions.EPOCH_DATETIME
+EPOCH_DATE_ORDINAL = conversions.EPOCH_DATE_ORDINAL
+
 PYTHON_TYPE_TO_AVRO = {
     bool: BOOLEAN,
     type(None): NULL,
@@ -47,6 +57,11 @@ PYTHON_TYPE_TO_AVRO = {
     datetime.date: {"type": INT, "logicalType": DATE},
     datetime.time: {"type": INT, "logicalType": TIME_MILLIS},
     datetime.datetime: {"type": LONG, "logicalType": TIMESTAMP_MILLIS},
+    types.TimeMicros: {"type": LONG, "logicalType": TIME_MICROS},
+    types.TimestampMicros: {"type": LONG, "logicalType": TIMESTAMP_MICROS},
+    types.LocalTimestampMillis: {"type": LONG, "logicalType": LOCAL_TIMESTAMP_MILLIS},
+    types.LocalTimestampMicros: {"type": LONG, "logicalType": LOCAL_TIMESTAMP_MICROS},
+    types.Decimal: {"type": BYTES, "logicalType": DECIMAL},
     uuid.uuid4: {"type": STRING, "logicalType": UUID},
 }
 
@@ -55,7 +70,20 @@ PYTHON_INMUTABLE_TYPES = (str, int, bool, float, bytes, type(None))
 
 PYTHON_PRIMITIVE_CONTAINERS = (list, tuple, dict)
 
-PYTHON_LOGICAL_TYPES = (datetime.date, datetime.time, datetime.datetime, uuid.uuid4)
+# the values of these annotations are instances of the datetime types
+PYTHON_LOGICAL_ANNOTATIONS = (
+    types.TimeMicros,
+    types.TimestampMicros,
+    types.LocalTimestampMillis,
+    types.LocalTimestampMicros,
+)
+
+PYTHON_LOGICAL_TYPES = (
+    datetime.date,
+    datetime.time,
+    datetime.datetime,
+    uuid.uuid4,
+) + PYTHON_LOGICAL_ANNOTATIONS
 
 PYTHON_PRIMITIVE_TYPES = PYTHON_INMUTABLE_TYPES + PYTHON_PRIMITIVE_CONTAINERS
 
@@ -64,6 +92,26 @@ PRIMITIVE_AND_LOGICAL_TYPES = PYTHON_INMUTABLE_TYPES + PYTHON_LOGICAL_TYPES
 PythonPrimitiveTypes = typing.Union[str, int, bool, float, list, tuple, dict]
 
 
+def get_inflect_engine():
+    global _inflect_engine
+
+    if _inflect_engine is None:
+        import inflect
+
+        _inflect_engine = inflect.engine()
+
+    return _inflect_engine
+
+
+@functools.lru_cache(maxsize=None)
+def singular_name(name: str) -> str:
+    singular = get_inflect_engine().singular_noun(name)
+
+    if singular:
+        return singular
+    return name
+
+
 @dataclasses.dataclass
 class BaseField:
     avro_type: typing.ClassVar
@@ -81,11 +129,7 @@ class BaseField:
 
     @staticmethod
     def get_singular_name(name):
-        singular = p.singular_noun(name)
-
-        if singular:
-            return singular
-        return name
+        return singular_name(name)
 
     def get_metadata(self) -> typing.List[typing.Tuple[str, str]]:
         meta_data_for_template = []
@@ -145,7 +189,7 @@ class BaseField:
         return json.dumps(self.render(), indent=2)
 
     def to_dict(self) -> dict:
-        return json.loads(self.to_json())
+        return utils.to_python(self.render())
 
     @abc.abstractmethod
     def get_avro_type(self):
@@ -244,14 +288,7 @@ class ListField(ContainerField):
                 default, list
             ), f"List is required as default for field {self.name}"
 
-            logical_classes = LOGICAL_TYPES_FIELDS_CLASSES.keys()
-
-            return [
-                LOGICAL_TYPES_FIELDS_CLASSES[type(item)].to_logical_type(item)
-                if type(item) in logical_classes
-                else item
-                for item in default
-            ]
+            return to_logical_values(default, self.type.__args__[0])
 
     def generate_items_type(self):
         # because avro can have only one type, we take the first one
@@ -271,9 +308,7 @@ class ListField(ContainerField):
             )
         else:
             # Is Avro Record Type
-            self.items_type = schema_generator.SchemaGenerator(
-                items_type
-            ).avro_schema_to_python()
+            self.items_type = schema_generator.SchemaGenerator(items_type).render()
 
 
 @dataclasses.dataclass
@@ -299,14 +334,8 @@ class DictField(ContainerField):
                 default, dict
             ), f"Dict is required as default for field {self.name}"
 
-            logical_classes = LOGICAL_TYPES_FIELDS_CLASSES.keys()
-
-            return {
-                key: LOGICAL_TYPES_FIELDS_CLASSES[type(value)].to_logical_type(value)
-                if type(value) in logical_classes
-                else value
-                for key, value in default.items()
-            }
+            values = to_logical_values(list(default.values()), self.type.__args__[1])
+            return dict(zip(default, values))
 
     def generate_values_type(self):
         """
@@ -322,9 +351,7 @@ class DictField(ContainerField):
             # Checking for a self reference. Maybe is a typing.ForwardRef
             self.values_type = self._get_self_reference_type(values_type)
         else:
-            self.values_type = schema_generator.SchemaGenerator(
-                values_type
-            ).avro_schema_to_python()
+            self.values_type = schema_generator.SchemaGenerator(values_type).render()
 
 
 @dataclasses.dataclass
@@ -362,9 +389,7 @@ class UnionField(BaseField):
                 klass = PRIMITIVE_LOGICAL_TYPES_FIELDS_CLASSES[element]
                 union_element = klass.avro_type
             else:
-                union_element = schema_generator.SchemaGenerator(
-                    element
-                ).avro_schema_to_python()
+                union_element = schema_generator.SchemaGenerator(element).render()
 
             unions.append(union_element)
 
@@ -440,26 +465,11 @@ class DateField(LogicalTypeField):
                 return NULL
 
             if self.validate_default():
-                # Convert to datetime and get the amount of days
                 return self.to_logical_type(self.default)
 
-    @staticmethod
-    def to_logical_type(date):
-        """
-        Convert to datetime and get the amount of days
-        from the unix epoch, 1 January 1970 (ISO calendar)
-        for a given date
-
-        Arguments:
-            date (datetime.date)
-
-        Returns:
-            int
-        """
-        date_time = datetime.datetime.combine(date, datetime.datetime.min.time())
-        ts = (date_time - datetime.datetime(1970, 1, 1)).total_seconds()
-
-        return int(ts / (3600 * 24))
+    # the conversions are exact integer arithmetic, see the conversions module
+    to_logical_type = staticmethod(conversions.date_to_days)
+    from_logical_type = staticmethod(conversions.days_to_date)
 
 
 @dataclasses.dataclass
@@ -483,28 +493,31 @@ class TimeField(LogicalTypeField):
             if self.validate_default():
                 return self.to_logical_type(self.default)
 
-    @staticmethod
-    def to_logical_type(time):
-        """
-        Returns the number of milliseconds after midnight, 00:00:00.000
-        for a given time object
+    def validate_default(self):
+        msg = f"Invalid default type. Default should be {datetime.time}"
+        assert isinstance(self.default, datetime.time), msg
 
-        Arguments:
-            time (datetime.time)
+        return True
 
-        Returns:
-            int
-        """
-        hour, minutes, seconds, microseconds = (
-            time.hour,
-            time.minute,
-            time.second,
-            time.microsecond,
-        )
+    to_logical_type = staticmethod(conversions.time_to_millis)
+    from_logical_type = staticmethod(conversions.millis_to_time)
 
-        return int(
-            (((hour * 60 + minutes) * 60 + seconds) * 1000) + (microseconds / 1000)
-        )
+
+@dataclasses.dataclass
+class TimeMicrosField(TimeField):
+    """
+    The time-micros logical type represents a time of day,
+    with no reference to a particular calendar,
+    time zone or date, with a precision of one microsecond.
+
+    A time-micros logical type annotates an Avro long,
+    where the long stores the number of microseconds after midnight, 00:00:00.000000.
+    """
+
+    avro_type: typing.ClassVar = {"type": LONG, "logicalType": TIME_MICROS}
+
+    to_logical_type = staticmethod(conversions.time_to_micros)
+    from_logical_type = staticmethod(conversions.micros_to_time)
 
 
 @dataclasses.dataclass
@@ -528,20 +541,106 @@ class DatetimeField(LogicalTypeField):
             if self.validate_default():
                 return self.to_logical_type(self.default)
 
-    @staticmethod
-    def to_logical_type(date_time):
-        """
-        Returns the number of milliseconds from the unix epoch,
-        1 January 1970 00:00:00.000 UTC for a given datetime
+    def validate_default(self):
+        msg = f"Invalid default type. Default should be {datetime.datetime}"
+        assert isinstance(self.default, datetime.datetime), msg
 
-        Arguments:
-            date_time (datetime.datetime)
+        return True
 
-        Returns:
-            float
-        """
-        ts = (date_time - datetime.datetime(1970, 1, 1)).total_seconds()
-        return ts * 1000
+    to_logical_type = staticmethod(conversions.datetime_to_millis)
+    from_logical_type = staticmethod(conversions.millis_to_datetime)
+
+
+@dataclasses.dataclass
+class DatetimeMicrosField(DatetimeField):
+    """
+    The timestamp-micros logical type represents an instant on the global timeline,
+    independent of a particular time zone or calendar, with a precision of one microsecond.
+
+    A timestamp-micros logical type annotates an Avro long,
+    where the long stores the number of microseconds from the unix epoch,
+    1 January 1970 00:00:00.000000 UTC.
+    """
+
+    avro_type: typing.ClassVar = {"type": LONG, "logicalType": TIMESTAMP_MICROS}
+
+    to_logical_type = staticmethod(conversions.datetime_to_micros)
+    from_logical_type = staticmethod(conversions.micros_to_datetime)
+
+
+@dataclasses.dataclass
+class LocalDatetimeField(DatetimeField):
+    """
+    The local-timestamp-millis logical type represents a timestamp in a local
+    timezone, regardless of what specific time zone is considered local,
+    with a precision of one millisecond.
+
+    A local-timestamp-millis logical type annotates an Avro long,
+    where the long stores the number of milliseconds from 1 January 1970 00:00:00.000.
+    """
+
+    avro_type: typing.ClassVar = {"type": LONG, "logicalType": LOCAL_TIMESTAMP_MILLIS}
+
+    to_logical_type = staticmethod(conversions.local_datetime_to_millis)
+    from_logical_type = staticmethod(conversions.millis_to_datetime)
+
+
+@dataclasses.dataclass
+class LocalDatetimeMicrosField(DatetimeField):
+    """
+    The local-timestamp-micros logical type represents a timestamp in a local
+    timezone, regardless of what specific time zone is considered local,
+    with a precision of one microsecond.
+
+    A local-timestamp-micros logical type annotates an Avro long,
+    where the long stores the number of microseconds from 1 January 1970 00:00:00.000000.
+    """
+
+    avro_type: typing.ClassVar = {"type": LONG, "logicalType": LOCAL_TIMESTAMP_MICROS}
+
+    to_logical_type = staticmethod(conversions.local_datetime_to_micros)
+    from_logical_type = staticmethod(conversions.micros_to_datetime)
+
+
+@dataclasses.dataclass
+class DecimalField(LogicalTypeField):
+    """
+    The decimal logical type represents an arbitrary-precision signed decimal
+    number of the form unscaled × 10^-scale.
+
+    A decimal logical type annotates Avro bytes or fixed types, which store the
+    two's-complement representation of the unscaled integer in big-endian byte order.
+    The precision, the scale and the size of the fixed are in the default value,
+    for example types.Decimal(10, 2).
+    """
+
+    avro_type: typing.ClassVar = {"type": BYTES, "logicalType": DECIMAL}
+
+    def get_avro_type(self):
+        decimal_type = self.default
+        avro_type = {"type": BYTES}
+
+        if decimal_type.size is not None:
+            avro_type = {
+                "type": FIXED,
+                "name": self.get_singular_name(self.name),
+                "size": int(decimal_type.size),
+            }
+
+            if decimal_type.namespace is not None:
+                avro_type["namespace"] = decimal_type.namespace
+
+            if decimal_type.aliases is not None:
+                avro_type["aliases"] = decimal_type.aliases
+
+        avro_type["logicalType"] = DECIMAL
+        avro_type["precision"] = decimal_type.precision
+        avro_type["scale"] = decimal_type.scale
+
+        return avro_type
+
+    def get_default_value(self):
+        return
 
 
 @dataclasses.dataclass
@@ -566,11 +665,15 @@ class UUIDField(LogicalTypeField):
     def to_logical_type(uuid4):
         return str(uuid4)
 
+    @staticmethod
+    def from_logical_type(value):
+        return uuid.UUID(value)
+
 
 @dataclasses.dataclass
 class RecordField(BaseField):
     def get_avro_type(self):
-        return schema_generator.SchemaGenerator(self.type).avro_schema_to_python()
+        return schema_generator.SchemaGenerator(self.type).render()
 
 
 INMUTABLE_FIELDS_CLASSES = {
@@ -597,6 +700,10 @@ LOGICAL_TYPES_FIELDS_CLASSES = {
     datetime.date: DateField,
     datetime.time: TimeField,
     datetime.datetime: DatetimeField,
+    types.TimeMicros: TimeMicrosField,
+    types.TimestampMicros: DatetimeMicrosField,
+    types.LocalTimestampMillis: LocalDatetimeField,
+    types.LocalTimestampMicros: LocalDatetimeMicrosField,
     uuid.uuid4: UUIDField,
     uuid.UUID: UUIDField,
 }
@@ -608,6 +715,42 @@ PRIMITIVE_LOGICAL_TYPES_FIELDS_CLASSES = {
 }
 
 
+def to_logical_values(
+    values: typing.List, items_type: typing.Any = None
+) -> typing.List:
+    """
+    Convert the python values of the logical types in a list of default
+    values. When all the values have the same type they are converted at
+    once, see conversions.BATCH_CONVERSIONS.
+
+    The values of the annotations like types.TimestampMicros are plain
+    datetimes, so items_type, the annotation of the values, chooses
+    their conversion.
+    """
+    if items_type in PYTHON_LOGICAL_ANNOTATIONS:
+        convert = conversions.BATCH_CONVERSIONS.get(items_type)
+        if convert is None:
+            convert = LOGICAL_TYPES_FIELDS_CLASSES[items_type].to_logical_type
+            return [convert(value) for value in values]
+        return convert(values)
+
+    value_types = set(map(type, values))
+
+    if len(value_types) == 1:
+        convert = conversions.BATCH_CONVERSIONS.get(value_types.pop())
+        if convert is not None:
+            return convert(values)
+
+    return [
+        (
+            LOGICAL_TYPES_FIELDS_CLASSES[type(value)].to_logical_type(value)
+            if type(value) in LOGICAL_TYPES_FIELDS_CLASSES
+            else value
+        )
+        for value in values
+    ]
+
+
 FieldType = typing.Union[
     StringField,
     BooleanField,
@@ -624,6 +767,11 @@ FieldType = typing.Union[
     DateField,
     TimeField,
     DatetimeField,
+    TimeMicrosField,
+    DatetimeMicrosField,
+    LocalDatetimeField,
+    LocalDatetimeMicrosField,
+    DecimalField,
     UUIDField,
     RecordField,
 ]
@@ -647,6 +795,10 @@ def field_factory(
         return FixedField(
             name=name, type=native_type, default=default, metadata=metadata
         )
+    elif native_type is types.Decimal:
+        return DecimalField(
+            name=name, type=native_type, default=default, metadata=metadata
+        )
     elif isinstance(native_type, typing._GenericAlias):
         origin = native_type.__origin__
 
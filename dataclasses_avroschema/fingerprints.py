@@ -0,0 +1,200 @@
+import hashlib
+import json
+import typing
+
+from dataclasses_avroschema import fields, named_types
+
+CRC_64_AVRO = "CRC-64-AVRO"
+MD5 = "MD5"
+SHA_256 = "SHA-256"
+
+FINGERPRINT_ALGORITHMS = (CRC_64_AVRO, MD5, SHA_256)
+
+# attributes kept by the Parsing Canonical Form, in the order they are written
+CANONICAL_ATTRIBUTES = ("name", "type", "fields", "symbols", "items", "values", "size")
+
+# attributes that change the meaning of the values, kept by resolution_form
+LOGICAL_ATTRIBUTES = ("logicalType", "precision", "scale")
+
+PRIMITIVE_TYPES = (
+    "null",
+    "boolean",
+    "int",
+    "long",
+    "float",
+    "double",
+    "bytes",
+    "string",
+)
+
+CRC_64_AVRO_EMPTY = 0xC15D213AA4D7A795
+
+
+def _crc_64_avro_table() -> typing.List[int]:
+    table = []
+    for index in range(256):
+        fp = index
+        for _ in range(8):
+            fp = (fp >> 1) ^ (CRC_64_AVRO_EMPTY & -(fp & 1))
+        table.append(fp)
+    return table
+
+
+CRC_64_AVRO_TABLE = _crc_64_avro_table()
+
+
+def crc_64_avro(data: bytes) -> int:
+    """
+    Compute the 64 bits Rabin fingerprint defined by the Avro specification.
+
+    Arguments:
+        data (bytes)
+
+    Returns:
+        int
+    """
+    table = CRC_64_AVRO_TABLE
+    fp = CRC_64_AVRO_EMPTY
+
+    for byte in data:
+        fp = (fp >> 8) ^ table[(fp ^ byte) & 0xFF]
+
+    return fp
+
+
+def parsing_canonical_form(schema: typing.Any) -> str:
+    """
+    Return the Avro Parsing Canonical Form of a schema.
+
+    Primitive types are written in their simple form, named types use their
+    full names and are written only the first time, attributes that are not
+    relevant for parsing (doc, aliases, default, logicalType...) are removed
+    and the rest are written in the canonical order without whitespaces.
+
+    Arguments:
+        schema (typing.Any): schema as python structures (dicts, lists, str)
+
+    Returns:
+        str
+    """
+    canonical = _canonical(schema, None, set())
+    return json.dumps(canonical, separators=(",", ":"), ensure_ascii=False)
+
+
+def resolution_form(schema: typing.Any) -> str:
+    """
+    Return the Parsing Canonical Form of a schema with the logical type
+    attributes (logicalType, precision and scale).
+
+    Two schemas with the same Parsing Canonical Form can read each other's
+    data, but the values mean the same only if they have the same resolution
+    form: timestamp-millis and timestamp-micros are both a long.
+
+    Arguments:
+        schema (typing.Any): schema as python structures (dicts, lists, str)
+
+    Returns:
+        str
+    """
+    canonical = _canonical(schema, None, set(), logical=True)
+    return json.dumps(canonical, separators=(",", ":"), ensure_ascii=False)
+
+
+def _canonical(
+    avro_type: typing.Any,
+    namespace: typing.Optional[str],
+    defined: typing.Set[str],
+    logical: bool = False,
+) -> typing.Any:
+    if isinstance(avro_type, list):
+        return [
+            _canonical(element, namespace, defined, logical) for element in avro_type
+        ]
+
+    if isinstance(avro_type, str):
+        if avro_type in PRIMITIVE_TYPES:
+            return avro_type
+        return named_types.get_fullname(avro_type, namespace)
+
+    type_name = avro_type["type"]
+
+    if logical and "logicalType" in avro_type and type_name in PRIMITIVE_TYPES:
+        return _logical_attributes(avro_type, {"type": type_name})
+
+    if type_name in PRIMITIVE_TYPES or isinstance(type_name, (dict, list)):
+        # logical types and types wrapped in a dict
+        return _canonical(type_name, namespace, defined, logical)
+
+    result = {}
+
+    if type_name in (fields.RECORD, fields.ENUM, fields.FIXED):
+        fullname = named_types.get_fullname(
+            avro_type["name"], avro_type.get("namespace", namespace)
+        )
+        if fullname in defined:
+            return fullname
+        defined.add(fullname)
+
+        result["name"] = fullname
+        namespace = fullname.rpartition(".")[0] or None
+
+    for attribute in CANONICAL_ATTRIBUTES[1:]:
+        if attribute not in avro_type:
+            continue
+
+        value = avro_type[attribute]
+
+        if attribute == "fields":
+            value = [
+                {
+                    "name": field["name"],
+                    "type": _canonical(field["type"], namespace, defined, logical),
+                }
+                for field in value
+            ]
+        elif attribute in ("items", "values"):
+            value = _canonical(value, namespace, defined, logical)
+        elif attribute == "size":
+            value = int(value)
+
+        result[attribute] = value
+
+    if logical and "logicalType" in avro_type:
+        return _logical_attributes(avro_type, result)
+
+    return result
+
+
+def _logical_attributes(avro_type: typing.Dict, result: typing.Dict) -> typing.Dict:
+    for attribute in LOGICAL_ATTRIBUTES:
+        if attribute in avro_type:
+            result[attribute] = avro_type[attribute]
+    return result
+
+
+def fingerprint(canonical_form: str, algorithm: str = CRC_64_AVRO) -> str:
+    """
+    Return the fingerprint of a Parsing Canonical Form as an hex string.
+    The CRC-64-AVRO fingerprint is written in little-endian byte order,
+    like in the Single Object Encoding.
+
+    Arguments:
+        canonical_form (str): the Parsing Canonical Form of a schema
+        algorithm (str): CRC-64-AVRO, MD5 or SHA-256
+
+    Returns:
+        str
+    """
+    data = canonical_form.encode("utf-8")
+
+    if algorithm == CRC_64_AVRO:
+        return crc_64_avro(data).to_bytes(8, "little").hex()
+    elif algorithm == MD5:
+        return hashlib.md5(data).hexdigest()
+    elif algorithm == SHA_256:
+        return hashlib.sha256(data).hexdigest()
+
+    raise ValueError(
+        f"Invalid fingerprint algorithm {algorithm}. "
+        f"Expected one of {', '.join(FINGERPRINT_ALGORITHMS)}"
+    )
@@ -0,0 +1,583 @@
+import datetime
+import decimal
+import functools
+import json
+import typing
+import uuid
+
+from dataclasses_avroschema import codegen, compiler, encoder, fields, named_types
+from dataclasses_avroschema.cache import schema_cache
+from dataclasses_avroschema.decoder import can_set_attributes
+from dataclasses_avroschema.schema_generator import SchemaGenerator
+
+JsonEncodeFunction = typing.Callable[[typing.Any, typing.List[str]], None]
+JsonDecodeFunction = typing.Callable[[typing.Any], typing.Any]
+
+# repr of the floats that are not valid json numbers, written like json.dumps
+FLOAT_CONSTANTS = {"nan": "NaN", "inf": "Infinity", "-inf": "-Infinity"}
+
+
+def _emit_null(writer: codegen.CodeWriter, value: str) -> None:
+    writer.line('parts.append("null")')
+
+
+def _emit_boolean(writer: codegen.CodeWriter, value: str) -> None:
+    writer.line(f'parts.append("true" if {value} else "false")')
+
+
+def _emit_long(writer: codegen.CodeWriter, value: str) -> None:
+    # int.__repr__ writes booleans as numbers and rejects floats
+    writer.line(f"parts.append({writer.use('int_repr')}({value}))")
+
+
+def _emit_double(writer: codegen.CodeWriter, value: str) -> None:
+    text = writer.variable("text")
+    writer.line(f"{text} = repr(float({value}))")
+    # only the repr of nan and infinity end with a letter
+    writer.line(f'if {text}[-1] in "fn":')
+    with writer.indent():
+        writer.line(f"{text} = {writer.use('FLOAT_CONSTANTS')}[{text}]")
+    writer.line(f"parts.append({text})")
+
+
+def _emit_bytes(writer: codegen.CodeWriter, value: str) -> None:
+    # the bytes are written as the string with the code points of each byte
+    writer.line(f"parts.append({writer.use('encode_string')}(str({value}, 'latin-1')))")
+
+
+def _emit_string(writer: codegen.CodeWriter, value: str) -> None:
+    writer.line(f"parts.append({writer.use('encode_string')}({value}))")
+
+
+ENCODE_EMITTERS: typing.Dict[str, codegen.Emitter] = {
+    fields.NULL: _emit_null,
+    fields.BOOLEAN: _emit_boolean,
+    fields.INT: _emit_long,
+    fields.LONG: _emit_long,
+    fields.FLOAT: _emit_double,
+    fields.DOUBLE: _emit_double,
+    fields.BYTES: _emit_bytes,
+    fields.STRING: _emit_string,
+}
+
+
+def _emit_constant(writer: codegen.CodeWriter, text: str) -> None:
+    writer.line(f"parts.append({text!r})")
+
+
+def _emit_closing(writer: codegen.CodeWriter, value: str, closing: str) -> None:
+    """
+    Close an array or a map, replacing the separator after its last item
+    """
+    writer.line(f"if {value}:")
+    with writer.indent():
+        writer.line(f"parts[-1] = {closing!r}")
+    writer.line("else:")
+    with writer.indent():
+        _emit_constant(writer, closing)
+
+
+def _emit_nothing(writer: codegen.CodeWriter, target: str) -> None:
+    pass
+
+
+def _emit_to_float(writer: codegen.CodeWriter, target: str) -> None:
+    # integral numbers can be written without a decimal point
+    writer.line(f"{target} = float({target})")
+
+
+def _emit_to_bytes(writer: codegen.CodeWriter, target: str) -> None:
+    writer.line(f"{target} = {target}.encode('latin-1')")
+
+
+# the values parsed by json.loads are already the python values of null,
+# boolean, int, long and string
+DECODE_EMITTERS: typing.Dict[str, codegen.Emitter] = {
+    fields.NULL: _emit_nothing,
+    fields.BOOLEAN: _emit_nothing,
+    fields.INT: _emit_nothing,
+    fields.LONG: _emit_nothing,
+    fields.FLOAT: _emit_to_float,
+    fields.DOUBLE: _emit_to_float,
+    fields.BYTES: _emit_to_bytes,
+    fields.STRING: _emit_nothing,
+}
+
+
+def get_branch_name(
+    schema_compiler: compiler.SchemaCompiler,
+    avro_type: typing.Any,
+    namespace: typing.Optional[str],
+) -> str:
+    """
+    Return the name that tags the values of a branch of an union in the json
+    encoding: the full name of the named types and the name of the others.
+    """
+    if isinstance(avro_type, str):
+        if avro_type in compiler.PRIMITIVE_TYPES:
+            return avro_type
+        fullname, _ = schema_compiler.get_named_type(avro_type, namespace)
+        return fullname
+
+    type_name = avro_type["type"]
+
+    if type_name in (fields.RECORD, fields.ENUM, fields.FIXED):
+        return named_types.get_fullname(
+            avro_type["name"], avro_type.get("namespace", namespace)
+        )
+    elif type_name in (fields.ARRAY, fields.MAP):
+        return type_name
+
+    # primitive type in its complex form, or a logical type
+    return get_branch_name(schema_compiler, type_name, namespace)
+
+
+class JsonEncoderCompiler(encoder.EncoderCompiler):
+    """
+    Generate the source of the functions that write instances with the avro
+    json encoding.
+
+    Every record is translated to a function that reads the attributes of
+    an instance and appends the fragments of its json text to a list, without
+    converting the instance to a dict. The unions choose their branch with
+    the same checks as the binary encoder.
+    """
+
+    prefix = "json_encode"
+    arguments = ("value", "parts")
+    helpers = {
+        "int_repr": int.__repr__,
+        "encode_string": json.encoder.encode_basestring,
+        "FLOAT_CONSTANTS": FLOAT_CONSTANTS,
+        "BYTES_TYPES": encoder.BYTES_TYPES,
+        "datetime": datetime,
+        "decimal": decimal,
+        "uuid": uuid,
+    }
+
+    def compile_primitive(self, avro_type: str) -> codegen.Emitter:
+        return ENCODE_EMITTERS[avro_type]
+
+    def call(self, function_name: str) -> codegen.Emitter:
+        def emit_call(writer: codegen.CodeWriter, value: str) -> None:
+            writer.line(f"{function_name}({value}, parts)")
+
+        return emit_call
+
+    def write_record(
+        self,
+        writer: codegen.CodeWriter,
+        avro_type: typing.Dict,
+        namespace: typing.Optional[str],
+    ) -> None:
+        separator = "{"
+
+        for field in avro_type["fields"]:
+            emit = self.compile(field["type"], namespace)
+            value = writer.variable()
+            _emit_constant(writer, f"{separator}{json.dumps(field['name'])}:")
+            writer.line(f"{value} = value.{field['name']}")
+            emit(writer, value)
+            separator = ","
+
+        _emit_constant(writer, "}" if avro_type["fields"] else "{}")
+
+    def compile_enum(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        fullname, _ = self.register(avro_type, namespace)
+        name = avro_type["name"]
+        symbols = self.bind(
+            {symbol: json.dumps(symbol) for symbol in avro_type["symbols"]},
+            f"{name}_symbols",
+        )
+        message = f" is not a valid symbol of the enum {name}"
+
+        def emit_enum(writer: codegen.CodeWriter, value: str) -> None:
+            writer.line("try:")
+            with writer.indent():
+                writer.line(f"parts.append({writer.use(symbols)}[{value}])")
+            writer.line("except (KeyError, TypeError):")
+            with writer.indent():
+                writer.line(f"raise ValueError(repr({value}) + {message!r})")
+
+        self.compiled_named_types[fullname] = emit_enum
+        return emit_enum
+
+    def compile_fixed(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        fullname, _ = self.register(avro_type, namespace)
+        size = int(avro_type["size"])
+        message = f"The fixed {avro_type['name']} must have {size} bytes"
+
+        def emit_fixed(writer: codegen.CodeWriter, value: str) -> None:
+            writer.line(f"if len({value}) != {size}:")
+            with writer.indent():
+                writer.line(f"raise ValueError({message!r})")
+            _emit_bytes(writer, value)
+
+        self.compiled_named_types[fullname] = emit_fixed
+        return emit_fixed
+
+    def compile_array(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        emit_item = self.compile(avro_type["items"], namespace)
+
+        def emit_array(writer: codegen.CodeWriter, value: str) -> None:
+            item = writer.variable("item")
+            _emit_constant(writer, "[")
+            writer.line(f"for {item} in {value}:")
+            with writer.indent():
+                emit_item(writer, item)
+                _emit_constant(writer, ",")
+            _emit_closing(writer, value, "]")
+
+        return emit_array
+
+    def compile_map(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        emit_value = self.compile(avro_type["values"], namespace)
+
+        def emit_map(writer: codegen.CodeWriter, value: str) -> None:
+            key = writer.variable("key")
+            item = writer.variable("item")
+            _emit_constant(writer, "{")
+            writer.line(f"for {key}, {item} in {value}.items():")
+            with writer.indent():
+                writer.line(f"parts.append({writer.use('encode_string')}({key}))")
+                _emit_constant(writer, ":")
+                emit_value(writer, item)
+                _emit_constant(writer, ",")
+            _emit_closing(writer, value, "}")
+
+        return emit_map
+
+    def compile_union(
+        self, avro_type: typing.List, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        branches = [
+            (
+                self.get_predicate(element, namespace),
+                self.compile(element, namespace),
+                get_branch_name(self, element, namespace),
+            )
+            for element in avro_type
+        ]
+        message = f" does not match any type of the union {avro_type}"
+
+        def emit_union(writer: codegen.CodeWriter, value: str) -> None:
+            for index, (predicate, emit, branch_name) in enumerate(branches):
+                keyword = "elif" if index else "if"
+                writer.line(f"{keyword} {predicate(writer, value)}:")
+                with writer.indent():
+                    if branch_name == fields.NULL:
+                        emit(writer, value)
+                    else:
+                        _emit_constant(writer, f"{{{json.dumps(branch_name)}:")
+                        emit(writer, value)
+                        _emit_constant(writer, "}")
+
+            writer.line("else:")
+            with writer.indent():
+                writer.line(f"raise ValueError(repr({value}) + {message!r})")
+
+        return emit_union
+
+
+class JsonDecoderCompiler(codegen.SourceCompiler):
+    """
+    Generate the source of the functions that create instances from the
+    values parsed from the avro json encoding.
+
+    Every record is translated to a function that takes the dict parsed by
+    json.loads and returns the instance of its class, converting only the
+    values whose python type is not the one returned by json.loads: bytes,
+    floats, logical types, the tagged values of the unions and the records.
+    """
+
+    prefix = "json_decode"
+    arguments = ("value",)
+    helpers = {"new": object.__new__}
+
+    def compile_primitive(self, avro_type: str) -> codegen.Emitter:
+        return DECODE_EMITTERS[avro_type]
+
+    def call(self, function_name: str) -> codegen.Emitter:
+        def emit_call(writer: codegen.CodeWriter, target: str) -> None:
+            writer.line(f"{target} = {function_name}({target})")
+
+        return emit_call
+
+    def write_record(
+        self,
+        writer: codegen.CodeWriter,
+        avro_type: typing.Dict,
+        namespace: typing.Optional[str],
+    ) -> None:
+        klass = self.get_record_class(avro_type, namespace)
+        attributes = []
+
+        for field in avro_type["fields"]:
+            emit = self.compile(field["type"], namespace)
+            target = writer.variable()
+            writer.line(f"{target} = value[{field['name']!r}]")
+            emit(writer, target)
+            attributes.append((field["name"], target))
+
+        name = writer.use(self.bind(klass, klass.__name__))
+
+        if can_set_attributes(klass):
+            instance = writer.variable("instance")
+            values = ", ".join(f"{key!r}: {value}" for key, value in attributes)
+            writer.line(f"{instance} = {writer.use('new')}({name})")
+            writer.line(f"{instance}.__dict__ = {{{values}}}")
+            writer.line(f"return {instance}")
+        else:
+            values = ", ".join(f"{key}={value}" for key, value in attributes)
+            writer.line(f"return {name}({values})")
+
+    def compile_enum(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        fullname, _ = self.register(avro_type, namespace)
+        name = avro_type["name"]
+        symbols = self.bind(frozenset(avro_type["symbols"]), f"{name}_symbols")
+        message = f" is not a symbol of the enum {name}"
+
+        def emit_enum(writer: codegen.CodeWriter, target: str) -> None:
+            writer.line(f"if {target} not in {writer.use(symbols)}:")
+            with writer.indent():
+                writer.line(f"raise ValueError(repr({target}) + {message!r})")
+
+        self.compiled_named_types[fullname] = emit_enum
+        return emit_enum
+
+    def compile_fixed(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        fullname, _ = self.register(avro_type, namespace)
+        size = int(avro_type["size"])
+        message = f"The fixed {avro_type['name']} must have {size} bytes"
+
+        def emit_fixed(writer: codegen.CodeWriter, target: str) -> None:
+            _emit_to_bytes(writer, target)
+            writer.line(f"if len({target}) != {size}:")
+            with writer.indent():
+                writer.line(f"raise ValueError({message!r})")
+
+        self.compiled_named_types[fullname] = emit_fixed
+        return emit_fixed
+
+    def compile_array(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        emit_item = self.compile(avro_type["items"], namespace)
+
+        if emit_item is _emit_nothing:
+            # the parsed list is used as it is
+            return _emit_nothing
+
+        def emit_array(writer: codegen.CodeWriter, target: str) -> None:
+            items = writer.variable("items")
+            item = writer.variable("item")
+            writer.line(f"{items} = {target}")
+            writer.line(f"{target} = []")
+            writer.line(f"for {item} in {items}:")
+            with writer.indent():
+                emit_item(writer, item)
+                writer.line(f"{target}.append({item})")
+
+        return emit_array
+
+    def compile_map(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        emit_value = self.compile(avro_type["values"], namespace)
+
+        if emit_value is _emit_nothing:
+            return _emit_nothing
+
+        def emit_map(writer: codegen.CodeWriter, target: str) -> None:
+            items = writer.variable("items")
+            key = writer.variable("key")
+            item = writer.variable("item")
+            writer.line(f"{items} = {target}")
+            writer.line(f"{target} = {{}}")
+            writer.line(f"for {key}, {item} in {items}.items():")
+            with writer.indent():
+                emit_value(writer, item)
+                writer.line(f"{target}[{key}] = {item}")
+
+        return emit_map
+
+    def compile_logical_type(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        logical_type = avro_type["logicalType"]
+        _, from_logical_type = compiler.get_logical_conversions(avro_type)
+        from_logical_type = self.bind(
+            from_logical_type, f"{logical_type}_from_logical_type"
+        )
+        emit = self.compile(compiler.get_underlying_type(avro_type), namespace)
+
+        def emit_logical_type(writer: codegen.CodeWriter, target: str) -> None:
+            emit(writer, target)
+            writer.line(f"{target} = {writer.use(from_logical_type)}({target})")
+
+        return emit_logical_type
+
+    def compile_union(
+        self, avro_type: typing.List, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        branches = [
+            (
+                get_branch_name(self, element, namespace),
+                self.compile(element, namespace),
+            )
+            for element in avro_type
+        ]
+        nullable = any(branch_name == fields.NULL for branch_name, _ in branches)
+        message = f" is not a type of the union {avro_type}"
+
+        def emit_union(writer: codegen.CodeWriter, target: str) -> None:
+            if nullable:
+                writer.line(f"if {target} is not None:")
+                with writer.indent():
+                    emit_tagged(writer, target)
+            else:
+                emit_tagged(writer, target)
+
+        def emit_tagged(writer: codegen.CodeWriter, target: str) -> None:
+            # the values of the branches that are not null are objects with
+            # a single key, the name of the branch
+            branch = writer.variable("branch")
+            writer.line(f"[({branch}, {target})] = {target}.items()")
+            keyword = "if"
+
+            for branch_name, emit in branches:
+                if branch_name == fields.NULL:
+                    continue
+
+                writer.line(f"{keyword} {branch} == {branch_name!r}:")
+                with writer.indent():
+                    size = len(writer.lines)
+                    emit(writer, target)
+                    if len(writer.lines) == size:
+                        writer.line("pass")
+                keyword = "elif"
+
+            writer.line("else:")
+            with writer.indent():
+                writer.line(f"raise ValueError(repr({branch}) + {message!r})")
+
+        return emit_union
+
+
+@functools.lru_cache(maxsize=None)
+def compile_json_encoder(klass: typing.Any) -> JsonEncodeFunction:
+    """
+    Return the json encode function of a class. Its source is generated and
+    compiled once per class, and it is available in the __source__ attribute.
+
+    Arguments:
+        klass (typing.Any): dataclass, python class or faust.Record
+
+    Returns:
+        typing.Callable: function that appends the fragments of the avro
+            json encoding of an instance to a list
+    """
+    schema_generator = SchemaGenerator(klass)
+    encoder_compiler = JsonEncoderCompiler(schema_generator.get_record_classes())
+
+    return encoder_compiler.build(
+        schema_generator.avro_schema_to_python(), klass.__name__
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def compile_json_decoder(klass: typing.Any) -> JsonDecodeFunction:
+    """
+    Return the json decode function of a class. Its source is generated and
+    compiled once per class, and it is available in the __source__ attribute.
+
+    Arguments:
+        klass (typing.Any): dataclass, python class or faust.Record
+
+    Returns:
+        typing.Callable: function that creates an instance from the value
+            parsed from its avro json encoding
+    """
+    schema_generator = SchemaGenerator(klass)
+    decoder_compiler = JsonDecoderCompiler(schema_generator.get_record_classes())
+
+    return decoder_compiler.build(
+        schema_generator.avro_schema_to_python(), klass.__name__
+    )
+
+
+schema_cache.add_invalidate_callback(compile_json_encoder.cache_clear)
+schema_cache.add_invalidate_callback(compile_json_decoder.cache_clear)
+
+
+class JsonEncoder:
+    """
+    Encode instances of a class using the avro json encoding.
+
+    The encoder reads the attributes of the instances directly and writes
+    compact json, without converting them to dicts with dataclasses.asdict.
+
+    Arguments:
+        klass (typing.Any): dataclass, python class or faust.Record
+    """
+
+    def __init__(self, klass: typing.Any) -> None:
+        self.klass = klass
+        self._encode = compile_json_encoder(klass)
+
+    @property
+    def source(self) -> str:
+        """
+        Return the generated python source of the encoder, for inspection
+        """
+        return self._encode.__source__
+
+    def encode(self, instance: typing.Any) -> bytes:
+        """
+        Return the avro json encoding of instance as utf-8 bytes
+        """
+        parts: typing.List[str] = []
+        self._encode(instance, parts)
+
+        return "".join(parts).encode("utf-8")
+
+
+class JsonDecoder:
+    """
+    Decode data written with the avro json encoding to instances of a class.
+
+    The data is parsed with json.loads and the parsed values are converted
+    to the instances by the generated code.
+
+    Arguments:
+        klass (typing.Any): dataclass, python class or faust.Record
+    """
+
+    def __init__(self, klass: typing.Any) -> None:
+        self.klass = klass
+        self._decode = compile_json_decoder(klass)
+
+    @property
+    def source(self) -> str:
+        """
+        Return the generated python source of the decoder, for inspection
+        """
+        return self._decode.__source__
+
+    def decode(self, data: typing.Union[bytes, str]) -> typing.Any:
+        """
+        Return the instance encoded in data
+        """
+        return self._decode(json.loads(data))
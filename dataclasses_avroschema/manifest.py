@@ -0,0 +1,337 @@
+import argparse
+import dataclasses
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import sys
+import typing
+
+from dataclasses_avroschema import fingerprints
+from dataclasses_avroschema.cache import CachedSchema, schema_cache
+from dataclasses_avroschema.schema_definition import could_be_faust_record
+from dataclasses_avroschema.schema_generator import SchemaGenerator
+
+MANIFEST_FILE = "manifest.json"
+MANIFEST_VERSION = 1
+
+# the options of the entries served from a manifest, the schemas are
+# compiled with the default options of SchemaGenerator
+MANIFEST_OPTIONS = (("include_schema_doc", True),)
+
+
+def get_qualified_name(klass: typing.Any) -> str:
+    """
+    Return the name of a class in the manifest: module:qualname
+    """
+    return f"{klass.__module__}:{klass.__qualname__}"
+
+
+def import_class(qualified_name: str) -> typing.Any:
+    """
+    Return the class of a qualified name returned by get_qualified_name.
+
+    Raises:
+        ImportError, AttributeError: the class does not exist anymore
+    """
+    module_name, _, qualname = qualified_name.partition(":")
+    value = importlib.import_module(module_name)
+
+    for name in qualname.split("."):
+        value = getattr(value, name)
+
+    return value
+
+
+def get_dependencies(klass: typing.Any) -> typing.Set[str]:
+    """
+    Return the names of the modules that define a class, its bases and the
+    types of its fields, recursively. A change in any of them can change
+    the schema of the class.
+    """
+    modules: typing.Set[str] = set()
+    _collect_dependencies(klass, modules, set())
+
+    return modules
+
+
+def _collect_dependencies(
+    python_type: typing.Any, modules: typing.Set[str], seen: typing.Set
+) -> None:
+    for argument in typing.get_args(python_type):
+        _collect_dependencies(argument, modules, seen)
+
+    if not inspect.isclass(python_type) or python_type in seen:
+        return
+    seen.add(python_type)
+
+    for base in inspect.getmro(python_type):
+        modules.add(base.__module__)
+        # the postponed annotations are strings, the classes that they name
+        # are usually defined in the same module
+        for annotation in base.__dict__.get("__annotations__", {}).values():
+            _collect_dependencies(annotation, modules, seen)
+
+
+def hash_module(module_name: str) -> typing.Optional[str]:
+    """
+    Return the MD5 of the source file of a module, None when the module
+    has no file and it is not a builtin module.
+    """
+    if module_name in sys.builtin_module_names:
+        return module_name
+
+    module = importlib.import_module(module_name)
+    path = getattr(module, "__file__", None)
+    if path is None:
+        return None
+
+    with open(path, "rb") as module_file:
+        return hashlib.md5(module_file.read()).hexdigest()
+
+
+def get_source_hash(
+    modules: typing.Iterable[str],
+    module_hashes: typing.Optional[typing.Dict[str, typing.Optional[str]]] = None,
+) -> typing.Optional[str]:
+    """
+    Return the hash of the sources of the modules, None when one of them
+    can not be hashed.
+
+    Arguments:
+        modules (typing.Iterable[str]): names of the modules
+        module_hashes (typing.Dict): hashes of the modules already read
+
+    Returns:
+        str
+    """
+    if module_hashes is None:
+        module_hashes = {}
+
+    source_hash = hashlib.md5()
+
+    for module_name in sorted(modules):
+        if module_name not in module_hashes:
+            module_hashes[module_name] = hash_module(module_name)
+
+        module_hash = module_hashes[module_name]
+        if module_hash is None:
+            return None
+
+        source_hash.update(f"{module_name}:{module_hash}\n".encode())
+
+    return source_hash.hexdigest()
+
+
+def is_record_class(klass: typing.Any) -> bool:
+    return dataclasses.is_dataclass(klass) or could_be_faust_record(klass)
+
+
+def find_classes(package_name: str) -> typing.List[typing.Any]:
+    """
+    Import a package, or a module, and its submodules and return the
+    dataclasses and the faust records that they define.
+    """
+    package = importlib.import_module(package_name)
+    modules = [package]
+
+    if hasattr(package, "__path__"):
+        for module_info in pkgutil.walk_packages(
+            package.__path__, prefix=f"{package_name}."
+        ):
+            modules.append(importlib.import_module(module_info.name))
+
+    return [
+        value
+        for module in modules
+        for value in vars(module).values()
+        if inspect.isclass(value)
+        and value.__module__ == module.__name__
+        and is_record_class(value)
+    ]
+
+
+def compile_schema(klass: typing.Any, output: str) -> typing.Dict[str, typing.Any]:
+    """
+    Generate the schema of a class, write it to an .avsc file in the output
+    directory and return its entry of the manifest.
+    """
+    schema_generator = SchemaGenerator(klass)
+    schema = schema_generator.avro_schema_to_python()
+    qualified_name = get_qualified_name(klass)
+    modules = get_dependencies(klass)
+
+    file_name = f"{qualified_name.replace(':', '.')}.avsc"
+    with open(os.path.join(output, file_name), "w") as schema_file:
+        json.dump(schema, schema_file, indent=2)
+
+    return {
+        "file": file_name,
+        "source_hash": get_source_hash(modules),
+        "modules": sorted(modules),
+        "record_classes": {
+            name: get_qualified_name(record_class)
+            for name, record_class in schema_generator.get_record_classes().items()
+        },
+        "fingerprint": schema_generator.fingerprint(),
+    }
+
+
+def compile_schemas(
+    packages: typing.Iterable[str], output: str
+) -> typing.Dict[str, typing.Any]:
+    """
+    Compile the schemas of the dataclasses and the faust records of the
+    packages, and write them with their manifest to the output directory.
+    The classes whose schema can not be generated are skipped.
+
+    Arguments:
+        packages (typing.Iterable[str]): names of the packages or modules
+        output (str): directory of the .avsc files and the manifest
+
+    Returns:
+        typing.Dict: the manifest
+    """
+    os.makedirs(output, exist_ok=True)
+    schemas = {}
+
+    for package_name in packages:
+        for klass in find_classes(package_name):
+            try:
+                entry = compile_schema(klass, output)
+            except Exception as error:
+                print(f"Skipping {get_qualified_name(klass)}: {error}", file=sys.stderr)
+            else:
+                schemas[get_qualified_name(klass)] = entry
+
+    manifest = {"version": MANIFEST_VERSION, "schemas": schemas}
+    with open(os.path.join(output, MANIFEST_FILE), "w") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+
+    return manifest
+
+
+class SchemaManifest:
+    """
+    Serve the schemas compiled ahead of time from a manifest, without the
+    introspection of the classes.
+
+    It is a loader of the schema cache, see load_manifest. The schema of a
+    class is read from its .avsc file the first time that it is needed, if
+    the sources of the class and of its dependencies did not change since
+    the manifest was written. Otherwise the schema is generated as usual.
+
+    Arguments:
+        path (str): path of the manifest file
+    """
+
+    def __init__(self, path: typing.Union[str, os.PathLike]) -> None:
+        with open(path) as manifest_file:
+            manifest = json.load(manifest_file)
+
+        if manifest.get("version") != MANIFEST_VERSION:
+            raise ValueError(
+                f"Invalid manifest version {manifest.get('version')}, "
+                f"expected {MANIFEST_VERSION}"
+            )
+
+        self.directory = os.path.dirname(os.fspath(path))
+        self.schemas: typing.Dict[str, typing.Dict] = manifest["schemas"]
+        self.module_hashes: typing.Dict[str, typing.Optional[str]] = {}
+
+    def __contains__(self, klass: typing.Any) -> bool:
+        return get_qualified_name(klass) in self.schemas
+
+    def is_current(self, entry: typing.Dict) -> bool:
+        """
+        Return True if the sources of the modules of the entry did not change
+        """
+        source_hash = entry["source_hash"]
+
+        return source_hash is not None and source_hash == get_source_hash(
+            entry["modules"], self.module_hashes
+        )
+
+    def load(self, klass: typing.Any) -> typing.Optional[CachedSchema]:
+        """
+        Return the cache entry of a class, None if the class is not in the
+        manifest or if it changed.
+        """
+        entry = self.schemas.get(get_qualified_name(klass))
+        if entry is None or not self.is_current(entry):
+            return None
+
+        try:
+            record_classes = {
+                name: import_class(qualified_name)
+                for name, qualified_name in entry["record_classes"].items()
+            }
+        except (ImportError, AttributeError):
+            return None
+
+        with open(os.path.join(self.directory, entry["file"])) as schema_file:
+            schema = json.load(schema_file)
+
+        # the named types used more than once are references, which keep
+        # their meaning when the schema is embedded in other schemas
+        return CachedSchema(
+            schema_definition=None,
+            schema=schema,
+            python_schema=schema,
+            fingerprints={fingerprints.CRC_64_AVRO: entry["fingerprint"]},
+            record_classes=record_classes,
+        )
+
+    def __call__(self, key: typing.Tuple) -> typing.Optional[CachedSchema]:
+        klass, options = key[0], key[1:]
+        if options != MANIFEST_OPTIONS:
+            return None
+
+        return self.load(klass)
+
+
+def load_manifest(path: typing.Union[str, os.PathLike]) -> SchemaManifest:
+    """
+    Serve the schemas of a manifest written by compile_schemas, usually at
+    the startup of the application before the schemas are used.
+
+    Arguments:
+        path (str): path of the manifest file
+
+    Returns:
+        SchemaManifest: the loader added to the schema cache
+    """
+    manifest = SchemaManifest(path)
+    schema_cache.add_loader(manifest)
+
+    return manifest
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="dataclasses-avroschema-compile",
+        description=(
+            "Compile the avro schemas of the dataclasses and faust records "
+            "of packages ahead of time"
+        ),
+    )
+    parser.add_argument("packages", nargs="+", help="packages or modules to import")
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="schemas",
+        help="directory of the .avsc files and the manifest",
+    )
+    arguments = parser.parse_args(argv)
+
+    manifest = compile_schemas(arguments.packages, arguments.output)
+    print(
+        f"Compiled {len(manifest['schemas'])} schemas to "
+        f"{os.path.join(arguments.output, MANIFEST_FILE)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import typing
+
+from dataclasses_avroschema import fields
+
+
+def get_fullname(name: str, namespace: typing.Optional[str] = None) -> str:
+    """
+    Return the full name of a named type following the Avro name resolution:
+    a name that contains a dot is already a full name, otherwise the namespace
+    is prepended.
+
+    Arguments:
+        name (str): the name of the named type
+        namespace (str): the enclosing namespace
+
+    Returns:
+        str
+    """
+    if "." in name or not namespace:
+        return name
+    return f"{namespace}.{name}"
+
+
+class NamedTypeRegistry:
+    """
+    Keep track of the named types (record, enum and fixed) defined during
+    the generation of one schema.
+
+    The first occurrence of a named type is fully defined, the next identical
+    occurrences are replaced by its name, or by its full name when it is
+    referenced from a different namespace.
+
+    A different definition that uses an already defined name is kept inlined,
+    as it can not be expressed as a reference.
+    """
+
+    def __init__(self) -> None:
+        self.definitions: typing.Dict[str, typing.Any] = {}
+
+    def reference(
+        self, avro_type: typing.Any, namespace: typing.Optional[str] = None
+    ) -> typing.Any:
+        """
+        Return avro_type with the named types already defined replaced by
+        references. avro_type is not modified.
+
+        Arguments:
+            avro_type (typing.Any): a rendered avro type
+            namespace (str): the enclosing namespace
+
+        Returns:
+            typing.Any: the avro type using references
+        """
+        if isinstance(avro_type, list):
+            return [self.reference(element, namespace) for element in avro_type]
+
+        if not isinstance(avro_type, dict):
+            return avro_type
+
+        type_name = avro_type.get("type")
+
+        if type_name in (fields.RECORD, fields.ENUM, fields.FIXED) and (
+            "name" in avro_type
+        ):
+            type_namespace = avro_type.get("namespace", namespace)
+            fullname = get_fullname(avro_type["name"], type_namespace)
+            definition = self.definitions.get(fullname)
+
+            if definition is None:
+                self.definitions[fullname] = avro_type
+            elif definition == avro_type:
+                if type_namespace == namespace:
+                    return avro_type["name"]
+                return fullname
+
+            if type_name == fields.RECORD:
+                return self.reference_record(avro_type, type_namespace)
+            return avro_type
+
+        if type_name == fields.ARRAY:
+            return self._replace(avro_type, "items", namespace)
+        if type_name == fields.MAP:
+            return self._replace(avro_type, "values", namespace)
+
+        return avro_type
+
+    def reference_record(
+        self, record: typing.Dict, namespace: typing.Optional[str] = None
+    ) -> typing.Dict:
+        record_fields = [
+            self._replace(field, "type", namespace) for field in record["fields"]
+        ]
+
+        result = record.copy()
+        result["fields"] = record_fields
+        return result
+
+    def _replace(
+        self, avro_type: typing.Dict, key: str, namespace: typing.Optional[str]
+    ) -> typing.Dict:
+        value = avro_type[key]
+        referenced = self.reference(value, namespace)
+
+        if referenced is value:
+            return avro_type
+
+        result = avro_type.copy()
+        result[key] = referenced
+        return result
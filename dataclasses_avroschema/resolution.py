@@ -0,0 +1,873 @@
+import copy
+import datetime
+import json
+import threading
+import typing
+import uuid
+
+from dataclasses_avroschema import (
+    codegen,
+    compiler,
+    decoder,
+    fields,
+    fingerprints,
+    named_types,
+)
+from dataclasses_avroschema.cache import schema_cache
+from dataclasses_avroschema.schema_generator import SchemaGenerator
+
+NAMED_TYPES = (fields.RECORD, fields.ENUM, fields.FIXED)
+
+# writer types that can be read as other reader types
+PROMOTIONS = {
+    fields.INT: (fields.LONG, fields.FLOAT, fields.DOUBLE),
+    fields.LONG: (fields.FLOAT, fields.DOUBLE),
+    fields.FLOAT: (fields.DOUBLE,),
+    fields.STRING: (fields.BYTES,),
+    fields.BYTES: (fields.STRING,),
+}
+
+# writer logical types that can be read as other reader logical types, the
+# values are decoded with the conversion of the writer and they are valid
+# values of the reader
+LOGICAL_TYPE_PROMOTIONS = {
+    fields.TIME_MILLIS: fields.TIME_MICROS,
+    fields.TIMESTAMP_MILLIS: fields.TIMESTAMP_MICROS,
+    fields.LOCAL_TIMESTAMP_MILLIS: fields.LOCAL_TIMESTAMP_MICROS,
+}
+
+# defaults that can be shared by all the decoded instances
+IMMUTABLE_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    str,
+    bytes,
+    datetime.date,
+    datetime.time,
+    uuid.UUID,
+)
+
+
+class SchemaResolutionError(ValueError):
+    """
+    The data written with a schema can not be read with the reader schema
+    """
+
+
+def get_type_name(avro_type: typing.Any) -> str:
+    if isinstance(avro_type, dict):
+        return avro_type["type"]
+    return avro_type
+
+
+def get_short_name(name: str) -> str:
+    return name.rpartition(".")[2]
+
+
+def get_logical_type(avro_type: typing.Any) -> typing.Optional[str]:
+    """
+    Return the logical type of an avro type, None if it has no logical
+    type or if it is not supported
+    """
+    if isinstance(avro_type, dict):
+        logical_type = avro_type.get("logicalType")
+        if logical_type in compiler.LOGICAL_TYPES_FIELDS_CLASSES:
+            return logical_type
+    return None
+
+
+def describe_logical_type(avro_type: typing.Dict) -> str:
+    logical_type = avro_type["logicalType"]
+
+    if logical_type == fields.DECIMAL:
+        return f"{logical_type}({avro_type['precision']}, {avro_type.get('scale', 0)})"
+    return logical_type
+
+
+def _collect_named_types(
+    avro_type: typing.Any,
+    namespace: typing.Optional[str],
+    register: typing.Callable,
+) -> None:
+    """
+    Call register with every named type defined in avro_type and its namespace
+    """
+    if isinstance(avro_type, list):
+        for element in avro_type:
+            _collect_named_types(element, namespace, register)
+    elif isinstance(avro_type, dict):
+        type_name = avro_type["type"]
+
+        if type_name in NAMED_TYPES:
+            _, inner_namespace = register(avro_type, namespace)
+            for field in avro_type.get("fields", ()):
+                _collect_named_types(field["type"], inner_namespace, register)
+        elif type_name == fields.ARRAY:
+            _collect_named_types(avro_type["items"], namespace, register)
+        elif type_name == fields.MAP:
+            _collect_named_types(avro_type["values"], namespace, register)
+
+
+def _emit_skip_blocks(
+    writer: codegen.CodeWriter, emit_item: typing.Callable[[], None]
+) -> None:
+    """
+    Write the loop that skips the blocks of an array or a map. The blocks
+    with a negative count have their size, so they are skipped at once.
+    """
+    count = writer.variable("count")
+    size = writer.variable("size")
+    decoder._emit_long(writer, count)
+    writer.line(f"while {count}:")
+    with writer.indent():
+        writer.line(f"if {count} < 0:")
+        with writer.indent():
+            decoder._emit_long(writer, size)
+            writer.line(f"position += {size}")
+        writer.line("else:")
+        with writer.indent():
+            writer.line(f"for _ in range({count}):")
+            with writer.indent():
+                emit_item()
+        decoder._emit_long(writer, count)
+
+
+def _emit_skip_slice(writer: codegen.CodeWriter, target: str) -> None:
+    size = writer.variable("size")
+    decoder._emit_long(writer, size)
+    writer.line(f"position += {size}")
+
+
+def _emit_skip_long(writer: codegen.CodeWriter, target: str) -> None:
+    decoder._emit_long(writer, target)
+
+
+def _emit_skip_size(size: int) -> codegen.Emitter:
+    def emit_skip(writer: codegen.CodeWriter, target: str) -> None:
+        if size:
+            writer.line(f"position += {size}")
+
+    return emit_skip
+
+
+SKIP_EMITTERS: typing.Dict[str, codegen.Emitter] = {
+    fields.NULL: _emit_skip_size(0),
+    fields.BOOLEAN: _emit_skip_size(1),
+    fields.INT: _emit_skip_long,
+    fields.LONG: _emit_skip_long,
+    fields.FLOAT: _emit_skip_size(4),
+    fields.DOUBLE: _emit_skip_size(8),
+    fields.BYTES: _emit_skip_slice,
+    fields.STRING: _emit_skip_slice,
+}
+
+
+class ResolvingCompiler(decoder.DecoderCompiler):
+    """
+    Generate the source of the functions that decode data written with
+    a writer schema to instances of the reader classes, following the
+    schema resolution rules of the avro specification:
+
+    - the fields are matched by name or by the aliases of the reader fields
+    - the fields of the writer that the reader does not have are skipped
+    - the fields of the reader that the writer does not have get their
+      default value, the one rendered by get_default_value of the field
+    - int, long and float are promoted, and string and bytes are interchangeable
+    - the logical types must be the same, or a type that represents every
+      value of the writer: millis are read as micros and decimals as decimals
+      with a larger scale and as many integer digits
+    - enum symbols are mapped by name, falling back to the enum default
+    - unions are resolved by branch: the first reader type that matches
+      each writer type
+
+    All the decisions are made once, when the source is generated, so
+    the generated code only reads the data.
+
+    Arguments:
+        record_classes (typing.Dict): python classes of the reader records
+        writer_schema (typing.Dict): schema used to write the data
+    """
+
+    prefix = "resolve"
+    helpers = dict(decoder.DecoderCompiler.helpers, deepcopy=copy.deepcopy)
+
+    def __init__(
+        self,
+        record_classes: typing.Dict[str, typing.Any],
+        writer_schema: typing.Dict,
+        zero_copy: bool = False,
+    ) -> None:
+        super().__init__(record_classes, zero_copy=zero_copy)
+        # the resolution form has full names, no namespaces and the logical types
+        self.writer_schema = json.loads(fingerprints.resolution_form(writer_schema))
+        self.writer_types: typing.Dict[str, typing.Dict] = {}
+        self.resolved_records: typing.Dict[typing.Tuple[str, str], str] = {}
+        self.skip_records: typing.Dict[str, str] = {}
+        self.path: typing.List[str] = []
+
+        _collect_named_types(self.writer_schema, None, self.register_writer_type)
+
+    def register_writer_type(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> typing.Tuple[str, typing.Optional[str]]:
+        self.writer_types[avro_type["name"]] = avro_type
+        return avro_type["name"], None
+
+    def get_writer_type(self, avro_type: typing.Any) -> typing.Any:
+        if isinstance(avro_type, str) and avro_type not in compiler.PRIMITIVE_TYPES:
+            return self.writer_types[avro_type]
+        return avro_type
+
+    def get_reader_type(
+        self, avro_type: typing.Any, namespace: typing.Optional[str]
+    ) -> typing.Tuple[typing.Any, typing.Optional[str]]:
+        """
+        Returns:
+            typing.Tuple: the definition of a reader type and the namespace
+                of the named type that it defines
+        """
+        if isinstance(avro_type, str) and avro_type not in compiler.PRIMITIVE_TYPES:
+            fullname, avro_type = self.get_named_type(avro_type, namespace)
+        elif get_type_name(avro_type) in NAMED_TYPES:
+            fullname = named_types.get_fullname(
+                avro_type["name"], avro_type.get("namespace", namespace)
+            )
+        else:
+            return avro_type, namespace
+
+        return avro_type, fullname.rpartition(".")[0] or None
+
+    def error(self, message: str) -> SchemaResolutionError:
+        return SchemaResolutionError(f"{'.'.join(self.path)}: {message}")
+
+    def generate(self, schema: typing.Dict) -> typing.Tuple[str, str]:
+        _collect_named_types(schema, None, self.register)
+
+        self.path.append(schema["name"])
+        self.resolve_type(self.writer_schema, schema, None)
+        self.path.pop()
+
+        reader_fullname = named_types.get_fullname(
+            schema["name"], schema.get("namespace")
+        )
+        function_name = self.resolved_records[
+            (self.writer_schema["name"], reader_fullname)
+        ]
+        source = "\n\n\n".join(self.functions) + "\n"
+
+        return source, function_name
+
+    def matches(
+        self,
+        writer_type: typing.Any,
+        reader_type: typing.Any,
+        namespace: typing.Optional[str],
+        promote: bool,
+    ) -> bool:
+        """
+        Return True if the data of writer_type can be read as reader_type
+        """
+        writer_type = self.get_writer_type(writer_type)
+        reader_type, _ = self.get_reader_type(reader_type, namespace)
+
+        if isinstance(writer_type, list) or isinstance(reader_type, list):
+            return False
+
+        writer_name = get_type_name(writer_type)
+        reader_name = get_type_name(reader_type)
+
+        if writer_name in NAMED_TYPES:
+            return writer_name == reader_name and self.names_match(
+                writer_type, reader_type
+            )
+        if writer_name == reader_name:
+            return True
+        return promote and reader_name in PROMOTIONS.get(writer_name, ())
+
+    @staticmethod
+    def names_match(writer_type: typing.Dict, reader_type: typing.Dict) -> bool:
+        reader_names = [reader_type["name"]] + list(reader_type.get("aliases") or ())
+        writer_name = get_short_name(writer_type["name"])
+
+        return any(get_short_name(name) == writer_name for name in reader_names)
+
+    def select_branch(
+        self,
+        writer_type: typing.Any,
+        reader_union: typing.List,
+        namespace: typing.Optional[str],
+    ) -> typing.Any:
+        """
+        Return the first type of the reader union that matches writer_type,
+        preferring the types that do not need a promotion
+        """
+        for promote in (False, True):
+            for reader_type in reader_union:
+                if self.matches(writer_type, reader_type, namespace, promote):
+                    return reader_type
+        return None
+
+    def resolve_type(
+        self,
+        writer_type: typing.Any,
+        reader_type: typing.Any,
+        namespace: typing.Optional[str],
+    ) -> codegen.Emitter:
+        """
+        Return the emitter that reads the data of writer_type as reader_type
+
+        Raises:
+            SchemaResolutionError: when the types do not match
+        """
+        writer_type = self.get_writer_type(writer_type)
+        reader_type, namespace = self.get_reader_type(reader_type, namespace)
+
+        if isinstance(writer_type, list):
+            return self.resolve_writer_union(writer_type, reader_type, namespace)
+
+        if isinstance(reader_type, list):
+            branch = self.select_branch(writer_type, reader_type, namespace)
+            if branch is None:
+                raise self.error(
+                    f"{self.describe(writer_type)} does not match any type "
+                    f"of {self.describe(reader_type)}"
+                )
+            return self.resolve_type(writer_type, branch, namespace)
+
+        if not self.matches(writer_type, reader_type, namespace, promote=True):
+            raise self.error(
+                f"{self.describe(writer_type)} can not be read as "
+                f"{self.describe(reader_type)}"
+            )
+
+        if get_logical_type(reader_type) is not None:
+            return self.resolve_logical_type(writer_type, reader_type, namespace)
+
+        type_name = get_type_name(reader_type)
+
+        if type_name == fields.RECORD:
+            return self.resolve_record(writer_type, reader_type, namespace)
+        elif type_name == fields.ENUM:
+            return self.resolve_enum(writer_type, reader_type, namespace)
+        elif type_name == fields.FIXED:
+            if writer_type["size"] != reader_type["size"]:
+                raise self.error(
+                    f"the size of the fixed {reader_type['name']} is "
+                    f"{reader_type['size']} and not {writer_type['size']}"
+                )
+            return self.compile_fixed(reader_type, namespace)
+        elif type_name == fields.ARRAY:
+            return decoder.array_emitter(
+                self.resolve_type(writer_type["items"], reader_type["items"], namespace)
+            )
+        elif type_name == fields.MAP:
+            return decoder.map_emitter(
+                self.resolve_type(
+                    writer_type["values"], reader_type["values"], namespace
+                )
+            )
+
+        return self.resolve_primitive(get_type_name(writer_type), type_name)
+
+    @staticmethod
+    def describe(avro_type: typing.Any) -> str:
+        if isinstance(avro_type, list):
+            return f"the union {avro_type}"
+
+        type_name = get_type_name(avro_type)
+        if type_name in NAMED_TYPES:
+            return f"the {type_name} {avro_type['name']}"
+        return type_name
+
+    def resolve_primitive(self, writer_type: str, reader_type: str) -> codegen.Emitter:
+        if writer_type == fields.FLOAT and reader_type == fields.DOUBLE:
+            return decoder._emit_float
+
+        if reader_type in (fields.FLOAT, fields.DOUBLE) and writer_type in (
+            fields.INT,
+            fields.LONG,
+        ):
+
+            def emit_promotion(writer: codegen.CodeWriter, target: str) -> None:
+                raw = writer.variable("raw")
+                decoder._emit_long(writer, raw)
+                writer.line(f"{target} = float({raw})")
+
+            return emit_promotion
+
+        # the same type, int to long or string to bytes and back
+        return self.compile_primitive(reader_type)
+
+    def resolve_logical_type(
+        self,
+        writer_type: typing.Any,
+        reader_type: typing.Dict,
+        namespace: typing.Optional[str],
+    ) -> codegen.Emitter:
+        logical_type = reader_type["logicalType"]
+        conversions_type = reader_type
+
+        if get_logical_type(writer_type) is not None and not self.logical_types_match(
+            writer_type, reader_type
+        ):
+            if not self.promotes_logical_type(writer_type, reader_type):
+                raise self.error(
+                    f"{describe_logical_type(writer_type)} can not be read as "
+                    f"{describe_logical_type(reader_type)}"
+                )
+            # the values of the writer are converted to python values that
+            # the reader can represent
+            conversions_type = writer_type
+            logical_type = writer_type["logicalType"]
+
+        _, from_logical_type = compiler.get_logical_conversions(conversions_type)
+        from_logical_type = self.bind(
+            from_logical_type, f"{logical_type}_from_logical_type"
+        )
+        emit = self.resolve_type(
+            writer_type, compiler.get_underlying_type(reader_type), namespace
+        )
+
+        def emit_logical_type(writer: codegen.CodeWriter, target: str) -> None:
+            raw = writer.variable("raw")
+            emit(writer, raw)
+            writer.line(f"{target} = {writer.use(from_logical_type)}({raw})")
+
+        return emit_logical_type
+
+    @staticmethod
+    def logical_types_match(writer_type: typing.Dict, reader_type: typing.Dict) -> bool:
+        return all(
+            writer_type.get(attribute) == reader_type.get(attribute)
+            for attribute in fingerprints.LOGICAL_ATTRIBUTES
+        )
+
+    @staticmethod
+    def promotes_logical_type(
+        writer_type: typing.Dict, reader_type: typing.Dict
+    ) -> bool:
+        """
+        Return True if the values of the writer logical type can be read as
+        values of the reader logical type without losing information
+        """
+        writer_logical_type = writer_type["logicalType"]
+        reader_logical_type = reader_type["logicalType"]
+
+        if writer_logical_type == reader_logical_type == fields.DECIMAL:
+            writer_scale = int(writer_type.get("scale", 0))
+            reader_scale = int(reader_type.get("scale", 0))
+
+            return (
+                reader_scale >= writer_scale
+                and int(reader_type["precision"]) - reader_scale
+                >= int(writer_type["precision"]) - writer_scale
+            )
+
+        return LOGICAL_TYPE_PROMOTIONS.get(writer_logical_type) == reader_logical_type
+
+    def resolve_writer_union(
+        self,
+        writer_union: typing.List,
+        reader_type: typing.Any,
+        namespace: typing.Optional[str],
+    ) -> codegen.Emitter:
+        """
+        Every type of the writer union is resolved on its own. The types
+        that the reader can not read raise an error only if they are found
+        in the data.
+        """
+        branches: typing.List[typing.Optional[codegen.Emitter]] = []
+
+        for writer_type in writer_union:
+            if isinstance(reader_type, list):
+                reader_branch = self.select_branch(writer_type, reader_type, namespace)
+            elif self.matches(writer_type, reader_type, namespace, promote=True):
+                reader_branch = reader_type
+            else:
+                reader_branch = None
+
+            if reader_branch is None:
+                branches.append(None)
+            else:
+                branches.append(
+                    self.resolve_type(writer_type, reader_branch, namespace)
+                )
+
+        if not any(branches):
+            raise self.error(
+                f"none of the types of {self.describe(writer_union)} can be read"
+                f" as {self.describe(reader_type)}"
+            )
+
+        messages = [
+            f"{self.describe(writer_type)} can not be read as "
+            f"{self.describe(reader_type)}"
+            for writer_type in writer_union
+        ]
+
+        def emit_union(writer: codegen.CodeWriter, target: str) -> None:
+            index = writer.variable("index")
+            decoder._emit_long(writer, index)
+
+            for branch_index, emit in enumerate(branches):
+                keyword = "elif" if branch_index else "if"
+                writer.line(f"{keyword} {index} == {branch_index}:")
+                with writer.indent():
+                    if emit is None:
+                        writer.line(f"raise ValueError({messages[branch_index]!r})")
+                    else:
+                        emit(writer, target)
+
+            writer.line("else:")
+            with writer.indent():
+                writer.line(
+                    f'raise ValueError(f"Invalid index {{{index}}} of the union")'
+                )
+
+        return emit_union
+
+    def resolve_enum(
+        self,
+        writer_type: typing.Dict,
+        reader_type: typing.Dict,
+        namespace: typing.Optional[str],
+    ) -> codegen.Emitter:
+        reader_symbols = reader_type["symbols"]
+        default = reader_type.get("default")
+        symbols = []
+
+        for symbol in writer_type["symbols"]:
+            if symbol in reader_symbols:
+                symbols.append(symbol)
+            else:
+                symbols.append(default)
+
+        name = self.bind(tuple(symbols), f"{reader_type['name']}_symbols")
+        message = f" is not a symbol of the enum {reader_type['name']}"
+        writer_symbols = None
+        if None in symbols:
+            writer_symbols = self.bind(
+                tuple(writer_type["symbols"]), f"{reader_type['name']}_writer_symbols"
+            )
+
+        def emit_enum(writer: codegen.CodeWriter, target: str) -> None:
+            index = writer.variable("index")
+            decoder._emit_long(writer, index)
+            writer.line(f"{target} = {writer.use(name)}[{index}]")
+
+            if writer_symbols is not None:
+                writer.line(f"if {target} is None:")
+                with writer.indent():
+                    writer.line(
+                        f"raise ValueError({writer.use(writer_symbols)}[{index}]"
+                        f" + {message!r})"
+                    )
+
+        return emit_enum
+
+    def resolve_record(
+        self,
+        writer_type: typing.Dict,
+        reader_type: typing.Dict,
+        namespace: typing.Optional[str],
+    ) -> codegen.Emitter:
+        reader_fullname = named_types.get_fullname(reader_type["name"], namespace)
+        key = (writer_type["name"], reader_fullname)
+
+        if key not in self.resolved_records:
+            # registered before resolving the fields to support recursive records
+            function_name = self.function_name(reader_fullname)
+            self.resolved_records[key] = function_name
+
+            writer = codegen.CodeWriter()
+            self.write_resolved_record(writer, writer_type, reader_type, namespace)
+            self.functions.append(writer.function(function_name, self.arguments))
+
+        return self.call(self.resolved_records[key])
+
+    def write_resolved_record(
+        self,
+        writer: codegen.CodeWriter,
+        writer_type: typing.Dict,
+        reader_type: typing.Dict,
+        namespace: typing.Optional[str],
+    ) -> None:
+        klass = self.get_record_class(reader_type, namespace)
+        reader_fields = {}
+        for field in reader_type["fields"]:
+            for name in [field["name"]] + list(field.get("aliases") or ()):
+                reader_fields.setdefault(name, field)
+
+        values: typing.Dict[str, str] = {}
+
+        for writer_field in writer_type["fields"]:
+            reader_field = reader_fields.get(writer_field["name"])
+
+            if reader_field is None:
+                self.skip(writer_field["type"])(writer, "_")
+                continue
+
+            self.path.append(reader_field["name"])
+            emit = self.resolve_type(
+                writer_field["type"], reader_field["type"], namespace
+            )
+            self.path.pop()
+
+            target = writer.variable()
+            emit(writer, target)
+            values[reader_field["name"]] = target
+
+        attributes = []
+        for field in reader_type["fields"]:
+            if field["name"] not in values:
+                self.path.append(field["name"])
+                values[field["name"]] = self.write_default(writer, field, namespace)
+                self.path.pop()
+            attributes.append((field["name"], values[field["name"]]))
+
+        self.write_instance(writer, klass, attributes)
+
+    def write_default(
+        self,
+        writer: codegen.CodeWriter,
+        field: typing.Dict,
+        namespace: typing.Optional[str],
+    ) -> str:
+        """
+        Write the line that assigns the default value of a field that the
+        writer does not have to a local variable and return its name
+        """
+        if "default" not in field:
+            raise self.error("the field is not in the writer schema and has no default")
+
+        value = self.get_default(field["type"], field["default"], namespace)
+        name = writer.use(self.bind(value, f"{field['name']}_default"))
+        target = writer.variable()
+
+        if isinstance(value, IMMUTABLE_TYPES):
+            writer.line(f"{target} = {name}")
+        else:
+            # every instance gets its own copy of mutable defaults
+            writer.line(f"{target} = {writer.use('deepcopy')}({name})")
+        return target
+
+    def get_default(
+        self,
+        avro_type: typing.Any,
+        default: typing.Any,
+        namespace: typing.Optional[str],
+    ) -> typing.Any:
+        """
+        Convert the default value of a field from its schema representation,
+        see BaseField.get_default_value, to its python value
+        """
+        avro_type, namespace = self.get_reader_type(avro_type, namespace)
+
+        if isinstance(avro_type, list):
+            if default in (None, fields.NULL) and fields.NULL in avro_type:
+                return None
+            # the default value of an union is a value of its first type
+            return self.get_default(avro_type[0], default, namespace)
+
+        type_name = get_type_name(avro_type)
+        logical_type = (
+            avro_type.get("logicalType") if isinstance(avro_type, dict) else None
+        )
+
+        if logical_type in compiler.LOGICAL_TYPES_FIELDS_CLASSES:
+            _, from_logical_type = compiler.get_logical_conversions(avro_type)
+            if logical_type == fields.DECIMAL:
+                # the json strings of bytes have a code point for every byte
+                default = default.encode("latin-1")
+            return from_logical_type(default)
+        elif type_name == fields.NULL:
+            return None
+        elif type_name in (fields.BYTES, fields.FIXED):
+            # the json strings of bytes have a code point for every byte
+            return default.encode("latin-1") if isinstance(default, str) else default
+        elif type_name in (fields.FLOAT, fields.DOUBLE):
+            return float(default)
+        elif type_name == fields.ARRAY:
+            return [
+                self.get_default(avro_type["items"], item, namespace)
+                for item in default
+            ]
+        elif type_name == fields.MAP:
+            return {
+                key: self.get_default(avro_type["values"], value, namespace)
+                for key, value in default.items()
+            }
+        elif type_name == fields.RECORD:
+            klass = self.get_record_class(avro_type, namespace)
+            return klass(
+                **{
+                    field["name"]: self.get_default(
+                        field["type"],
+                        default.get(field["name"], field.get("default")),
+                        namespace,
+                    )
+                    for field in avro_type["fields"]
+                }
+            )
+
+        return default
+
+    def skip(self, avro_type: typing.Any) -> codegen.Emitter:
+        """
+        Return the emitter that skips the data of a writer type
+        """
+        avro_type = self.get_writer_type(avro_type)
+
+        if isinstance(avro_type, list):
+            branches = [self.skip(element) for element in avro_type]
+
+            def emit_skip_union(writer: codegen.CodeWriter, target: str) -> None:
+                index = writer.variable("index")
+                decoder._emit_long(writer, index)
+
+                for branch_index, emit in enumerate(branches):
+                    keyword = "elif" if branch_index else "if"
+                    writer.line(f"{keyword} {index} == {branch_index}:")
+                    with writer.indent():
+                        size = len(writer.lines)
+                        emit(writer, target)
+                        if len(writer.lines) == size:
+                            writer.line("pass")
+
+            return emit_skip_union
+
+        type_name = get_type_name(avro_type)
+
+        if type_name == fields.RECORD:
+            return self.skip_record(avro_type)
+        elif type_name == fields.ENUM:
+            return _emit_skip_long
+        elif type_name == fields.FIXED:
+            return _emit_skip_size(avro_type["size"])
+        elif type_name in (fields.ARRAY, fields.MAP):
+            emit_item = self.skip(
+                avro_type["items"] if type_name == fields.ARRAY else avro_type["values"]
+            )
+
+            def emit_skip_blocks(writer: codegen.CodeWriter, target: str) -> None:
+                def emit_skip_item() -> None:
+                    if type_name == fields.MAP:
+                        _emit_skip_slice(writer, target)
+                    emit_item(writer, target)
+
+                _emit_skip_blocks(writer, emit_skip_item)
+
+            return emit_skip_blocks
+
+        return SKIP_EMITTERS[type_name]
+
+    def skip_record(self, avro_type: typing.Dict) -> codegen.Emitter:
+        name = avro_type["name"]
+
+        if name not in self.skip_records:
+            # registered before skipping the fields to support recursive records
+            function_name = f"skip_{self.identifier(name)}_{next(self._counter)}"
+            self.skip_records[name] = function_name
+
+            writer = codegen.CodeWriter()
+            for field in avro_type["fields"]:
+                self.skip(field["type"])(writer, "_")
+            writer.line("return None, position")
+            self.functions.append(writer.function(function_name, self.arguments))
+
+        return self.call(self.skip_records[name])
+
+
+# resolving decode functions keyed by the fingerprint of the resolution form
+# of the writer schema, the reader class and zero_copy
+_resolving_decoders: typing.Dict[typing.Tuple, decoder.DecodeFunction] = {}
+_resolving_decoders_lock = threading.Lock()
+
+
+def compile_resolving_decoder(
+    writer_schema: typing.Union[str, typing.Dict],
+    klass: typing.Any,
+    zero_copy: bool = False,
+) -> decoder.DecodeFunction:
+    """
+    Return the function that decodes data written with writer_schema to
+    instances of klass. The resolution is done once per writer schema
+    fingerprint, including its logical types, and class, and the function
+    is cached.
+
+    When writer_schema is the schema of klass, the function is the one of
+    compile_decoder.
+
+    Arguments:
+        writer_schema (str, typing.Dict): schema used to write the data
+        klass (typing.Any): dataclass, python class or faust.Record
+        zero_copy (bool): decode bytes and fixed as slices of the data,
+            which must be a memoryview
+
+    Raises:
+        SchemaResolutionError: when the data of writer_schema can not be
+            read as klass
+    """
+    if isinstance(writer_schema, str):
+        writer_schema = json.loads(writer_schema)
+
+    # the parsing canonical form does not have the logical types, which
+    # change the meaning of the values
+    writer_form = fingerprints.resolution_form(writer_schema)
+    key = (fingerprints.fingerprint(writer_form, fingerprints.MD5), klass, zero_copy)
+    decode = _resolving_decoders.get(key)
+
+    if decode is None:
+        with _resolving_decoders_lock:
+            decode = _resolving_decoders.get(key)
+            if decode is None:
+                schema_generator = SchemaGenerator(klass)
+                reader_schema = schema_generator.avro_schema_to_python()
+
+                if writer_form == fingerprints.resolution_form(reader_schema):
+                    decode = decoder.compile_decoder(klass, zero_copy=zero_copy)
+                else:
+                    resolving_compiler = ResolvingCompiler(
+                        schema_generator.get_record_classes(),
+                        writer_schema,
+                        zero_copy=zero_copy,
+                    )
+                    decode = resolving_compiler.build(reader_schema, klass.__name__)
+                _resolving_decoders[key] = decode
+
+    return decode
+
+
+def _clear_resolving_decoders() -> None:
+    with _resolving_decoders_lock:
+        _resolving_decoders.clear()
+
+
+schema_cache.add_invalidate_callback(_clear_resolving_decoders)
+
+
+class ResolvingDecoder(decoder.BinaryDecoder):
+    """
+    Decode data written with another version of the schema of a class,
+    for example by a producer that has not been updated yet.
+
+    Arguments:
+        klass (typing.Any): dataclass, python class or faust.Record
+        writer_schema (str, typing.Dict): schema used to write the data
+        zero_copy (bool): decode bytes and fixed as memoryview slices
+    """
+
+    def __init__(
+        self,
+        klass: typing.Any,
+        writer_schema: typing.Union[str, typing.Dict],
+        zero_copy: bool = False,
+    ) -> None:
+        self.klass = klass
+        self.zero_copy = zero_copy
+        self.writer_schema = writer_schema
+        self._decode = compile_resolving_decoder(
+            writer_schema, klass, zero_copy=zero_copy
+        )
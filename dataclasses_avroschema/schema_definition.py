@@ -6,10 +6,42 @@ from collections import OrderedDict
 
 from dataclasses_avroschema import fields
 
-try:
-    import faust
-except ImportError:  # pragma: no cover
-    faust = None  # pragma: no cover
+# faust is imported the first time that a class that could be
+# a faust.Record is seen, see get_faust
+faust = None
+_faust_imported = False
+
+
+def get_faust():
+    """
+    Import faust the first time it is needed.
+
+    Returns:
+        The faust module or None if it is not installed
+    """
+    global faust, _faust_imported
+
+    if not _faust_imported:
+        try:
+            import faust as faust_module
+        except ImportError:  # pragma: no cover
+            faust_module = None  # pragma: no cover
+
+        faust = faust_module
+        _faust_imported = True
+
+    return faust
+
+
+def could_be_faust_record(klass: typing.Any) -> bool:
+    """
+    Return True if klass inherits from a class defined in the faust package,
+    without importing faust.
+    """
+    return any(
+        getattr(base, "__module__", "").partition(".")[0] == "faust"
+        for base in inspect.getmro(klass)
+    )
 
 
 @dataclasses.dataclass
@@ -42,10 +74,13 @@ class BaseSchemaDefinition(abc.ABC):
 
     @property
     def is_faust_record(self) -> bool:
-        if faust:
-            if inspect.isclass(self.klass_or_instance):
-                return issubclass(self.klass_or_instance, faust.Record)
-            return issubclass(self.klass_or_instance.__class__, faust.Record)
+        if inspect.isclass(self.klass_or_instance):
+            klass = self.klass_or_instance
+        else:
+            klass = self.klass_or_instance.__class__
+
+        if could_be_faust_record(klass) and get_faust():
+            return issubclass(klass, faust.Record)
 
         return False
 
@@ -1,7 +1,10 @@
 import dataclasses
+import inspect
 import json
 import typing
 
+from dataclasses_avroschema import fingerprints, named_types, utils
+from dataclasses_avroschema.cache import CachedSchema, schema_cache
 from dataclasses_avroschema.schema_definition import AvroSchemaDefinition
 
 
@@ -10,43 +13,214 @@ class SchemaGenerator:
         self.dataclass = self.generate_dataclass(klass_or_instance)
         self.include_schema_doc = include_schema_doc
         self.schema_definition: AvroSchemaDefinition = None
+        self._cached_schema: CachedSchema = None
 
     @staticmethod
     def generate_dataclass(klass_or_instance):
         if dataclasses.is_dataclass(klass_or_instance):
             return klass_or_instance
-        return dataclasses.dataclass(klass_or_instance)
+        return schema_cache.get_dataclass(klass_or_instance, dataclasses.dataclass)
+
+    @property
+    def cache_key(self) -> typing.Tuple:
+        return schema_cache.make_key(
+            self.dataclass, include_schema_doc=self.include_schema_doc
+        )
 
     def generate_schema(self, schema_type: str = "avro"):
+        self._load_schema_definition(schema_type)
+        return utils.to_python(self._get_python_schema())
+
+    def _load_schema_definition(self, schema_type: str = "avro") -> CachedSchema:
+        """
+        Fill schema_definition from the cache entry, without copying the
+        schema like generate_schema does, and return the entry.
+        """
         if self.schema_definition is not None:
-            return self.schema_definition.render()
+            return self._get_cached_schema()
 
         # let's live open the possibility to define different
         # schema definitions like json
         if schema_type == "avro":
-            schema_definition = self._generate_avro_schema()
+            cached_schema = self._get_cached_schema()
         else:
             raise ValueError("Invalid type. Expected avro schema type.")
 
         # cache the schema
-        self.schema_definition = schema_definition
+        self.schema_definition = cached_schema.schema_definition
+
+        return cached_schema
+
+    def _get_python_schema(self) -> typing.Dict[str, typing.Any]:
+        """
+        Return the schema made of plain dicts and lists, rendered once per
+        cache entry. Every named type is defined only once, the next
+        occurrences are emitted as references to it.
+        """
+        cached_schema = self._get_cached_schema()
+
+        if cached_schema.python_schema is None:
+            schema = named_types.NamedTypeRegistry().reference(cached_schema.schema)
+            cached_schema.python_schema = utils.to_python(schema)
+
+        return cached_schema.python_schema
+
+    def _get_cached_schema(self) -> CachedSchema:
+        if self._cached_schema is None:
+            self._cached_schema = schema_cache.get_or_create(
+                self.cache_key, self._generate_cached_schema
+            )
+        return self._cached_schema
 
-        return self.schema_definition.render()
+    def _generate_cached_schema(self) -> CachedSchema:
+        schema_definition = self._generate_avro_schema()
+        return CachedSchema(schema_definition, schema_definition.render())
 
     def _generate_avro_schema(self) -> AvroSchemaDefinition:
         return AvroSchemaDefinition(
             "record", self.dataclass, include_schema_doc=self.include_schema_doc
         )
 
+    def render(self) -> typing.Dict[str, typing.Any]:
+        """
+        Return the schema shared through the process-wide cache.
+
+        It is used to embed nested records without generating them again,
+        so the result must be treated as read-only.
+        """
+        return self._get_cached_schema().schema
+
     def avro_schema(self) -> str:
-        return json.dumps(self.generate_schema(schema_type="avro"))
+        self._load_schema_definition(schema_type="avro")
+        return json.dumps(self._get_python_schema())
 
     def avro_schema_to_python(self) -> typing.Dict[str, typing.Any]:
-        return json.loads(self.avro_schema())
+        return self.generate_schema(schema_type="avro")
+
+    def avro_schema_bytes(self) -> bytes:
+        """
+        Return the schema as compact JSON encoded in utf-8, for the callers that
+        write the schema somewhere (headers, registries, etc). It is encoded
+        once per cache entry.
+        """
+        cached_schema = self._load_schema_definition(schema_type="avro")
+
+        if cached_schema.json_bytes is None:
+            cached_schema.json_bytes = json.dumps(
+                self._get_python_schema(), separators=(",", ":")
+            ).encode("utf-8")
+
+        return cached_schema.json_bytes
+
+    def canonical_form(self) -> str:
+        """
+        Return the Avro Parsing Canonical Form of the schema.
+        It is computed once per cache entry.
+        """
+        cached_schema = self._load_schema_definition(schema_type="avro")
+
+        if cached_schema.canonical_form is None:
+            cached_schema.canonical_form = fingerprints.parsing_canonical_form(
+                self._get_python_schema()
+            )
+
+        return cached_schema.canonical_form
+
+    def fingerprint(self, algorithm: str = "CRC-64-AVRO") -> str:
+        """
+        Return the fingerprint of the Parsing Canonical Form as an hex string.
+        It is computed once per cache entry and algorithm.
+
+        Arguments:
+            algorithm (str): CRC-64-AVRO, MD5 or SHA-256
+
+        Returns:
+            str
+        """
+        cached_fingerprints = self._get_cached_schema().fingerprints
+
+        try:
+            return cached_fingerprints[algorithm]
+        except KeyError:
+            value = fingerprints.fingerprint(self.canonical_form(), algorithm)
+            cached_fingerprints[algorithm] = value
+            return value
+
+    def resolution_fingerprint(self, algorithm: str = "CRC-64-AVRO") -> str:
+        """
+        Return the fingerprint of the Parsing Canonical Form with the logical
+        types, see fingerprints.resolution_form. Unlike fingerprint, it tells
+        apart the schemas that only differ in their logical types.
+        It is computed once per cache entry and algorithm.
+
+        Arguments:
+            algorithm (str): CRC-64-AVRO, MD5 or SHA-256
+
+        Returns:
+            str
+        """
+        cached_schema = self._load_schema_definition(schema_type="avro")
+        cached_fingerprints = cached_schema.resolution_fingerprints
+
+        try:
+            return cached_fingerprints[algorithm]
+        except KeyError:
+            value = fingerprints.fingerprint(
+                fingerprints.resolution_form(self._get_python_schema()), algorithm
+            )
+            cached_fingerprints[algorithm] = value
+            return value
 
     @property
     def get_fields(self) -> typing.List["Field"]:
         if self.schema_definition is None:
-            self.generate_schema()
+            self._load_schema_definition()
+
+        if self.schema_definition is None:
+            # the entry was loaded from a manifest, without introspection
+            cached_schema = self._get_cached_schema()
+            cached_schema.schema_definition = self._generate_avro_schema()
+            self.schema_definition = cached_schema.schema_definition
 
         return self.schema_definition.fields
+
+    def get_record_classes(self) -> typing.Dict[str, typing.Any]:
+        """
+        Return the classes of the records used by the schema, the class itself
+        and the nested ones, keyed by the record name and by its full name.
+
+        Returns:
+            typing.Dict[str, typing.Any]
+        """
+        cached_schema = self._get_cached_schema()
+
+        if cached_schema.record_classes is None:
+            record_classes: typing.Dict[str, typing.Any] = {}
+            self._collect_record_classes(record_classes)
+            cached_schema.record_classes = record_classes
+
+        return dict(cached_schema.record_classes)
+
+    def _collect_record_classes(self, record_classes: typing.Dict) -> None:
+        cached_record_classes = self._get_cached_schema().record_classes
+        if cached_record_classes is not None:
+            record_classes.update(cached_record_classes)
+            return
+
+        klass = self.dataclass
+        if not inspect.isclass(klass):
+            klass = klass.__class__
+
+        self._load_schema_definition()
+        name = self.schema_definition.get_schema_name()
+        record_classes[name] = klass
+        record_classes[
+            named_types.get_fullname(name, self.schema_definition.namespace)
+        ] = klass
+
+        for field in self.schema_definition.fields:
+            for python_type in utils.get_record_types(field.type):
+                if record_classes.get(python_type.__name__) is not python_type:
+                    SchemaGenerator(python_type)._collect_record_classes(
+                        record_classes
+                    )
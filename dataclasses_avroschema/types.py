@@ -1,3 +1,4 @@
+import datetime
 import typing
 
 T = typing.TypeVar("T")
@@ -19,3 +20,70 @@ class Fixed(typing.Generic[T]):
 
     def __repr__(self):
         return f"{self.size}"
+
+
+class Decimal(typing.Generic[T]):
+    """
+    Represents an Avro decimal logical type, the values are decimal.Decimal
+
+    precision (int): Maximum number of digits of the values
+    scale (int): Number of digits after the decimal point
+    size (int): Number of bytes of the fixed that stores the values,
+        by default they are stored as bytes
+    """
+
+    def __init__(
+        self,
+        precision: int,
+        scale: int = 0,
+        size: int = None,
+        namespace: str = None,
+        aliases: typing.List = None,
+    ) -> None:
+        if precision < 1 or not 0 <= scale <= precision:
+            raise ValueError(
+                f"Invalid decimal of precision {precision} and scale {scale}, "
+                "the scale must be between 0 and the precision"
+            )
+
+        # the digits of the largest unscaled value that fits in the fixed
+        if size is not None and precision > len(str(2 ** (8 * size - 1) - 1)) - 1:
+            raise ValueError(
+                f"A fixed of {size} bytes can not store a decimal of "
+                f"precision {precision}"
+            )
+
+        self.precision = precision
+        self.scale = scale
+        self.size = size
+        self.namespace = namespace
+        self.aliases = aliases
+
+    def __repr__(self):
+        return f"{self.precision}, {self.scale}"
+
+
+class TimeMicros(datetime.time):
+    """
+    Represents an Avro time-micros, the values are datetime.time
+    """
+
+
+class TimestampMicros(datetime.datetime):
+    """
+    Represents an Avro timestamp-micros, the values are datetime.datetime
+    """
+
+
+class LocalTimestampMillis(datetime.datetime):
+    """
+    Represents an Avro local-timestamp-millis, the values are naive
+    datetime.datetime in local time
+    """
+
+
+class LocalTimestampMicros(datetime.datetime):
+    """
+    Represents an Avro local-timestamp-micros, the values are naive
+    datetime.datetime in local time
+    """
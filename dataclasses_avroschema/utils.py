@@ -1,4 +1,30 @@
+import datetime
+import inspect
 import typing
+import uuid
+
+from dataclasses_avroschema import types
+
+# classes that have a python type mapped to something else than a record
+NOT_RECORD_CLASSES = (
+    str,
+    int,
+    bool,
+    float,
+    bytes,
+    type(None),
+    list,
+    tuple,
+    dict,
+    datetime.date,
+    datetime.time,
+    datetime.datetime,
+    uuid.UUID,
+    types.TimeMicros,
+    types.TimestampMicros,
+    types.LocalTimestampMillis,
+    types.LocalTimestampMicros,
+)
 
 
 def is_union(a_type: typing.Any) -> bool:
@@ -39,3 +65,50 @@ def is_self_referenced(a_type) -> bool:
         and a_type.__args__
         and isinstance(a_type.__args__[0], typing.ForwardRef)  # type: ignore
     )
+
+
+def to_python(value: typing.Any) -> typing.Any:
+    """
+    Return a copy of value made of plain python dicts and lists, the same
+    structure that json.loads(json.dumps(value)) returns without the
+    serialization round-trip.
+
+    Arguments:
+        value (typing.Any): rendered avro structure (OrderedDict, list, tuple...)
+
+    Returns:
+        typing.Any
+    """
+    if isinstance(value, dict):
+        return {key: to_python(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_python(item) for item in value]
+    return value
+
+
+def get_record_types(a_type: typing.Any) -> typing.Iterator[typing.Any]:
+    """
+    Given a python type, yield the classes that are rendered as avro records,
+    looking inside the arguments of typing.List, typing.Dict, typing.Union...
+
+    Arguments:
+        a_type (typing.Any): python type
+
+    Returns:
+        typing.Iterator: classes of avro records
+
+    Example:
+        a_type = typing.Dict[str, typing.Union[Address, None]]
+
+        list(get_record_types(a_type)) # [Address]
+    """
+    if isinstance(a_type, typing._GenericAlias):  # type: ignore
+        for argument in a_type.__args__:
+            yield from get_record_types(argument)
+    elif (
+        inspect.isclass(a_type)
+        and a_type not in NOT_RECORD_CLASSES
+        and a_type.__module__ != "typing"
+        and not issubclass(a_type, typing.Generic)  # types.Fixed
+    ):
+        yield a_type
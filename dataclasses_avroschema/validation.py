@@ -0,0 +1,302 @@
+import datetime
+import decimal
+import functools
+import typing
+import uuid
+
+from dataclasses_avroschema import binary, codegen, encoder, fields
+from dataclasses_avroschema.cache import schema_cache
+from dataclasses_avroschema.schema_generator import SchemaGenerator
+
+ValidateFunction = typing.Callable[[typing.Any], None]
+
+INT_RANGE = binary.INT_RANGE
+LONG_RANGE = binary.LONG_RANGE
+
+# expressions that check if a python value is valid for a primitive type
+PRIMITIVE_CHECKS = dict(
+    encoder.PRIMITIVE_PREDICATES,
+    **{
+        fields.INT: (
+            encoder.PRIMITIVE_PREDICATES[fields.INT]
+            + " and {INT_RANGE[0]} <= {{value}} <= {INT_RANGE[1]}".format(
+                INT_RANGE=INT_RANGE
+            )
+        ),
+        fields.LONG: (
+            encoder.PRIMITIVE_PREDICATES[fields.LONG]
+            + " and {LONG_RANGE[0]} <= {{value}} <= {LONG_RANGE[1]}".format(
+                LONG_RANGE=LONG_RANGE
+            )
+        ),
+    },
+)
+
+
+class ValidationError(ValueError):
+    """
+    An instance does not conform to the avro schema of its class
+    """
+
+
+class ValidatorCompiler(encoder.EncoderCompiler):
+    """
+    Generate the source of the functions that check that instances conform
+    to the avro schema of their class.
+
+    Every record is translated to a function with the checks of its fields
+    inlined. The unions are checked choosing the branch like the encoder,
+    so a valid instance is an instance that the encoder can write. The
+    errors are raised with the path of the field in the record.
+    """
+
+    prefix = "validate"
+    arguments = ("value",)
+    helpers = {
+        "ValidationError": ValidationError,
+        "BYTES_TYPES": encoder.BYTES_TYPES,
+        "datetime": datetime,
+        "decimal": decimal,
+        "uuid": uuid,
+    }
+
+    def __init__(self, record_classes: typing.Dict[str, typing.Any]) -> None:
+        super().__init__(record_classes)
+        self.path: typing.List[str] = []
+        self.record_class: typing.Any = None
+
+    def raise_error(self, writer: codegen.CodeWriter, value: str, message: str) -> None:
+        """
+        Write the line that raises the error of an invalid value, with the
+        path of the field that is being validated
+        """
+        prefix = f"{'.'.join(self.path)}: "
+        writer.line(f"raise ValidationError({prefix!r} + repr({value}) + {message!r})")
+
+    def check(self, expression: str, message: str) -> codegen.Emitter:
+        """
+        Return an emitter that raises a ValidationError when the expression,
+        formatted with the value, is false
+        """
+
+        def emit_check(writer: codegen.CodeWriter, value: str) -> None:
+            writer.line(f"if not ({expression.format(value=value)}):")
+            with writer.indent():
+                self.raise_error(writer, value, message)
+
+        return emit_check
+
+    def compile_primitive(self, avro_type: str) -> codegen.Emitter:
+        return self.check(PRIMITIVE_CHECKS[avro_type], f" is not a valid {avro_type}")
+
+    def call(self, function_name: str) -> codegen.Emitter:
+        klass = self.record_class
+        name = self.bind(klass, klass.__name__)
+        message = f" is not an instance of {klass.__name__}"
+
+        def emit_call(writer: codegen.CodeWriter, value: str) -> None:
+            writer.line(f"if not isinstance({value}, {writer.use(name)}):")
+            with writer.indent():
+                self.raise_error(writer, value, message)
+            writer.line(f"{function_name}({value})")
+
+        return emit_call
+
+    def compile_record(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        # the calls of the function of the record check the class first
+        self.record_class = self.get_record_class(avro_type, namespace)
+        return super().compile_record(avro_type, namespace)
+
+    def write_record(
+        self,
+        writer: codegen.CodeWriter,
+        avro_type: typing.Dict,
+        namespace: typing.Optional[str],
+    ) -> None:
+        # the errors of the fields of a nested record start with its name
+        path, self.path = self.path, [avro_type["name"]]
+
+        for field in avro_type["fields"]:
+            emit = self.compile(field["type"], namespace)
+            value = writer.variable()
+            writer.line(f"{value} = value.{field['name']}")
+            self.path.append(field["name"])
+            emit(writer, value)
+            self.path.pop()
+
+        self.path = path
+
+    def compile_enum(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        fullname, _ = self.register(avro_type, namespace)
+        name = avro_type["name"]
+        symbols = self.bind(frozenset(avro_type["symbols"]), f"{name}_symbols")
+        emit_check = self.check(
+            f"isinstance({{value}}, str) and {{value}} in {symbols}",
+            f" is not a valid symbol of the enum {name}",
+        )
+
+        def emit_enum(writer: codegen.CodeWriter, value: str) -> None:
+            writer.use(symbols)
+            emit_check(writer, value)
+
+        self.compiled_named_types[fullname] = emit_enum
+        return emit_enum
+
+    def compile_fixed(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        fullname, _ = self.register(avro_type, namespace)
+        size = int(avro_type["size"])
+        emit_fixed = self.check(
+            f"isinstance({{value}}, BYTES_TYPES) and len({{value}}) == {size}",
+            f" is not valid for the fixed {avro_type['name']} of {size} bytes",
+        )
+
+        self.compiled_named_types[fullname] = emit_fixed
+        return emit_fixed
+
+    def compile_array(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        emit_item = self.compile(avro_type["items"], namespace)
+        emit_check = self.check("isinstance({value}, (list, tuple))", " is not a list")
+
+        def emit_array(writer: codegen.CodeWriter, value: str) -> None:
+            item = writer.variable("item")
+            emit_check(writer, value)
+            writer.line(f"for {item} in {value}:")
+            with writer.indent():
+                emit_item(writer, item)
+
+        return emit_array
+
+    def compile_map(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        emit_value = self.compile(avro_type["values"], namespace)
+        emit_check = self.check("isinstance({value}, dict)", " is not a dict")
+        emit_key = self.check("isinstance({value}, str)", " is not a valid map key")
+
+        def emit_map(writer: codegen.CodeWriter, value: str) -> None:
+            key = writer.variable("key")
+            item = writer.variable("item")
+            emit_check(writer, value)
+            writer.line(f"for {key}, {item} in {value}.items():")
+            with writer.indent():
+                emit_key(writer, key)
+                emit_value(writer, item)
+
+        return emit_map
+
+    def compile_logical_type(
+        self, avro_type: typing.Dict, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        logical_type = avro_type["logicalType"]
+        return self.check(
+            encoder.LOGICAL_PREDICATES[logical_type],
+            f" is not a valid {logical_type}",
+        )
+
+    def compile_union(
+        self, avro_type: typing.List, namespace: typing.Optional[str]
+    ) -> codegen.Emitter:
+        branches = [
+            (
+                self.get_predicate(element, namespace),
+                self.compile_branch(element, namespace),
+            )
+            for element in avro_type
+        ]
+        message = f" does not match any type of the union {avro_type}"
+
+        def emit_union(writer: codegen.CodeWriter, value: str) -> None:
+            # the branch is chosen like the encoder does, and then the value
+            # is validated against it, for example the range of an int
+            for index, (predicate, emit) in enumerate(branches):
+                keyword = "elif" if index else "if"
+                writer.line(f"{keyword} {predicate(writer, value)}:")
+                with writer.indent():
+                    if emit is None:
+                        writer.line("pass")
+                    else:
+                        emit(writer, value)
+
+            writer.line("else:")
+            with writer.indent():
+                self.raise_error(writer, value, message)
+
+        return emit_union
+
+    def compile_branch(
+        self, avro_type: typing.Any, namespace: typing.Optional[str]
+    ) -> typing.Optional[codegen.Emitter]:
+        """
+        Return the emitter that validates a value of a branch of an union,
+        or None when the predicate that chooses the branch is enough
+        """
+        emit = self.compile(avro_type, namespace)
+        avro_type = self.resolve(avro_type, namespace)
+
+        if isinstance(avro_type, dict):
+            if avro_type.get("logicalType") in encoder.LOGICAL_PREDICATES or avro_type[
+                "type"
+            ] in (fields.ENUM, fields.FIXED):
+                return None
+            avro_type = avro_type["type"]
+
+        if avro_type in PRIMITIVE_CHECKS and (
+            PRIMITIVE_CHECKS[avro_type] == encoder.PRIMITIVE_PREDICATES[avro_type]
+        ):
+            return None
+        return emit
+
+
+@functools.lru_cache(maxsize=None)
+def compile_validator(klass: typing.Any) -> ValidateFunction:
+    """
+    Return the validate function of a class. Its source is generated and
+    compiled once per class, and it is available in the __source__ attribute.
+
+    Arguments:
+        klass (typing.Any): dataclass, python class or faust.Record
+
+    Returns:
+        typing.Callable: function that raises ValidationError when an
+            instance does not conform to the avro schema of the class
+    """
+    schema_generator = SchemaGenerator(klass)
+    validator_compiler = ValidatorCompiler(schema_generator.get_record_classes())
+
+    return validator_compiler.build(
+        schema_generator.avro_schema_to_python(), klass.__name__
+    )
+
+
+schema_cache.add_invalidate_callback(compile_validator.cache_clear)
+
+
+def validate(instance: typing.Any, klass: typing.Any = None) -> None:
+    """
+    Check that an instance conforms to the avro schema of its class: the
+    types of the fields, the range of int and long, the symbols of the enums,
+    the size of the fixed, the branches of the unions and the nested records.
+
+    Arguments:
+        instance (typing.Any): instance to validate
+        klass (typing.Any): class of the schema, by default the class
+            of the instance
+
+    Raises:
+        ValidationError: the instance does not conform to the schema, the
+            message starts with the path of the invalid field
+    """
+    if klass is None:
+        klass = type(instance)
+    elif not isinstance(instance, klass):
+        raise ValidationError(f"{instance!r} is not an instance of {klass.__name__}")
+
+    compile_validator(klass)(instance)
@@ -18,10 +18,20 @@ setup(
     long_description_content_type="text/markdown",
     author="Marcos Schroh",
     install_requires=["inflect==2.1.0"],
+    extras_require={
+        "numpy": ["numpy"],
+        "snappy": ["python-snappy"],
+        "zstandard": ["zstandard"],
+    },
     author_email="schrohm@gmail.com",
     url="https://github.com/marcosschroh/dataclasses-avroschema",
     download_url="",
     packages=find_packages(exclude=("tests",)),
+    entry_points={
+        "console_scripts": [
+            "dataclasses-avroschema-compile=dataclasses_avroschema.manifest:main",
+        ],
+    },
     include_package_data=True,
     license="MIT",
     classifiers=[
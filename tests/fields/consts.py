@@ -2,7 +2,7 @@ import datetime
 import typing
 import uuid
 
-from dataclasses_avroschema import fields
+from dataclasses_avroschema import fields, types
 
 now = datetime.datetime.now()
 
@@ -96,6 +96,10 @@ LOGICAL_TYPES_AND_DEFAULTS = (
     (datetime.date, fields.INT, fields.DATE),
     (datetime.time, fields.INT, fields.TIME_MILLIS),
     (datetime.datetime, fields.LONG, fields.TIMESTAMP_MILLIS),
+    (types.TimeMicros, fields.LONG, fields.TIME_MICROS),
+    (types.TimestampMicros, fields.LONG, fields.TIMESTAMP_MICROS),
+    (types.LocalTimestampMillis, fields.LONG, fields.LOCAL_TIMESTAMP_MILLIS),
+    (types.LocalTimestampMicros, fields.LONG, fields.LOCAL_TIMESTAMP_MICROS),
     (uuid.uuid4, fields.STRING, fields.UUID),
 )
 
@@ -103,6 +107,11 @@ LOGICAL_TYPES_AND_INVALID_DEFAULTS = (
     (datetime.date, 1, None),
     (datetime.time, "test", None),
     (datetime.datetime, 10, None),
+    (
+        types.TimestampMicros,
+        datetime.date(2020, 1, 2),
+        f"Invalid default type. Default should be {datetime.datetime}",
+    ),
     (uuid.uuid4, 10, f"Invalid default type. Default should be {str} or {uuid.UUID}"),
 )
 
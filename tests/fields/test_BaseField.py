@@ -1,3 +1,6 @@
+import json
+import typing
+
 from dataclasses_avroschema import fields
 
 
@@ -68,3 +71,25 @@ def test_render_metadata():
     expected = [("encoding", "some_exotic_encoding"), ("doc", "Official Breed Name")]
 
     assert expected == field.get_metadata()
+
+
+def test_to_dict():
+    field = fields.Field("tags", typing.List[str], None)
+
+    field_dict = field.to_dict()
+
+    assert field_dict == json.loads(field.to_json())
+    assert type(field_dict) is dict
+    assert type(field_dict["type"]) is dict
+
+
+def test_singular_name_memoized():
+    fields.singular_name.cache_clear()
+
+    assert fields.BaseField.get_singular_name("addresses") == "address"
+    assert fields.BaseField.get_singular_name("addresses") == "address"
+    assert fields.BaseField.get_singular_name("md5") == "md5"
+
+    info = fields.singular_name.cache_info()
+    assert info.hits == 1
+    assert info.misses == 2
@@ -0,0 +1,205 @@
+import dataclasses
+import datetime
+import decimal
+import typing
+
+import pytest
+
+from dataclasses_avroschema import conversions, fields
+
+DATETIMES = [
+    datetime.datetime(2019, 10, 12, 17, 57, 42, 179999),
+    datetime.datetime(1970, 1, 1),
+    datetime.datetime(1969, 12, 31, 23, 59, 59, 999500),
+    datetime.datetime(1, 1, 1),
+    datetime.datetime(9999, 12, 31, 23, 59, 59, 999999),
+]
+
+
+def test_datetime_to_millis():
+    assert [conversions.datetime_to_millis(value) for value in DATETIMES] == [
+        1570903062179,
+        0,
+        # rounded down before the epoch too
+        -1,
+        -62135596800000,
+        253402300799999,
+    ]
+
+    aware = datetime.datetime(
+        1970, 1, 1, 2, tzinfo=datetime.timezone(datetime.timedelta(hours=2))
+    )
+    assert conversions.datetime_to_millis(aware) == 0
+    assert type(fields.DatetimeField.to_logical_type(DATETIMES[0])) is int
+
+
+def test_scalar_conversions():
+    date = datetime.date(1969, 7, 20)
+    time = datetime.time(17, 57, 42, 179999)
+
+    assert conversions.date_to_days(date) == -165
+    assert conversions.days_to_date(-165) == date
+    # a datetime is converted to the days of its date
+    assert conversions.date_to_days(DATETIMES[0]) == 18181
+    assert conversions.time_to_millis(time) == 64662179
+    assert conversions.millis_to_time(64662179) == time.replace(microsecond=179000)
+    assert conversions.millis_to_datetime(-1) == DATETIMES[2].replace(
+        microsecond=999000
+    )
+
+
+def test_batch_conversions():
+    dates = [value.date() for value in DATETIMES]
+    times = [value.time() for value in DATETIMES]
+
+    assert conversions.dates_to_days(dates) == [
+        conversions.date_to_days(date) for date in dates
+    ]
+    assert conversions.times_to_millis(times) == [
+        conversions.time_to_millis(time) for time in times
+    ]
+    assert conversions.datetimes_to_millis(DATETIMES) == [
+        conversions.datetime_to_millis(value) for value in DATETIMES
+    ]
+
+
+@pytest.mark.parametrize("numpy_installed", [True, False])
+def test_batch_inverse_conversions(monkeypatch, numpy_installed):
+    if numpy_installed:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(conversions, "_numpy", None)
+        monkeypatch.setattr(conversions, "_numpy_checked", True)
+
+    millis = conversions.datetimes_to_millis(DATETIMES)
+    days = conversions.dates_to_days(DATETIMES)
+
+    assert conversions.millis_to_datetimes(millis) == [
+        conversions.millis_to_datetime(value) for value in millis
+    ]
+    assert conversions.days_to_dates(days) == [value.date() for value in DATETIMES]
+
+
+@pytest.mark.parametrize("numpy_installed", [True, False])
+def test_batch_inverse_conversions_out_of_range(monkeypatch, numpy_installed):
+    if numpy_installed:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(conversions, "_numpy", None)
+        monkeypatch.setattr(conversions, "_numpy_checked", True)
+
+    limits = [
+        (conversions.days_to_dates, conversions.DAYS_RANGE, ValueError),
+        (conversions.millis_to_datetimes, conversions.MILLIS_RANGE, OverflowError),
+        (conversions.micros_to_datetimes, conversions.MICROS_RANGE, OverflowError),
+    ]
+
+    for convert, (low, high), error in limits:
+        assert [value.year for value in convert([low, high])] == [1, 9999]
+
+        for value in (low - 1, high + 1):
+            with pytest.raises(error):
+                convert([0, value])
+
+
+def test_numpy_arrays():
+    np = pytest.importorskip("numpy")
+
+    dates = np.array(["2019-10-12", "1969-07-20"], dtype="datetime64[D]")
+    datetimes = np.array(DATETIMES[:3], dtype="datetime64[us]")
+    times = np.array([64662179, 0], dtype="timedelta64[ms]")
+
+    assert conversions.dates_to_days(dates).tolist() == [18181, -165]
+    assert conversions.datetimes_to_millis(datetimes).tolist() == (
+        conversions.datetimes_to_millis(DATETIMES[:3])
+    )
+    assert conversions.times_to_millis(times).tolist() == [64662179, 0]
+    # arrays of python objects are converted with integer arithmetic
+    assert conversions.dates_to_days(np.array(DATETIMES, dtype=object)) == (
+        conversions.dates_to_days(DATETIMES)
+    )
+
+
+def test_logical_defaults():
+    field = fields.Field(
+        "happened_at",
+        typing.List[datetime.datetime],
+        default=dataclasses.MISSING,
+        default_factory=lambda: DATETIMES[:3],
+    )
+    assert field.get_default_value() == [1570903062179, 0, -1]
+
+    field = fields.Field(
+        "days",
+        typing.Dict[str, datetime.date],
+        default=dataclasses.MISSING,
+        default_factory=lambda: {"start": datetime.date(1970, 1, 2)},
+    )
+    assert field.get_default_value() == {"start": 1}
+
+    # mixed values are converted one by one
+    assert fields.to_logical_values([datetime.date(1970, 1, 2), 5, DATETIMES[2]]) == [
+        1,
+        5,
+        -1,
+    ]
+
+
+def test_micros_conversions():
+    assert [conversions.datetime_to_micros(value) for value in DATETIMES] == [
+        1570903062179999,
+        0,
+        -500,
+        -62135596800000000,
+        253402300799999999,
+    ]
+    assert conversions.datetimes_to_micros(DATETIMES) == [
+        conversions.datetime_to_micros(value) for value in DATETIMES
+    ]
+    assert (
+        conversions.micros_to_datetimes(conversions.datetimes_to_micros(DATETIMES))
+        == DATETIMES
+    )
+
+    time = datetime.time(17, 57, 42, 179999)
+    assert conversions.time_to_micros(time) == 64662179999
+    assert conversions.micros_to_time(64662179999) == time
+    assert conversions.times_to_micros([time]) == [64662179999]
+
+
+def test_local_timestamps():
+    aware = datetime.datetime(
+        1970, 1, 1, 2, tzinfo=datetime.timezone(datetime.timedelta(hours=2))
+    )
+
+    # the wall clock time is stored, the time zone is ignored
+    assert conversions.local_datetime_to_millis(aware) == 2 * 60 * 60 * 1000
+    assert conversions.local_datetime_to_micros(DATETIMES[2]) == -500
+
+
+@pytest.mark.parametrize(
+    "value, size, data",
+    [
+        (decimal.Decimal("1.5"), None, b"\x00\x96"),
+        (decimal.Decimal("-1.28"), None, b"\xff\x80"),
+        (decimal.Decimal("0"), None, b"\x00"),
+        (decimal.Decimal("-12345.67"), 8, b"\xff\xff\xff\xff\xff\xed\x29\x79"),
+    ],
+)
+def test_decimal_converter(value, size, data):
+    converter = conversions.decimal_converter(7, 2, size)
+
+    assert converter.to_logical_type(value) == data
+    assert converter.from_logical_type(data) == value
+    assert converter is conversions.decimal_converter(7, 2, size)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [decimal.Decimal("1.005"), decimal.Decimal("123456.7"), decimal.Decimal("nan")],
+)
+def test_invalid_decimals(value):
+    converter = conversions.decimal_converter(7, 2)
+
+    with pytest.raises(ValueError, match="is not a valid decimal of precision 7"):
+        converter.to_logical_type(value)
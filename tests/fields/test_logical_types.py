@@ -3,7 +3,7 @@ import uuid
 
 import pytest
 
-from dataclasses_avroschema import fields
+from dataclasses_avroschema import fields, types
 
 from . import consts
 
@@ -85,12 +85,13 @@ def test_logical_type_datetime_with_default():
     python_type = datetime.datetime
     field = fields.Field(name, python_type, consts.now)
 
-    ts = (consts.now - datetime.datetime(1970, 1, 1)).total_seconds()
+    delta = consts.now - datetime.datetime(1970, 1, 1)
+    milliseconds = delta // datetime.timedelta(milliseconds=1)
 
     expected = {
         "name": name,
         "type": {"type": fields.LONG, "logicalType": fields.TIMESTAMP_MILLIS},
-        "default": ts * 1000,
+        "default": milliseconds,
     }
 
     assert expected == field.to_dict()
@@ -111,6 +112,64 @@ def test_logical_type_uuid_with_default():
     assert expected == field.to_dict()
 
 
+def test_logical_type_micros_with_default():
+    field = fields.Field("a datetime", types.TimestampMicros, consts.now)
+    delta = consts.now - datetime.datetime(1970, 1, 1)
+
+    assert field.to_dict() == {
+        "name": "a datetime",
+        "type": {"type": fields.LONG, "logicalType": fields.TIMESTAMP_MICROS},
+        "default": delta // datetime.timedelta(microseconds=1),
+    }
+
+    field = fields.Field("a time", types.TimeMicros, datetime.time(0, 0, 1, 5))
+    assert field.get_default_value() == 1000005
+
+
+def test_logical_type_decimal():
+    field = fields.Field("price", types.Decimal, types.Decimal(10, 2))
+
+    assert field.to_dict() == {
+        "name": "price",
+        "type": {
+            "type": fields.BYTES,
+            "logicalType": fields.DECIMAL,
+            "precision": 10,
+            "scale": 2,
+        },
+    }
+
+    field = fields.Field(
+        "fees", types.Decimal, types.Decimal(9, 4, size=4, namespace="billing")
+    )
+
+    assert field.to_dict() == {
+        "name": "fees",
+        "type": {
+            "type": fields.FIXED,
+            "name": "fee",
+            "size": 4,
+            "namespace": "billing",
+            "logicalType": fields.DECIMAL,
+            "precision": 9,
+            "scale": 4,
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    "precision,scale,size,msg",
+    (
+        (0, 0, None, "Invalid decimal of precision 0"),
+        (4, 5, None, "the scale must be between 0 and the precision"),
+        (10, 2, 4, "A fixed of 4 bytes can not store a decimal of precision 10"),
+    ),
+)
+def test_invalid_decimal(precision, scale, size, msg):
+    with pytest.raises(ValueError, match=msg):
+        types.Decimal(precision, scale, size=size)
+
+
 @pytest.mark.parametrize(
     "logical_type,invalid_default,msg", consts.LOGICAL_TYPES_AND_INVALID_DEFAULTS
 )
@@ -121,3 +180,26 @@ def test_invalid_default_values(logical_type, invalid_default, msg):
     msg = msg or f"Invalid default type. Default should be {logical_type}"
     with pytest.raises(AssertionError, match=msg):
         field.to_dict()
+
+
+@pytest.mark.parametrize(
+    "field_class,value",
+    (
+        (fields.DateField, datetime.date(2019, 10, 12)),
+        (fields.DateField, datetime.date(1969, 7, 20)),
+        (fields.TimeField, datetime.time(17, 57, 42, 179000)),
+        (fields.DatetimeField, datetime.datetime(2019, 10, 12, 17, 57, 42, 179000)),
+        (fields.UUIDField, uuid.UUID("a8098c1a-f86e-11da-bd1a-00112444be1e")),
+        (fields.TimeMicrosField, datetime.time(17, 57, 42, 179999)),
+        (fields.DatetimeMicrosField, datetime.datetime(1969, 7, 20, 20, 17, 40, 1)),
+        (
+            fields.LocalDatetimeField,
+            datetime.datetime(2019, 10, 12, 17, 57, 42, 179000),
+        ),
+        (fields.LocalDatetimeMicrosField, datetime.datetime(1, 1, 1, 0, 0, 0, 1)),
+    ),
+)
+def test_from_logical_type(field_class, value):
+    logical_value = field_class.to_logical_type(value)
+
+    assert field_class.from_logical_type(logical_value) == value
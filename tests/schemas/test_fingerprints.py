@@ -0,0 +1,126 @@
+import datetime
+import typing
+
+import pytest
+from fastavro.schema import fingerprint, to_parsing_canonical_form
+
+from dataclasses_avroschema import fingerprints
+from dataclasses_avroschema.schema_generator import SchemaGenerator
+
+
+def test_canonical_form(user_advance_dataclass):
+    schema_generator = SchemaGenerator(user_advance_dataclass)
+    canonical_form = schema_generator.canonical_form()
+
+    assert canonical_form == to_parsing_canonical_form(
+        schema_generator.avro_schema_to_python()
+    )
+    assert '"doc"' not in canonical_form
+    assert " " not in canonical_form
+
+
+def test_canonical_form_named_types():
+    class Address:
+        "An Address"
+
+        street: str
+
+        @staticmethod
+        def extra_avro_attributes():
+            return {"namespace": "types.address", "aliases": ["Location"]}
+
+    class User:
+        "An User"
+
+        name: str
+        birthday: datetime.date
+        home: Address
+        addresses: typing.List[Address]
+
+    canonical_form = SchemaGenerator(User).canonical_form()
+
+    assert canonical_form == (
+        '{"name":"User","type":"record","fields":['
+        '{"name":"name","type":"string"},'
+        '{"name":"birthday","type":"int"},'
+        '{"name":"home","type":{"name":"types.address.Address","type":"record",'
+        '"fields":[{"name":"street","type":"string"}]}},'
+        '{"name":"addresses","type":{"type":"array","items":"types.address.Address"}}'
+        "]}"
+    )
+
+
+@pytest.mark.parametrize("algorithm", fingerprints.FINGERPRINT_ALGORITHMS)
+def test_fingerprint(algorithm, user_advance_dataclass, user_v2_dataclass):
+    for klass in (user_advance_dataclass, user_v2_dataclass):
+        schema_generator = SchemaGenerator(klass)
+        canonical_form = schema_generator.canonical_form()
+
+        assert schema_generator.fingerprint(algorithm) == fingerprint(
+            canonical_form, algorithm
+        )
+
+
+def test_fingerprint_cached(user_v2_dataclass):
+    value = SchemaGenerator(user_v2_dataclass).fingerprint()
+
+    assert SchemaGenerator(user_v2_dataclass).fingerprint() is value
+
+
+def test_same_schema_same_fingerprint(user_v2_dataclass):
+    class UserV2:
+        name: str
+        age: int
+
+    # the documentation is not part of the canonical form
+    assert (
+        SchemaGenerator(UserV2).fingerprint()
+        == SchemaGenerator(user_v2_dataclass).fingerprint()
+    )
+
+
+def test_crc_64_avro():
+    assert fingerprints.crc_64_avro(b'"int"') == 0x7275D51A3F395C8F
+
+
+def test_invalid_fingerprint_algorithm():
+    msg = "Invalid fingerprint algorithm SHA-1"
+
+    with pytest.raises(ValueError, match=msg):
+        fingerprints.fingerprint('"int"', "SHA-1")
+
+
+def test_resolution_form():
+    schema = {
+        "type": "record",
+        "name": "Payment",
+        "namespace": "billing",
+        "fields": [
+            {
+                "name": "created_at",
+                "type": {"type": "long", "logicalType": "timestamp-millis"},
+                "doc": "creation time",
+            },
+            {
+                "name": "fee",
+                "type": {
+                    "type": "fixed",
+                    "name": "fee",
+                    "size": 4,
+                    "logicalType": "decimal",
+                    "precision": 9,
+                    "scale": 4,
+                },
+            },
+        ],
+    }
+
+    assert fingerprints.resolution_form(schema) == (
+        '{"name":"billing.Payment","type":"record","fields":['
+        '{"name":"created_at","type":{"type":"long","logicalType":"timestamp-millis"}},'
+        '{"name":"fee","type":{"name":"billing.fee","type":"fixed","size":4,'
+        '"logicalType":"decimal","precision":9,"scale":4}}]}'
+    )
+    assert fingerprints.parsing_canonical_form(schema) == to_parsing_canonical_form(
+        schema
+    )
@@ -0,0 +1,217 @@
+import dataclasses
+import json
+import os
+import sys
+import typing
+
+import pytest
+
+from dataclasses_avroschema import manifest
+from dataclasses_avroschema.cache import schema_cache
+from dataclasses_avroschema.decoder import BinaryDecoder
+from dataclasses_avroschema.encoder import BinaryEncoder
+from dataclasses_avroschema.schema_generator import SchemaGenerator
+
+COMMON_MODULE = """
+import dataclasses
+
+
+@dataclasses.dataclass
+class Address:
+    street: str
+    number: int
+"""
+
+MODELS_MODULE = """
+import dataclasses
+import enum
+import typing
+
+from aot_models.common import Address
+
+
+class Color(enum.Enum):
+    BLUE = "BLUE"
+    RED = "RED"
+
+
+@dataclasses.dataclass
+class User:
+    "An user"
+    name: str
+    color: Color
+    address: Address
+    previous: typing.List[Address]
+
+
+@dataclasses.dataclass
+class Settings:
+    value: object
+"""
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    package_path = tmp_path / "aot_models"
+    package_path.mkdir()
+    (package_path / "__init__.py").write_text("")
+    (package_path / "common.py").write_text(COMMON_MODULE)
+    (package_path / "models.py").write_text(MODELS_MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    schema_cache.invalidate()
+
+    yield package_path
+
+    schema_cache.invalidate()
+    for module_name in list(sys.modules):
+        if module_name.startswith("aot_models"):
+            del sys.modules[module_name]
+
+
+@pytest.fixture
+def load_manifest():
+    manifests = []
+
+    def load(path):
+        schema_manifest = manifest.load_manifest(path)
+        manifests.append(schema_manifest)
+        return schema_manifest
+
+    yield load
+
+    for schema_manifest in manifests:
+        schema_cache.remove_loader(schema_manifest)
+
+
+def test_compile_schemas(package, tmp_path, capsys):
+    output = tmp_path / "schemas"
+    result = manifest.compile_schemas(["aot_models"], str(output))
+
+    from aot_models.models import User
+
+    assert sorted(result["schemas"]) == [
+        "aot_models.common:Address",
+        "aot_models.models:User",
+    ]
+    assert "Skipping aot_models.models:Settings" in capsys.readouterr().err
+
+    entry = result["schemas"]["aot_models.models:User"]
+    assert entry["modules"] == [
+        "aot_models.common",
+        "aot_models.models",
+        "builtins",
+        "enum",
+    ]
+    assert entry["record_classes"]["Address"] == "aot_models.common:Address"
+    assert entry["fingerprint"] == SchemaGenerator(User).fingerprint()
+
+    with open(output / entry["file"]) as schema_file:
+        assert json.load(schema_file) == SchemaGenerator(User).avro_schema_to_python()
+
+    with open(output / manifest.MANIFEST_FILE) as manifest_file:
+        assert json.load(manifest_file) == result
+
+
+def test_load_manifest(package, tmp_path, load_manifest):
+    output = tmp_path / "schemas"
+    manifest.compile_schemas(["aot_models"], str(output))
+
+    from aot_models.common import Address
+    from aot_models.models import Color, User
+
+    schema = SchemaGenerator(User).avro_schema()
+    schema_cache.invalidate()
+    load_manifest(output / manifest.MANIFEST_FILE)
+
+    schema_generator = SchemaGenerator(User)
+    assert schema_generator.avro_schema() == schema
+    # served without introspection
+    assert schema_generator._get_cached_schema().schema_definition is None
+    assert schema_generator.get_record_classes()["Address"] is Address
+
+    user = User("john", Color.RED, Address("main", 1), [Address("old", 2)])
+    assert BinaryDecoder(User).decode(BinaryEncoder(User).encode(user)) == user
+
+    # the fields are introspected when they are needed
+    assert [field.name for field in schema_generator.get_fields] == [
+        "name",
+        "color",
+        "address",
+        "previous",
+    ]
+
+
+def test_nested_in_live_schema(package, tmp_path, load_manifest):
+    output = tmp_path / "schemas"
+    manifest.compile_schemas(["aot_models"], str(output))
+
+    from aot_models.common import Address
+
+    class Customer:
+        home: Address
+        addresses: typing.Dict[str, Address]
+
+    schema = SchemaGenerator(Customer).avro_schema()
+    schema_cache.invalidate()
+    schema_manifest = load_manifest(output / manifest.MANIFEST_FILE)
+
+    assert Address in schema_manifest
+    assert Customer not in schema_manifest
+    assert SchemaGenerator(Customer).avro_schema() == schema
+
+
+def test_changed_source(package, tmp_path, load_manifest):
+    output = tmp_path / "schemas"
+    manifest.compile_schemas(["aot_models"], str(output))
+
+    from aot_models.common import Address
+    from aot_models.models import User
+
+    with open(package / "common.py", "a") as common_module:
+        common_module.write("\n# a change\n")
+
+    schema = SchemaGenerator(User).avro_schema()
+    schema_cache.invalidate()
+    schema_manifest = load_manifest(output / manifest.MANIFEST_FILE)
+
+    # User depends on Address, so both are generated again
+    assert schema_manifest.load(Address) is None
+    assert schema_manifest.load(User) is None
+    assert SchemaGenerator(User).avro_schema() == schema
+    assert SchemaGenerator(User)._get_cached_schema().schema_definition is not None
+
+
+def test_invalid_manifest_version(tmp_path):
+    path = tmp_path / manifest.MANIFEST_FILE
+    path.write_text(json.dumps({"version": 0, "schemas": {}}))
+
+    with pytest.raises(ValueError):
+        manifest.SchemaManifest(path)
+
+
+def test_main(package, tmp_path, capsys):
+    output = tmp_path / "schemas"
+    manifest.main(["aot_models", "--output", str(output)])
+
+    assert (
+        f"Compiled 2 schemas to {output / manifest.MANIFEST_FILE}"
+        in capsys.readouterr().out
+    )
+    assert sorted(os.listdir(output)) == [
+        "aot_models.common.Address.avsc",
+        "aot_models.models.User.avsc",
+        manifest.MANIFEST_FILE,
+    ]
+
+
+def test_get_dependencies():
+    @dataclasses.dataclass
+    class Event:
+        names: typing.List[str]
+        schema: typing.Optional[manifest.SchemaManifest] = None
+
+    assert manifest.get_dependencies(Event) == {
+        "builtins",
+        "dataclasses_avroschema.manifest",
+        __name__,
+    }
@@ -1,6 +1,8 @@
 import json
 import typing
 
+from fastavro import parse_schema
+
 from dataclasses_avroschema.schema_generator import SchemaGenerator
 
 
@@ -62,3 +64,69 @@ def test_one_to_many_map_relationship(user_many_address_map_schema):
 
     schema = SchemaGenerator(User).avro_schema()
     assert schema == json.dumps(user_many_address_map_schema)
+
+
+def test_repeated_nested_record_is_referenced():
+    """
+    Test that a record used many times is defined only once
+    """
+
+    class Address:
+        "An Address"
+        street: str
+        street_number: int
+
+    class User:
+        "User with many Address"
+        name: str
+        home: Address
+        addresses: typing.List[Address]
+        addresses_by_name: typing.Dict[str, Address]
+        work: typing.Union[Address, str] = None
+
+    schema = SchemaGenerator(User).avro_schema_to_python()
+    address = {
+        "type": "record",
+        "name": "Address",
+        "fields": [
+            {"name": "street", "type": "string"},
+            {"name": "street_number", "type": "int"},
+        ],
+        "doc": "An Address",
+    }
+    home, addresses, addresses_by_name, work = schema["fields"][1:]
+
+    assert home["type"] == address
+    assert addresses["type"]["items"] == "Address"
+    assert addresses_by_name["type"]["values"] == "Address"
+    assert work["type"] == ["null", "Address", "string"]
+
+    assert parse_schema(schema)
+
+
+def test_repeated_nested_record_with_namespace_is_referenced():
+    """
+    Test that a record from another namespace is referenced by its full name
+    """
+
+    class Address:
+        street: str
+
+        @staticmethod
+        def extra_avro_attributes():
+            return {"namespace": "types.address"}
+
+    class User:
+        name: str
+        home: Address
+        work: Address
+
+        @staticmethod
+        def extra_avro_attributes():
+            return {"namespace": "types.user"}
+
+    schema = SchemaGenerator(User).avro_schema_to_python()
+
+    assert schema["fields"][1]["type"]["name"] == "Address"
+    assert schema["fields"][2]["type"] == "types.address.Address"
+    assert parse_schema(schema)
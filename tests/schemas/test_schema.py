@@ -145,3 +145,26 @@ def test_not_implementd_methods():
     )
 
     assert msg == str(excinfo.value)
+
+
+def test_schema_to_python(user_advance_dataclass, user_advance_avro_json):
+    schema_generator = SchemaGenerator(user_advance_dataclass, include_schema_doc=False)
+    schema = schema_generator.avro_schema_to_python()
+
+    assert schema == user_advance_avro_json
+    assert type(schema) is dict
+    assert all(type(field) is dict for field in schema["fields"])
+
+    # every call returns a new structure, so it can be modified
+    schema["name"] = "Modified"
+    assert schema_generator.avro_schema_to_python() == user_advance_avro_json
+
+
+def test_schema_bytes(user_advance_dataclass, user_advance_avro_json):
+    schema_generator = SchemaGenerator(user_advance_dataclass, include_schema_doc=False)
+    schema_bytes = schema_generator.avro_schema_bytes()
+
+    assert schema_bytes == json.dumps(
+        user_advance_avro_json, separators=(",", ":")
+    ).encode()
+    assert schema_generator.avro_schema_bytes() is schema_bytes
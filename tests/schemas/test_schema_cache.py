@@ -0,0 +1,188 @@
+import dataclasses
+import json
+import threading
+import typing
+
+import pytest
+
+from dataclasses_avroschema import json_encoding, utils
+from dataclasses_avroschema.cache import CachedSchema, SchemaCache, schema_cache
+from dataclasses_avroschema.decoder import compile_decoder
+from dataclasses_avroschema.encoder import compile_encoder
+from dataclasses_avroschema.resolution import compile_resolving_decoder
+from dataclasses_avroschema.schema_generator import SchemaGenerator
+from dataclasses_avroschema.validation import compile_validator
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    schema_cache.invalidate()
+    yield
+    schema_cache.invalidate()
+
+
+def test_nested_record_generated_once():
+    class Address:
+        "An Address"
+
+        street: str
+        street_number: int
+
+    class User:
+        "An User with Address"
+
+        name: str
+        home: Address
+        work: Address
+        previous: typing.List[Address]
+        by_name: typing.Dict[str, Address]
+        optional: typing.Union[Address, None]
+
+    SchemaGenerator(User).avro_schema()
+
+    # Address is introspected and rendered only once, the rest are hits
+    info = schema_cache.cache_info()
+    assert info.misses == 2
+    assert info.hits >= 4
+    assert info.currsize == 2
+
+
+def test_schema_shared_between_generators(user_v2_dataclass, user_v2_avro_json):
+    first = SchemaGenerator(user_v2_dataclass)
+    second = SchemaGenerator(user_v2_dataclass)
+
+    assert first.avro_schema() == json.dumps(user_v2_avro_json)
+    assert second.avro_schema() == json.dumps(user_v2_avro_json)
+    assert first.schema_definition is second.schema_definition
+    assert schema_cache.cache_info().hits == 1
+
+
+def test_cache_key_includes_options(user_v2_dataclass, user_v2_avro_json):
+    with_doc = SchemaGenerator(user_v2_dataclass).avro_schema()
+    without_doc = SchemaGenerator(
+        user_v2_dataclass, include_schema_doc=False
+    ).avro_schema()
+
+    assert with_doc == json.dumps(user_v2_avro_json)
+    assert "doc" not in json.loads(without_doc)
+    assert len(schema_cache) == 2
+
+
+def test_final_forms_do_not_copy_the_schema(user_v2_dataclass, monkeypatch):
+    SchemaGenerator(user_v2_dataclass).avro_schema()
+    calls = []
+    to_python = utils.to_python
+
+    def tracked_to_python(value):
+        calls.append(value)
+        return to_python(value)
+
+    monkeypatch.setattr(utils, "to_python", tracked_to_python)
+
+    schema_generator = SchemaGenerator(user_v2_dataclass)
+    schema_generator.avro_schema()
+    schema_generator.avro_schema_bytes()
+    schema_generator.canonical_form()
+    schema_generator.fingerprint()
+
+    assert schema_generator.schema_definition is not None
+    assert calls == []
+
+
+def test_invalidate_class(user_dataclass, user_v2_dataclass):
+    SchemaGenerator(user_dataclass).avro_schema()
+    schema_generator = SchemaGenerator(user_v2_dataclass)
+    schema_generator.avro_schema()
+
+    schema_cache.invalidate(user_dataclass)
+
+    assert len(schema_cache) == 1
+    assert schema_generator.cache_key in schema_cache
+
+    schema_cache.invalidate()
+
+    assert len(schema_cache) == 0
+    assert schema_cache.cache_info() == (0, 0, 0)
+
+
+def test_invalidate_compiled_functions(user_v2_dataclass):
+    schema = SchemaGenerator(user_v2_dataclass).avro_schema()
+
+    def compile_functions():
+        return [
+            compile_encoder(user_v2_dataclass),
+            compile_decoder(user_v2_dataclass),
+            compile_validator(user_v2_dataclass),
+            json_encoding.compile_json_encoder(user_v2_dataclass),
+            json_encoding.compile_json_decoder(user_v2_dataclass),
+            compile_resolving_decoder(schema, user_v2_dataclass),
+        ]
+
+    functions = compile_functions()
+    assert compile_functions() == functions
+
+    # the functions compiled from the removed schemas are compiled again
+    schema_cache.invalidate(user_v2_dataclass)
+    new_functions = compile_functions()
+
+    for function, new_function in zip(functions, new_functions):
+        assert new_function is not function
+
+
+def test_dataclass_generated_once():
+    calls = []
+
+    def wrapper(klass):
+        calls.append(klass)
+        return dataclasses.dataclass(klass)
+
+    class User:
+        name: str
+
+    cache = SchemaCache()
+    assert cache.get_dataclass(User, wrapper) is User
+    assert cache.get_dataclass(User, wrapper) is User
+    assert calls == [User]
+
+
+def test_concurrent_generation():
+    class Address:
+        street: str
+
+    class User:
+        name: str
+        address: Address
+
+    results = []
+
+    def generate():
+        results.append(SchemaGenerator(User).avro_schema())
+
+    threads = [threading.Thread(target=generate) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(set(results)) == 1
+    assert len(schema_cache) == 2
+
+
+def test_loader(user_v2_dataclass, user_v2_avro_json):
+    def loader(key):
+        if key[0] is user_v2_dataclass:
+            return CachedSchema(None, user_v2_avro_json, user_v2_avro_json)
+        return None
+
+    class Address:
+        street: str
+
+    schema_cache.add_loader(loader)
+    try:
+        schema_generator = SchemaGenerator(user_v2_dataclass)
+
+        assert schema_generator.avro_schema() == json.dumps(user_v2_avro_json)
+        assert schema_generator.schema_definition is None
+        assert SchemaGenerator(Address).avro_schema_to_python()["name"] == "Address"
+    finally:
+        schema_cache.remove_loader(loader)
@@ -1,7 +1,10 @@
+import dataclasses
 import datetime
 import json
+import typing
 import uuid
 
+from dataclasses_avroschema import types
 from dataclasses_avroschema.schema_generator import SchemaGenerator
 
 
@@ -21,3 +24,25 @@ def test_logical_types_schema(logical_types_schema):
     schema = SchemaGenerator(LogicalTypes).avro_schema()
 
     assert schema == json.dumps(logical_types_schema)
+
+
+def test_micros_and_local_types_are_not_records():
+    class Event:
+        at: types.TimeMicros
+        created_at: types.TimestampMicros
+        local_created_at: types.LocalTimestampMillis
+        local_updated_at: types.LocalTimestampMicros
+        optional_at: typing.Optional[types.TimestampMicros] = None
+
+    record_classes = SchemaGenerator(Event).get_record_classes()
+
+    assert record_classes == {"Event": Event}
+    assert not any(
+        dataclasses.is_dataclass(python_type)
+        for python_type in (
+            types.TimeMicros,
+            types.TimestampMicros,
+            types.LocalTimestampMillis,
+            types.LocalTimestampMicros,
+        )
+    )
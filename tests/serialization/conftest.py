@@ -0,0 +1,13 @@
+import pytest
+
+from .models import User, make_user
+
+
+@pytest.fixture
+def user_class():
+    return User
+
+
+@pytest.fixture
+def user():
+    return make_user(friends=[make_user(name="peter", nickname=None, contact=5)])
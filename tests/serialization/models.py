@@ -0,0 +1,77 @@
+import dataclasses
+import datetime
+import typing
+import uuid
+
+from dataclasses_avroschema import types
+
+
+@dataclasses.dataclass
+class Address:
+    "An Address"
+
+    street: str
+    street_number: int
+
+
+@dataclasses.dataclass
+class User:
+    "An User"
+
+    name: str
+    age: int
+    pets: typing.List[str]
+    accounts: typing.Dict[str, int]
+    address: Address
+    previous_addresses: typing.List[Address]
+    friends: typing.List[typing.Type["User"]]
+    birthday: datetime.date
+    created_at: datetime.datetime
+    wake_up: datetime.time
+    user_id: uuid.uuid4
+    contact: typing.Union[int, str, Address]
+    md5: types.Fixed = types.Fixed(4)
+    favorite_color: typing.Tuple[str] = ("BLUE", "YELLOW", "GREEN")
+    has_car: bool = False
+    money: float = 1.5
+    nickname: str = None
+
+
+def make_user(**kwargs) -> User:
+    values = dict(
+        name="john",
+        age=20,
+        pets=["dog", "cat"],
+        accounts={"savings": 100, "checking": -5},
+        address=Address("Main street", 10),
+        previous_addresses=[Address("First street", 1), Address("Second", 2)],
+        friends=[],
+        birthday=datetime.date(1990, 5, 17),
+        created_at=datetime.datetime(2020, 1, 2, 3, 4, 5, 6000),
+        wake_up=datetime.time(7, 30, 15, 250000),
+        user_id=uuid.UUID("a8098c1a-f86e-11da-bd1a-00112444be1e"),
+        contact=Address("Contact street", 3),
+        md5=b"abcd",
+        favorite_color="YELLOW",
+        has_car=True,
+        money=10.5,
+        nickname="johnny",
+    )
+    values.update(kwargs)
+    return User(**values)
+
+
+def without_defaults(schema):
+    """
+    Remove the defaults of the schema generated for a class, so that
+    fastavro does not validate them
+    """
+    if isinstance(schema, list):
+        return [without_defaults(element) for element in schema]
+    if isinstance(schema, dict):
+        return {
+            key: without_defaults(value)
+            for key, value in schema.items()
+            if key != "default"
+        }
+    return schema
@@ -0,0 +1,116 @@
+import http.server
+import json
+import re
+import threading
+
+from dataclasses_avroschema.confluent import InMemoryRegistry, SchemaRegistryError
+
+
+class RegistryHandler(http.server.BaseHTTPRequestHandler):
+    "Subset of the Confluent Schema Registry api"
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def send_json(self, status, content):
+        body = json.dumps(content).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/vnd.schemaregistry.v1+json")
+        if self.server.header_size:
+            self.send_header("X-Padding", "x" * self.server.header_size)
+
+        if self.server.chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            middle = len(body) // 2
+            for chunk in (body[:middle], body[middle:]):
+                self.wfile.write(b"%x;name=value\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.write(b"0\r\nX-Trailer: value\r\n\r\n")
+        else:
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    def handle_request(self, method):
+        server = self.server
+        server.requests.append((method, self.path))
+        server.connections.add(self.client_address)
+
+        if server.delay:
+            server.delay_event.wait(server.delay)
+
+        if server.fail:
+            return self.send_json(500, {"error_code": 500, "message": "Unavailable"})
+
+        size = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(size)) if size else None
+
+        subject_match = re.fullmatch(r"/subjects/([^/]+)/versions", self.path)
+        lookup_match = re.fullmatch(r"/subjects/([^/]+)", self.path)
+        schema_match = re.fullmatch(r"/schemas/ids/(\d+)", self.path)
+
+        if method == "POST" and subject_match:
+            schema_id = server.registry.register(subject_match.group(1), body["schema"])
+            return self.send_json(200, {"id": schema_id})
+
+        if method == "POST" and lookup_match:
+            subject = lookup_match.group(1)
+            schema_id = server.registry.register("_lookup", body["schema"])
+            if schema_id not in server.registry.subjects.get(subject, []):
+                return self.send_json(
+                    404, {"error_code": 40403, "message": "Schema not found"}
+                )
+            return self.send_json(200, {"id": schema_id})
+
+        if method == "GET" and schema_match:
+            try:
+                schema = server.registry.get_schema(int(schema_match.group(1)))
+            except SchemaRegistryError:
+                return self.send_json(
+                    404, {"error_code": 40403, "message": "Schema not found"}
+                )
+            return self.send_json(200, {"schema": schema})
+
+        self.send_json(404, {"error_code": 404, "message": "Not found"})
+
+    def do_GET(self):
+        self.handle_request("GET")
+
+    def do_POST(self):
+        self.handle_request("POST")
+
+
+class FakeRegistryServer(http.server.ThreadingHTTPServer):
+    """
+    Schema registry server running in a thread, backed by an InMemoryRegistry
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), RegistryHandler)
+        self.registry = InMemoryRegistry()
+        self.requests = []
+        self.connections = set()
+        self.fail = False
+        self.chunked = False
+        self.header_size = 0
+        self.delay = 0
+        self.delay_event = threading.Event()
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.delay_event.set()
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,309 @@
+import asyncio
+import dataclasses
+import datetime
+import json
+
+import pytest
+
+from dataclasses_avroschema import types
+from dataclasses_avroschema.async_registry import AsyncRegistry, TTLCache
+from dataclasses_avroschema.confluent import SchemaRegistryError
+from dataclasses_avroschema.schema_generator import SchemaGenerator
+
+from .registry_server import FakeRegistryServer
+
+
+@dataclasses.dataclass
+class Click:
+    url: str
+    user_id: int
+
+
+@dataclasses.dataclass
+class View:
+    url: str
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def server():
+    with FakeRegistryServer() as server:
+        yield server
+
+
+def test_ttl_cache():
+    clock = Clock()
+    cache = TTLCache(10, clock)
+    cache.set("key", 1)
+
+    clock.now = 10
+    assert cache.get("key") == 1
+    assert "key" in cache
+
+    clock.now = 10.1
+    assert cache.get("key") is None
+    assert "key" not in cache
+    assert len(cache) == 0
+
+
+def test_register_and_get_schema(server):
+    async def main():
+        async with AsyncRegistry(server.url) as registry:
+            schema_id = await registry.get_schema_id(Click, subject="clicks-value")
+            schema = await registry.get_schema(schema_id)
+            return (
+                schema_id,
+                schema,
+                await registry.get_schema_id(Click, "clicks-value"),
+            )
+
+    schema_id, schema, cached_id = asyncio.run(main())
+
+    assert schema_id == cached_id == 1
+    assert json.loads(schema) == SchemaGenerator(Click).avro_schema_to_python()
+    # the schema is cached when it is registered
+    assert server.requests == [("POST", "/subjects/clicks-value/versions")]
+    assert server.registry.subjects == {"clicks-value": [1]}
+
+
+def test_lookup(server):
+    async def main():
+        async with AsyncRegistry(server.url) as registry:
+            with pytest.raises(SchemaRegistryError, match="status 404"):
+                await registry.get_schema_id(Click, register=False)
+
+            server.registry.register(
+                "Click", SchemaGenerator(Click).avro_schema_bytes().decode()
+            )
+            # the failure is cached
+            with pytest.raises(SchemaRegistryError, match="status 404"):
+                await registry.get_schema_id(Click, register=False)
+
+            registry.failures.clear()
+            return await registry.get_schema_id(Click, register=False)
+
+    assert asyncio.run(main()) == 1
+    assert server.requests == [("POST", "/subjects/Click")] * 2
+
+
+def test_concurrent_requests_are_coalesced(server):
+    server.delay = 0.2
+
+    async def main():
+        async with AsyncRegistry(server.url) as registry:
+            ids = await asyncio.gather(
+                *[registry.get_schema_id(Click) for _ in range(100)],
+                *[registry.get_schema_id(View) for _ in range(100)],
+            )
+            return ids, registry.requests_count
+
+    ids, requests_count = asyncio.run(main())
+
+    assert set(ids[:100]) | set(ids[100:]) == {1, 2}
+    assert len(set(ids[:100])) == len(set(ids[100:])) == 1
+    assert requests_count == 2
+    assert len(server.requests) == 2
+
+
+def test_failures_are_cached(server):
+    clock = Clock()
+    server.fail = True
+
+    async def main():
+        async with AsyncRegistry(server.url, negative_ttl=5, clock=clock) as registry:
+            results = await asyncio.gather(
+                *[registry.get_schema(1) for _ in range(10)], return_exceptions=True
+            )
+            assert all(isinstance(result, SchemaRegistryError) for result in results)
+
+            with pytest.raises(SchemaRegistryError, match="status 500"):
+                await registry.get_schema(1)
+            assert len(server.requests) == 1
+
+            server.fail = False
+            server.registry.register(
+                "Click", SchemaGenerator(Click).avro_schema_bytes().decode()
+            )
+            clock.now = 6
+            return await registry.get_schema(1)
+
+    assert json.loads(asyncio.run(main()))["name"] == "Click"
+    assert len(server.requests) == 2
+
+
+def test_ttl(server):
+    clock = Clock()
+
+    async def main():
+        async with AsyncRegistry(server.url, ttl=60, clock=clock) as registry:
+            await registry.get_schema_id(Click)
+            clock.now = 30
+            await registry.get_schema_id(Click)
+            clock.now = 61
+            await registry.get_schema_id(Click)
+
+    asyncio.run(main())
+    assert len(server.requests) == 2
+
+
+def test_connections_are_reused(server):
+    async def main():
+        async with AsyncRegistry(server.url, max_connections=2) as registry:
+            schema_id = await registry.get_schema_id(Click)
+            for _ in range(5):
+                registry.schemas.clear()
+                await registry.get_schema(schema_id)
+
+            # concurrent requests of different schemas use at most 2 connections
+            for klass_index in range(6):
+                registry.ids.clear()
+                await asyncio.gather(
+                    registry.get_schema_id(Click, subject=f"clicks-{klass_index}"),
+                    registry.get_schema_id(View, subject=f"views-{klass_index}"),
+                    registry.get_schema_id(Click, subject=f"other-{klass_index}"),
+                )
+
+    asyncio.run(main())
+
+    assert len(server.requests) == 24
+    assert len(server.connections) <= 2
+
+
+def test_cancelled_caller(server):
+    server.delay = 0.3
+
+    async def main():
+        async with AsyncRegistry(server.url) as registry:
+            first = asyncio.ensure_future(registry.get_schema_id(Click))
+            await asyncio.sleep(0.05)
+            others = [
+                asyncio.ensure_future(registry.get_schema_id(Click)) for _ in range(5)
+            ]
+            await asyncio.sleep(0)
+
+            # the caller that started the request is cancelled, the request
+            # goes on for the other callers
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+
+            return await asyncio.gather(*others)
+
+    assert asyncio.run(main()) == [1] * 5
+    assert len(server.requests) == 1
+
+
+def test_timed_out_connection_is_closed(server, monkeypatch):
+    server.delay = 0.5
+    writers = []
+    open_connection = asyncio.open_connection
+
+    async def open_tracked_connection(*args, **kwargs):
+        reader, writer = await open_connection(*args, **kwargs)
+        writers.append(writer)
+        return reader, writer
+
+    monkeypatch.setattr(asyncio, "open_connection", open_tracked_connection)
+
+    async def main():
+        async with AsyncRegistry(server.url, timeout=0.1) as registry:
+            with pytest.raises(SchemaRegistryError, match="TimeoutError"):
+                await registry.get_schema(1)
+            assert registry._idle_connections == []
+
+    asyncio.run(main())
+
+    assert len(writers) == 1
+    assert writers[0].is_closing()
+
+
+def test_chunked_responses(server):
+    server.chunked = True
+
+    async def main():
+        async with AsyncRegistry(server.url) as registry:
+            schema_id = await registry.get_schema_id(Click)
+            registry.schemas.clear()
+            return schema_id, await registry.get_schema(schema_id)
+
+    schema_id, schema = asyncio.run(main())
+
+    assert schema_id == 1
+    assert json.loads(schema)["name"] == "Click"
+    # the connection is kept alive after the chunked responses
+    assert len(server.connections) == 1
+
+
+def test_logical_types(server):
+    @dataclasses.dataclass
+    class Event:
+        created_at: datetime.datetime
+
+    old_event = Event
+
+    @dataclasses.dataclass
+    class Event:  # noqa: F811
+        created_at: types.TimestampMicros
+
+    new_event = Event
+
+    async def main():
+        async with AsyncRegistry(server.url) as registry:
+            # the schemas only differ in the logical types, they are
+            # not the same schema
+            return (
+                await registry.get_schema_id(old_event, subject="events"),
+                await registry.get_schema_id(new_event, subject="events"),
+            )
+
+    assert asyncio.run(main()) == (1, 2)
+
+
+def test_reused_in_another_loop(server):
+    registry = AsyncRegistry(server.url)
+
+    async def get_schema_id():
+        return await registry.get_schema_id(Click)
+
+    async def get_schema(schema_id):
+        registry.schemas.clear()
+        return await registry.get_schema(schema_id)
+
+    # the idle connection of the first loop is not used by the second one
+    schema_id = asyncio.run(get_schema_id())
+    schema = asyncio.run(get_schema(schema_id))
+
+    assert json.loads(schema)["name"] == "Click"
+    assert len(server.connections) == 2
+    asyncio.run(registry.close())
+
+
+def test_invalid_response(server):
+    # longer than the limit of the lines of asyncio.StreamReader
+    server.header_size = 2**17
+
+    async def main():
+        async with AsyncRegistry(server.url) as registry:
+            await registry.get_schema(1)
+
+    with pytest.raises(SchemaRegistryError, match="LimitOverrunError"):
+        asyncio.run(main())
+
+
+def test_server_unavailable():
+    async def main():
+        async with AsyncRegistry("http://127.0.0.1:1", timeout=1) as registry:
+            await registry.get_schema(1)
+
+    with pytest.raises(SchemaRegistryError, match="failed"):
+        asyncio.run(main())
+
+    with pytest.raises(ValueError, match="Only http"):
+        AsyncRegistry("https://localhost")
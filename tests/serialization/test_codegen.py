@@ -0,0 +1,68 @@
+import dataclasses
+import io
+import traceback
+import typing
+
+from fastavro import parse_schema, schemaless_reader
+
+from dataclasses_avroschema.decoder import BinaryDecoder
+from dataclasses_avroschema.encoder import BinaryEncoder
+from dataclasses_avroschema.schema_generator import SchemaGenerator
+
+from .models import without_defaults
+
+
+@dataclasses.dataclass
+class Measure:
+    name: str
+    value: int
+    values: typing.List[int]
+    labels: typing.Dict[str, str]
+
+
+def test_generated_source(user_class):
+    encoder_source = BinaryEncoder(user_class).source
+    decoder_source = BinaryDecoder(user_class).source
+
+    # one function per record, without dispatch over the schema
+    assert encoder_source.count("def encode_") == 2
+    assert decoder_source.count("def decode_") == 2
+    assert "value.name" in encoder_source
+    assert "write_long=write_long" in encoder_source
+    assert "read_long=read_long" in decoder_source
+    compile(encoder_source, "encoder", "exec")
+    compile(decoder_source, "decoder", "exec")
+
+
+def test_source_is_cached_per_class():
+    assert BinaryEncoder(Measure)._encode is BinaryEncoder(Measure)._encode
+    assert BinaryDecoder(Measure)._decode is BinaryDecoder(Measure)._decode
+
+
+def test_multi_byte_varints():
+    measure = Measure(
+        name="a" * 300,
+        value=-(2**30),
+        values=list(range(-100, 100, 7)) + [2**31 - 1, -(2**31)],
+        labels={f"label{index}": "x" * index for index in range(70)},
+    )
+    data = BinaryEncoder(Measure).encode(measure)
+    schema = parse_schema(
+        without_defaults(SchemaGenerator(Measure).avro_schema_to_python())
+    )
+
+    assert schemaless_reader(io.BytesIO(data), schema) == dataclasses.asdict(measure)
+    assert BinaryDecoder(Measure).decode(data) == measure
+
+
+def test_traceback_shows_generated_source():
+    measure = Measure(name=None, value=1, values=[], labels={})
+
+    try:
+        BinaryEncoder(Measure).encode(measure)
+    except AttributeError as error:
+        lines = traceback.format_exception(error)
+    else:  # pragma: no cover
+        raise AssertionError("AttributeError not raised")
+
+    assert any("value0.encode" in line for line in lines)
@@ -0,0 +1,257 @@
+import dataclasses
+import datetime
+import io
+
+import pytest
+
+from dataclasses_avroschema import columnar, container
+from dataclasses_avroschema.encoder import BinaryEncoder
+
+from .models import User
+
+np = pytest.importorskip("numpy")
+
+
+@dataclasses.dataclass
+class Event:
+    active: bool
+    count: int
+    happened_on: datetime.date
+    happened_at: datetime.datetime
+    lasted: datetime.time
+
+
+@dataclasses.dataclass
+class Measure:
+    active: bool
+    count: int
+    ratio: float
+    happened_at: datetime.datetime
+
+
+def make_events(count):
+    return [
+        Event(
+            active=index % 3 == 0,
+            count=index * 1000 - 5000,
+            happened_on=datetime.date(2020, 1, 1) + datetime.timedelta(days=index),
+            happened_at=datetime.datetime(2020, 1, 1, 10, index % 60, 0, 1000 * index),
+            lasted=datetime.time(0, 0, index % 60),
+        )
+        for index in range(count)
+    ]
+
+
+def make_measures(count):
+    return [
+        Measure(
+            active=index % 2 == 0,
+            count=-index,
+            ratio=index / 4,
+            happened_at=datetime.datetime(2020, 1, 1, 10, index % 60),
+        )
+        for index in range(count)
+    ]
+
+
+def assert_columns(columns, instances):
+    for name, values in columns.items():
+        expected = [getattr(instance, name) for instance in instances]
+        assert values.tolist() == expected, name
+
+
+def test_decode_varint_columns():
+    events = make_events(200)
+    data = BinaryEncoder(Event).encode_many(events)
+    decoder = columnar.ColumnarDecoder(Event)
+    columns = decoder.decode(data)
+
+    assert decoder.vectorized
+    assert columns["active"].dtype == np.bool_
+    assert columns["count"].dtype == np.int32
+    assert columns["happened_on"].dtype == np.dtype("datetime64[D]")
+    assert columns["happened_at"].dtype == np.dtype("datetime64[ms]")
+    assert columns["lasted"].dtype == np.dtype("timedelta64[ms]")
+
+    assert columns["active"].tolist() == [event.active for event in events]
+    assert columns["count"].tolist() == [event.count for event in events]
+    assert columns["happened_on"].tolist() == [event.happened_on for event in events]
+    assert columns["happened_at"].tolist() == [event.happened_at for event in events]
+    assert columns["lasted"].tolist() == [
+        datetime.timedelta(seconds=event.lasted.second) for event in events
+    ]
+
+
+def test_decode_columns_with_floats():
+    measures = make_measures(100)
+    data = BinaryEncoder(Measure).encode_many(measures)
+    decoder = columnar.ColumnarDecoder(Measure)
+    columns = decoder.decode(data)
+
+    assert not decoder.vectorized
+    assert columns["ratio"].dtype == np.float32
+    assert_columns(columns, measures)
+
+
+@pytest.mark.parametrize(
+    "klass, make", [(Event, make_events), (Measure, make_measures)]
+)
+def test_decode_count_and_position(klass, make):
+    instances = make(10)
+    data = b"xx" + BinaryEncoder(klass).encode_many(instances)
+    columns = columnar.ColumnarDecoder(klass).decode(data, count=4, position=2)
+
+    assert all(len(values) == 4 for values in columns.values())
+    assert columns["count"].tolist() == [instance.count for instance in instances[:4]]
+
+
+def test_decode_incomplete_records():
+    data = BinaryEncoder(Event).encode_many(make_events(3))
+
+    with pytest.raises(ValueError, match="complete records"):
+        columnar.ColumnarDecoder(Event).decode(data[:-1])
+
+    with pytest.raises(ValueError, match="does not contain 4 records"):
+        columnar.ColumnarDecoder(Event).decode(data, count=4)
+
+
+def test_fields_that_can_not_be_columns():
+    with pytest.raises(
+        ValueError, match="The field name of type string can not be a column"
+    ):
+        columnar.ColumnarDecoder(User)
+
+
+@pytest.mark.parametrize("codec", [container.NULL_CODEC, container.DEFLATE_CODEC])
+@pytest.mark.parametrize(
+    "klass, make", [(Event, make_events), (Measure, make_measures)]
+)
+def test_read_columns(tmp_path, codec, klass, make):
+    instances = make(50)
+    path = tmp_path / "data.avro"
+
+    with open(path, "wb") as fo:
+        container.write_container(fo, klass, instances, codec=codec, block_records=7)
+
+    columns = columnar.read_columns(path, klass)
+
+    assert columns["count"].tolist() == [instance.count for instance in instances]
+    assert columns["happened_at"].tolist() == [
+        instance.happened_at for instance in instances
+    ]
+
+
+def test_read_columns_parallel(tmp_path):
+    events = make_events(200)
+    path = tmp_path / "events.avro"
+
+    with open(path, "wb") as fo:
+        container.write_container(
+            fo, Event, events, codec=container.DEFLATE_CODEC, block_records=9
+        )
+
+    columns = columnar.read_columns_parallel(path, Event, workers=2, split_size=300)
+
+    for name, values in columnar.read_columns(path, Event).items():
+        assert values.tolist() == columns[name].tolist()
+    assert columns["count"].tolist() == [event.count for event in events]
+
+
+def test_read_columns_empty_file():
+    fo = io.BytesIO()
+    container.write_container(fo, Event, [])
+    columns = columnar.read_columns(fo.getvalue(), Event)
+
+    assert columns["happened_at"].dtype == np.dtype("datetime64[ms]")
+    assert len(columns["count"]) == 0
+
+
+@pytest.mark.parametrize(
+    "klass, make", [(Event, make_events), (Measure, make_measures)]
+)
+def test_encode_columns(klass, make):
+    instances = make(100)
+    columns = {
+        field.name: [getattr(instance, field.name) for instance in instances]
+        for field in dataclasses.fields(klass)
+    }
+    expected = BinaryEncoder(klass).encode_many(instances)
+    encoder = columnar.ColumnarEncoder(klass)
+
+    assert encoder.encode(columns) == (expected, 100)
+
+    # numpy arrays, for example the result of decoding the columns
+    decoded = columnar.ColumnarDecoder(klass).decode(expected)
+    assert encoder.encode(decoded) == (expected, 100)
+
+
+def test_encode_big_integers():
+    @dataclasses.dataclass
+    class Counter:
+        # timestamp-millis is a long
+        total: datetime.datetime
+
+    values = np.array([0, -1, 63, -64, 64, 2**40, -(2**62), 2**63 - 1, -(2**63)])
+    data, count = columnar.ColumnarEncoder(Counter).encode({"total": values})
+    decoded = columnar.ColumnarDecoder(Counter).decode(data)
+
+    assert count == len(values)
+    assert decoded["total"].view(np.int64).tolist() == values.tolist()
+
+
+def test_encode_out_of_range_integers():
+    @dataclasses.dataclass
+    class Counter:
+        count: int
+        # timestamp-millis is a long
+        total: datetime.datetime
+
+    encoder = columnar.ColumnarEncoder(Counter)
+    limits = {"count": [-(2**31), 2**31 - 1], "total": [-(2**63), 2**63 - 1]}
+    decoded = columnar.ColumnarDecoder(Counter).decode(encoder.encode(limits)[0])
+
+    assert decoded["count"].tolist() == limits["count"]
+    assert decoded["total"].view(np.int64).tolist() == limits["total"]
+
+    for count in (-(2**31) - 1, 2**31, 2**70):
+        with pytest.raises(ValueError, match="out of the range of an int"):
+            encoder.encode({"count": [0, count], "total": [0, 0]})
+
+    for total in (
+        np.array([0, 2**63], dtype=np.uint64),
+        [0, -(2**63) - 1],
+        [0, -(2**70)],
+    ):
+        with pytest.raises(ValueError, match="out of the range of a long"):
+            encoder.encode({"count": [0, 0], "total": total})
+
+
+def test_encode_invalid_columns():
+    encoder = columnar.ColumnarEncoder(Measure)
+    columns = {"active": [True], "count": [1], "ratio": [0.5]}
+
+    with pytest.raises(ValueError, match="The column happened_at is missing"):
+        encoder.encode(columns)
+
+    columns["happened_at"] = np.array(
+        ["2020-01-01", "2020-01-02"], dtype="datetime64[ms]"
+    )
+    with pytest.raises(ValueError, match="same length"):
+        encoder.encode(columns)
+
+    assert encoder.encode({name: [] for name in columns}) == (b"", 0)
+
+
+def test_write_columns(tmp_path):
+    events = make_events(25)
+    columns = columnar.ColumnarDecoder(Event).decode(
+        BinaryEncoder(Event).encode_many(events)
+    )
+    path = tmp_path / "events.avro"
+
+    with open(path, "wb") as fo:
+        columnar.write_columns(fo, Event, columns, block_records=10, codec="deflate")
+
+    with container.ContainerReader(path, Event) as reader:
+        assert [count for count, _, _ in reader.read_blocks()] == [10, 10, 5]
+        assert list(reader) == events
@@ -0,0 +1,191 @@
+import dataclasses
+import enum
+import json
+import typing
+
+import pytest
+
+from dataclasses_avroschema import compatibility
+from dataclasses_avroschema.compatibility import (
+    BACKWARD,
+    FORWARD,
+    FULL,
+    check_compatibility,
+    check_resolution,
+)
+from dataclasses_avroschema.schema_generator import SchemaGenerator
+
+
+class Color(enum.Enum):
+    BLUE = "BLUE"
+    RED = "RED"
+
+
+def make_schema(*fields: typing.Dict) -> typing.Dict:
+    return {"type": "record", "name": "User", "fields": list(fields)}
+
+
+NAME = {"name": "name", "type": "string"}
+AGE = {"name": "age", "type": "int"}
+
+
+def test_compatible_schemas():
+    @dataclasses.dataclass
+    class User:
+        name: str
+        age: int
+
+    old_schema = SchemaGenerator(User).avro_schema()
+
+    @dataclasses.dataclass
+    class User:  # noqa: F811
+        name: str
+        age: int
+        email: typing.Optional[str] = None
+
+    result = check_compatibility(User, old_schema, FULL)
+
+    assert result.compatible
+    assert result.errors == ()
+
+
+def test_new_field_without_default():
+    old_schema = make_schema(NAME)
+    new_schema = make_schema(NAME, AGE)
+
+    result = check_compatibility(new_schema, old_schema, FULL)
+
+    assert not result.compatible
+    assert result.errors == (
+        "BACKWARD: User.age: the field is not in the writer schema and has no default",
+    )
+    assert check_compatibility(new_schema, old_schema, FORWARD).compatible
+
+
+def test_promotion():
+    old_schema = make_schema(NAME, AGE)
+    new_schema = make_schema(NAME, {"name": "age", "type": "double"})
+
+    assert check_compatibility(new_schema, old_schema, BACKWARD).compatible
+    assert check_compatibility(new_schema, old_schema, FORWARD).errors == (
+        "FORWARD: User.age: double can not be read as int",
+    )
+
+
+def test_enum_symbols():
+    old_schema = make_schema(
+        {
+            "name": "color",
+            "type": {"type": "enum", "name": "color", "symbols": ["BLUE", "RED"]},
+        }
+    )
+    new_schema = make_schema(
+        {
+            "name": "color",
+            "type": {"type": "enum", "name": "color", "symbols": ["BLUE"]},
+        }
+    )
+
+    assert check_compatibility(new_schema, old_schema).errors == (
+        "BACKWARD: User.color: the symbol RED is not in the enum color, "
+        "which has no default",
+    )
+
+    new_schema["fields"][0]["type"]["default"] = "BLUE"
+    assert check_compatibility(new_schema, old_schema).compatible
+
+
+def test_writer_unions():
+    old_schema = make_schema({"name": "age", "type": ["null", "int", "string"]})
+    new_schema = make_schema({"name": "age", "type": ["null", "int"]})
+
+    assert check_compatibility(new_schema, old_schema).errors == (
+        "BACKWARD: User.age: string of the union ['null', 'int', 'string'] "
+        "can not be read as the union ['null', 'int']",
+    )
+    assert check_compatibility(new_schema, old_schema, FORWARD).compatible
+
+
+def test_avsc_file(tmp_path):
+    @dataclasses.dataclass
+    class User:
+        name: str
+        color: Color
+
+    path = tmp_path / "user.avsc"
+    path.write_text(SchemaGenerator(User).avro_schema())
+
+    assert check_compatibility(User, path, FULL).compatible
+    assert check_compatibility(User, str(path), FULL).compatible
+    assert check_resolution(path, json.dumps(make_schema(NAME))) is None
+    assert check_resolution(str(path), f"  {json.dumps(make_schema(NAME))}") is None
+
+    with pytest.raises(FileNotFoundError):
+        check_compatibility(User, str(tmp_path / "missing.avsc"))
+
+
+def test_verdict_cache():
+    old_schema = make_schema(NAME)
+    new_schema = make_schema(NAME, AGE)
+    error = check_resolution(old_schema, new_schema)
+
+    assert error is not None
+    assert error in compatibility._verdicts.values()
+    assert check_resolution(json.dumps(old_schema), json.dumps(new_schema)) == error
+
+    # the defaults are not in the canonical form but they change the verdict
+    new_schema = make_schema(NAME, dict(AGE, default=0))
+    assert check_resolution(old_schema, new_schema) is None
+
+
+def test_invalid_compatibility():
+    with pytest.raises(ValueError):
+        check_compatibility(make_schema(NAME), make_schema(NAME), "TRANSITIVE")
+
+
+def test_logical_types():
+    old_schema = make_schema(
+        {
+            "name": "created_at",
+            "type": {"type": "long", "logicalType": "timestamp-millis"},
+        }
+    )
+    new_schema = make_schema(
+        {
+            "name": "created_at",
+            "type": {"type": "long", "logicalType": "timestamp-micros"},
+        }
+    )
+
+    # the writers that only differ in the logical type do not share verdicts
+    assert check_resolution(old_schema, old_schema) is None
+    assert check_resolution(new_schema, old_schema) == (
+        "User.created_at: timestamp-micros can not be read as timestamp-millis"
+    )
+    assert check_compatibility(new_schema, old_schema, FULL).errors == (
+        "FORWARD: User.created_at: timestamp-micros can not be read as "
+        "timestamp-millis",
+    )
+
+
+def test_decimal_scale():
+    def decimal_schema(precision, scale):
+        return make_schema(
+            {
+                "name": "amount",
+                "type": {
+                    "type": "bytes",
+                    "logicalType": "decimal",
+                    "precision": precision,
+                    "scale": scale,
+                },
+            }
+        )
+
+    assert check_compatibility(
+        decimal_schema(5, 3), decimal_schema(5, 2), FULL
+    ).errors == (
+        "BACKWARD: User.amount: decimal(5, 2) can not be read as decimal(5, 3)",
+        "FORWARD: User.amount: decimal(5, 3) can not be read as decimal(5, 2)",
+    )
+    assert check_compatibility(decimal_schema(6, 3), decimal_schema(5, 2)).compatible
@@ -0,0 +1,210 @@
+import dataclasses
+import datetime
+import json
+import typing
+
+import pytest
+
+from dataclasses_avroschema import confluent, types
+from dataclasses_avroschema.schema_generator import SchemaGenerator
+
+from .registry_server import FakeRegistryServer
+
+
+@dataclasses.dataclass
+class Click:
+    "A click"
+
+    url: str
+    user_id: int
+    payload: typing.Optional[bytes] = None
+
+
+@dataclasses.dataclass
+class View:
+    url: str
+
+
+def test_frame():
+    data = confluent.frame(258, b"payload")
+
+    assert data == b"\x00\x00\x00\x01\x02payload"
+    schema_id, payload = confluent.unframe(data)
+    assert schema_id == 258
+    assert payload == b"payload"
+
+    with pytest.raises(ValueError, match="Invalid magic byte 1"):
+        confluent.unframe(b"\x01" + data[1:])
+
+    with pytest.raises(ValueError, match="too short"):
+        confluent.unframe(b"\x00\x00")
+
+
+def test_serialize_and_deserialize():
+    registry = confluent.InMemoryRegistry()
+    serializer = confluent.ConfluentSerializer(
+        Click, registry, id_cache=confluent.SchemaIdCache()
+    )
+    click = Click("https://example.com", 10, b"data")
+    data = serializer.serialize(click)
+
+    assert serializer.subject == "Click"
+    assert data[:5] == b"\x00\x00\x00\x00\x01"
+    assert registry.subjects == {"Click": [1]}
+    assert confluent.ConfluentDeserializer(Click, registry).deserialize(data) == click
+
+
+def test_schema_id_cached_by_fingerprint(tmp_path):
+    class CountingRegistry(confluent.InMemoryRegistry):
+        calls = 0
+
+        def register(self, subject, schema):
+            self.calls += 1
+            return super().register(subject, schema)
+
+    registry = CountingRegistry()
+    path = tmp_path / "ids.json"
+    id_cache = confluent.SchemaIdCache(path)
+
+    for _ in range(3):
+        confluent.ConfluentSerializer(Click, registry, id_cache=id_cache).serialize(
+            Click("url", 1)
+        )
+    assert registry.calls == 1
+
+    # a restarted worker loads the ids from the file
+    restarted_cache = confluent.SchemaIdCache(path)
+    serializer = confluent.ConfluentSerializer(
+        Click, registry, id_cache=restarted_cache
+    )
+    assert serializer.schema_id == 1
+    assert registry.calls == 1
+    fingerprint = SchemaGenerator(Click).resolution_fingerprint()
+    assert restarted_cache.get("Click", fingerprint) == 1
+
+
+def test_schema_id_logical_types():
+    @dataclasses.dataclass
+    class Event:
+        at: datetime.datetime
+
+    old_event = Event
+
+    @dataclasses.dataclass
+    class Event:  # noqa: F811
+        at: types.TimestampMicros
+
+    registry = confluent.InMemoryRegistry()
+    id_cache = confluent.SchemaIdCache()
+    schema_ids = [
+        confluent.ConfluentSerializer(
+            klass, registry, subject="events", id_cache=id_cache
+        ).schema_id
+        for klass in (old_event, Event)
+    ]
+
+    # the canonical forms are the same, the logical types are not
+    assert (
+        SchemaGenerator(old_event).fingerprint() == SchemaGenerator(Event).fingerprint()
+    )
+    assert schema_ids == [1, 2]
+
+
+def test_schema_id_cache_per_registry():
+    first_registry = confluent.InMemoryRegistry()
+    first_registry.register("View", SchemaGenerator(View).avro_schema())
+    click = Click("url", 1)
+
+    assert confluent.ConfluentSerializer(Click, first_registry).schema_id == 2
+
+    # the id assigned by the first registry is not used with the second one
+    second_registry = confluent.InMemoryRegistry()
+    data = confluent.ConfluentSerializer(Click, second_registry).serialize(click)
+
+    assert confluent.unframe(data)[0] == 1
+    assert (
+        confluent.ConfluentDeserializer(Click, second_registry).deserialize(data)
+        == click
+    )
+    assert confluent.get_id_cache(first_registry) is not confluent.get_id_cache(
+        second_registry
+    )
+
+
+def test_file_registry(tmp_path):
+    path = tmp_path / "registry.json"
+    registry = confluent.FileRegistry(path)
+    click_id = registry.register("clicks", SchemaGenerator(Click).avro_schema())
+    view_id = registry.register("views", SchemaGenerator(View).avro_schema())
+
+    reopened = confluent.FileRegistry(path)
+
+    assert (click_id, view_id) == (1, 2)
+    assert reopened.subjects == {"clicks": [1], "views": [2]}
+    assert reopened.register("other", SchemaGenerator(Click).avro_schema()) == 1
+    assert (
+        json.loads(reopened.get_schema(2))
+        == SchemaGenerator(View).avro_schema_to_python()
+    )
+
+    with pytest.raises(confluent.SchemaRegistryError, match="Schema 3 not found"):
+        reopened.get_schema(3)
+
+
+def test_registry_logical_types():
+    def make_schema(logical_type):
+        return json.dumps(
+            {
+                "type": "record",
+                "name": "Event",
+                "fields": [
+                    {
+                        "name": "at",
+                        "type": {"type": "long", "logicalType": logical_type},
+                    }
+                ],
+            }
+        )
+
+    registry = confluent.InMemoryRegistry()
+
+    assert registry.register("events", make_schema("timestamp-millis")) == 1
+    assert registry.register("events", make_schema("timestamp-micros")) == 2
+    assert registry.subjects == {"events": [1, 2]}
+
+
+def test_deserialize_other_schema():
+    registry = confluent.InMemoryRegistry()
+    data = confluent.ConfluentSerializer(
+        View, registry, id_cache=confluent.SchemaIdCache()
+    ).serialize(View("url"))
+
+    with pytest.raises(
+        ValueError, match="the record View can not be read as the record Click"
+    ):
+        confluent.ConfluentDeserializer(Click, registry).deserialize(data)
+
+
+def test_http_registry():
+    with FakeRegistryServer() as server:
+        registry = confluent.HttpRegistry(server.url)
+        serializer = confluent.ConfluentSerializer(
+            Click, registry, subject="clicks-value", id_cache=confluent.SchemaIdCache()
+        )
+        deserializer = confluent.ConfluentDeserializer(Click, registry)
+        clicks = [Click("url", index) for index in range(3)]
+
+        assert [
+            deserializer.deserialize(serializer.serialize(click)) for click in clicks
+        ] == clicks
+        assert server.requests == [
+            ("POST", "/subjects/clicks-value/versions"),
+            ("GET", "/schemas/ids/1"),
+        ]
+
+        with pytest.raises(confluent.SchemaRegistryError, match="status 404"):
+            registry.get_schema(5)
+
+        server.fail = True
+        with pytest.raises(confluent.SchemaRegistryError, match="status 500"):
+            registry.register("views", SchemaGenerator(View).avro_schema())
@@ -0,0 +1,313 @@
+import concurrent.futures
+import dataclasses
+import io
+import json
+
+import fastavro
+import pytest
+
+from dataclasses_avroschema import container
+from dataclasses_avroschema.schema_generator import SchemaGenerator
+
+from .models import Address, make_user, without_defaults
+
+
+def count_blocks(data: bytes, sync_marker: bytes) -> int:
+    # the header ends with the sync marker too
+    return data.count(sync_marker) - 1
+
+
+@pytest.mark.parametrize("codec", [container.NULL_CODEC, container.DEFLATE_CODEC])
+def test_write_container(user_class, codec):
+    users = [make_user(age=age) for age in range(25)]
+    fo = io.BytesIO()
+    container.write_container(fo, user_class, users, codec=codec)
+
+    fo.seek(0)
+    reader = fastavro.reader(fo)
+    records = list(reader)
+
+    assert len(records) == 25
+    assert [record["age"] for record in records] == list(range(25))
+    assert reader.metadata[container.CODEC_KEY] == codec
+    assert json.loads(reader.metadata[container.SCHEMA_KEY]) == (
+        SchemaGenerator(user_class).avro_schema_to_python()
+    )
+
+
+def test_blocks_by_records(user_class):
+    sync_marker = b"s" * container.SYNC_SIZE
+    fo = io.BytesIO()
+    container.write_container(
+        fo,
+        user_class,
+        (make_user() for _ in range(10)),
+        block_records=3,
+        sync_marker=sync_marker,
+    )
+
+    assert count_blocks(fo.getvalue(), sync_marker) == 4
+
+
+def test_blocks_by_size(user_class):
+    sync_marker = b"s" * container.SYNC_SIZE
+    fo = io.BytesIO()
+
+    with container.ContainerWriter(
+        fo, user_class, block_size=1, sync_marker=sync_marker
+    ) as writer:
+        for _ in range(5):
+            writer.write(make_user())
+
+    assert count_blocks(fo.getvalue(), sync_marker) == 5
+
+
+def test_metadata(user_class):
+    fo = io.BytesIO()
+    container.write_container(fo, user_class, [], metadata={"owner": b"team"})
+
+    fo.seek(0)
+    reader = fastavro.reader(fo)
+
+    assert list(reader) == []
+    assert reader.metadata["owner"] == "team"
+
+
+def test_invalid_options(user_class):
+    with pytest.raises(ValueError, match="Unsupported codec"):
+        container.ContainerWriter(io.BytesIO(), user_class, codec="lzma")
+
+    with pytest.raises(ValueError, match="sync marker"):
+        container.ContainerWriter(io.BytesIO(), user_class, sync_marker=b"s")
+
+
+@pytest.mark.parametrize(
+    "executor_class", [None, concurrent.futures.ProcessPoolExecutor]
+)
+def test_parallel_compression(user_class, executor_class):
+    users = [make_user(age=age) for age in range(100)]
+    sync_marker = b"s" * container.SYNC_SIZE
+    options = dict(codec=container.DEFLATE_CODEC, sync_marker=sync_marker)
+
+    fo = io.BytesIO()
+    container.write_container(fo, user_class, users, block_records=3, **options)
+
+    parallel_fo = io.BytesIO()
+    if executor_class is None:
+        container.write_container(
+            parallel_fo, user_class, users, block_records=3, workers=4, **options
+        )
+    else:
+        with executor_class(2) as executor:
+            container.write_container(
+                parallel_fo,
+                user_class,
+                users,
+                block_records=3,
+                executor=executor,
+                **options
+            )
+
+    # the blocks are written in order
+    assert parallel_fo.getvalue() == fo.getvalue()
+    assert list(container.read_container(parallel_fo.getvalue(), user_class)) == users
+
+
+def test_parallel_compression_error(user_class):
+    writer = container.ContainerWriter(
+        io.BytesIO(), user_class, codec=container.DEFLATE_CODEC, workers=2
+    )
+    writer.write_encoded(b"invalid", 1)
+    writer._compress = None
+    writer.write(make_user())
+
+    with pytest.raises(TypeError):
+        writer.close()
+    assert writer.executor._shutdown
+
+
+@pytest.mark.parametrize("codec", [container.SNAPPY_CODEC, container.ZSTANDARD_CODEC])
+def test_optional_codecs(user_class, codec):
+    pytest.importorskip(container.OPTIONAL_CODECS[codec])
+    users = [make_user(age=age) for age in range(20)]
+    fo = io.BytesIO()
+    container.write_container(
+        fo, user_class, users, codec=codec, block_records=6, workers=2
+    )
+
+    assert list(container.read_container(fo.getvalue(), user_class)) == users
+
+
+def test_missing_codec_module(monkeypatch, user_class):
+    monkeypatch.setitem(container.OPTIONAL_CODECS, container.SNAPPY_CODEC, "missing")
+    monkeypatch.setattr(container, "_codec_modules", {})
+
+    with pytest.raises(ImportError, match=r"dataclasses-avroschema\[snappy\]"):
+        container.ContainerWriter(
+            io.BytesIO(), user_class, codec=container.SNAPPY_CODEC
+        )
+
+
+@pytest.mark.parametrize("codec", [container.NULL_CODEC, container.DEFLATE_CODEC])
+def test_read_container(tmp_path, user_class, user, codec):
+    users = [user] + [make_user(age=age) for age in range(20)]
+    path = tmp_path / "users.avro"
+
+    with open(path, "wb") as fo:
+        container.write_container(fo, user_class, users, codec=codec, block_records=6)
+
+    assert list(container.read_container(path, user_class)) == users
+
+    with open(path, "rb") as fo:
+        assert list(container.read_container(fo, user_class)) == users
+
+    assert list(container.read_container(path.read_bytes(), user_class)) == users
+    assert list(
+        container.read_container(io.BytesIO(path.read_bytes()), user_class)
+    ) == (users)
+
+
+def test_split(user_class):
+    sync_marker = b"s" * container.SYNC_SIZE
+    fo = io.BytesIO()
+    container.write_container(
+        fo,
+        user_class,
+        [make_user(age=age) for age in range(50)],
+        block_records=4,
+        sync_marker=sync_marker,
+    )
+    data = fo.getvalue()
+
+    with container.ContainerReader(data, user_class) as reader:
+        ranges = reader.split(split_size=1000)
+        assert reader.split(split_size=len(data)) == [(reader._position, len(data))]
+
+        assert len(ranges) > 2
+        assert ranges[0][0] == reader._position and ranges[-1][1] == len(data)
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start
+            assert data[:start].endswith(sync_marker)
+
+        ages = [
+            user.age for start, end in ranges for user in reader.records(start, end)
+        ]
+        assert ages == list(range(50))
+
+
+def sum_ages(path, klass, start, end):
+    with container.ContainerReader(path, klass) as reader:
+        return sum(user.age for user in reader.records(start, end))
+
+
+def test_map_ranges(tmp_path, user_class):
+    path = tmp_path / "users.avro"
+
+    with open(path, "wb") as fo:
+        container.write_container(
+            fo, user_class, [make_user(age=age) for age in range(100)], block_records=5
+        )
+
+    results = list(
+        container.map_ranges(path, user_class, sum_ages, workers=2, split_size=3000)
+    )
+
+    assert len(results) > 2
+    assert sum(results) == sum(range(100))
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_read_container_parallel(tmp_path, user_class, ordered):
+    users = [make_user(age=age) for age in range(100)]
+    path = tmp_path / "users.avro"
+
+    with open(path, "wb") as fo:
+        container.write_container(
+            fo, user_class, users, codec=container.DEFLATE_CODEC, block_records=7
+        )
+
+    instances = list(
+        container.read_container_parallel(
+            path, user_class, workers=2, ordered=ordered, split_size=2000
+        )
+    )
+
+    if ordered:
+        assert instances == users
+    else:
+        assert sorted(instances, key=lambda user: user.age) == users
+
+    with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        assert (
+            list(
+                container.read_container_parallel(
+                    path, user_class, executor=executor, split_size=2000
+                )
+            )
+            == users
+        )
+
+
+def test_read_blocks(user_class):
+    fo = io.BytesIO()
+    container.write_container(
+        fo, user_class, (make_user() for _ in range(10)), block_records=4
+    )
+
+    with container.ContainerReader(fo.getvalue(), user_class) as reader:
+        assert [count for count, _, _ in reader.read_blocks()] == [4, 4, 2]
+        assert reader.codec == container.NULL_CODEC
+        assert (
+            reader.writer_schema == SchemaGenerator(user_class).avro_schema_to_python()
+        )
+
+
+def test_read_container_written_by_fastavro(user_class):
+    users = [make_user(age=age) for age in range(5)]
+    schema = fastavro.parse_schema(
+        without_defaults(SchemaGenerator(user_class).avro_schema_to_python())
+    )
+    fo = io.BytesIO()
+    fastavro.writer(
+        fo, schema, [dataclasses.asdict(user) for user in users], codec="deflate"
+    )
+
+    assert list(container.read_container(fo.getvalue(), user_class)) == users
+
+
+def test_read_invalid_container(user_class):
+    with pytest.raises(ValueError, match="not an avro Object Container File"):
+        container.ContainerReader(b"avro", user_class)
+
+    sync_marker = b"s" * container.SYNC_SIZE
+    fo = io.BytesIO()
+    container.write_container(fo, user_class, [make_user()], sync_marker=sync_marker)
+    data = fo.getvalue()[:-1] + b"x"
+
+    with pytest.raises(ValueError, match="Invalid sync marker"):
+        list(container.read_container(data, user_class))
+
+
+def test_read_container_with_other_schema(user_class):
+    fo = io.BytesIO()
+    container.write_container(fo, Address, [Address("Main street", 10)])
+
+    with pytest.raises(
+        ValueError, match="the record Address can not be read as the record User"
+    ):
+        container.ContainerReader(fo.getvalue(), user_class)
+
+
+@pytest.mark.parametrize("codec", [container.NULL_CODEC, container.DEFLATE_CODEC])
+def test_read_container_zero_copy(tmp_path, user_class, codec):
+    users = [make_user(md5=bytes([age]) * 4) for age in range(10)]
+    path = tmp_path / "users.avro"
+
+    with open(path, "wb") as fo:
+        container.write_container(fo, user_class, users, codec=codec, block_records=3)
+
+    decoded = list(container.read_container(path, user_class, zero_copy=True))
+
+    # the views of the mapped file are still valid after closing the reader
+    assert decoded == users
+    assert all(isinstance(user.md5, memoryview) for user in decoded)
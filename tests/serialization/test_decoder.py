@@ -0,0 +1,228 @@
+import dataclasses
+import datetime
+import decimal
+import io
+import typing
+import uuid
+
+import faust
+import pytest
+from fastavro import parse_schema, schemaless_writer
+
+from dataclasses_avroschema import types
+from dataclasses_avroschema.decoder import (
+    BinaryDecoder,
+    DecoderCompiler,
+    can_set_attributes,
+)
+from dataclasses_avroschema.encoder import BinaryEncoder
+from dataclasses_avroschema.json_encoding import JsonDecoder, JsonEncoder
+from dataclasses_avroschema.resolution import ResolvingDecoder
+from dataclasses_avroschema.schema_generator import SchemaGenerator
+
+from .models import Address, without_defaults
+
+
+def test_decode(user_class, user):
+    data = BinaryEncoder(user_class).encode(user)
+    decoded = BinaryDecoder(user_class).decode(data)
+
+    # timestamp-millis and time-millis have precision of milliseconds
+    assert decoded == user
+    assert type(decoded.address) is Address
+    assert type(decoded.friends[0]) is user_class
+    assert type(decoded.user_id) is uuid.UUID
+
+
+def test_decode_data_written_by_fastavro():
+    @dataclasses.dataclass
+    class Event:
+        name: str
+        count: int
+        ratio: float
+        happened_on: datetime.date
+        happened_at: datetime.datetime
+        tags: typing.Dict[str, int]
+        description: str = None
+
+    schema = parse_schema(
+        without_defaults(SchemaGenerator(Event).avro_schema_to_python())
+    )
+    record = {
+        "name": "click",
+        "count": -7,
+        "ratio": 0.5,
+        "happened_on": datetime.date(1969, 12, 31),
+        "happened_at": datetime.datetime(2019, 10, 12, 17, 57, 42, 179000),
+        "tags": {"a": 1, "b": -2},
+        "description": None,
+    }
+    data = io.BytesIO()
+    schemaless_writer(data, schema, record)
+
+    assert BinaryDecoder(Event).decode(data.getvalue()) == Event(**record)
+
+
+def test_decode_decimals_written_by_fastavro():
+    @dataclasses.dataclass
+    class Invoice:
+        total: decimal.Decimal
+        fee: decimal.Decimal
+        fees: typing.List[decimal.Decimal]
+
+    schema = {
+        "type": "record",
+        "name": "Invoice",
+        "fields": [
+            {
+                "name": "total",
+                "type": {
+                    "type": "bytes",
+                    "logicalType": "decimal",
+                    "precision": 20,
+                    "scale": 2,
+                },
+            },
+            {
+                "name": "fee",
+                "type": {
+                    "type": "fixed",
+                    "name": "fee",
+                    "size": 3,
+                    "logicalType": "decimal",
+                    "precision": 6,
+                    "scale": 3,
+                },
+            },
+            # the references to the fixed are decimals too
+            {"name": "fees", "type": {"type": "array", "items": "fee"}},
+        ],
+    }
+    invoice = Invoice(
+        decimal.Decimal("-123456789012345678.90"),
+        decimal.Decimal("1.5"),
+        [decimal.Decimal("0.001"), decimal.Decimal("-999.999")],
+    )
+    data = io.BytesIO()
+    schemaless_writer(data, parse_schema(schema), dataclasses.asdict(invoice))
+    decode = DecoderCompiler({"Invoice": Invoice}).build(schema, "Invoice")
+
+    assert decode(data.getvalue(), 0)[0] == invoice
+
+
+def test_decode_many(user_class, user):
+    encoder = BinaryEncoder(user_class)
+    decoder = BinaryDecoder(user_class)
+    data = encoder.encode_many([user, user, user])
+
+    assert decoder.decode_many(data) == [user, user, user]
+    assert decoder.decode_many(data, count=2) == [user, user]
+
+
+def test_decode_uses_constructor():
+    @dataclasses.dataclass
+    class User:
+        name: str
+        upper_name: str = dataclasses.field(init=False, default="")
+
+        def __post_init__(self):
+            self.upper_name = self.name.upper()
+
+    @dataclasses.dataclass
+    class Team:
+        name: str
+        users: typing.List[User]
+
+    assert not can_set_attributes(User)
+    assert can_set_attributes(Team)
+
+
+def test_decode_frozen_dataclass():
+    @dataclasses.dataclass(frozen=True)
+    class Point:
+        x: int
+        label: str
+
+    @dataclasses.dataclass
+    class WriterPoint:
+        x: int
+        y: int
+        label: str
+
+    @dataclasses.dataclass
+    class Tracked:
+        label: str
+
+        def __setattr__(self, name, value):
+            super().__setattr__(name, value.upper())
+
+    point = Point(1, "a")
+    writer_schema = (
+        SchemaGenerator(WriterPoint).avro_schema().replace("WriterPoint", "Point")
+    )
+
+    assert not can_set_attributes(Point)
+    assert not can_set_attributes(Tracked)
+    assert BinaryDecoder(Point).decode(BinaryEncoder(Point).encode(point)) == point
+    assert JsonDecoder(Point).decode(JsonEncoder(Point).encode(point)) == point
+    assert (
+        ResolvingDecoder(Point, writer_schema).decode(
+            BinaryEncoder(WriterPoint).encode(WriterPoint(1, 2, "a"))
+        )
+        == point
+    )
+    assert BinaryDecoder(Tracked).decode(b"\x02a") == Tracked("A")
+
+
+def test_decode_faust_record():
+    class User(faust.Record):
+        name: str
+        age: int
+        pets: typing.List[str]
+
+    user = User(name="john", age=20, pets=["dog"])
+    data = BinaryEncoder(User).encode(user)
+    decoded = BinaryDecoder(User).decode(data)
+
+    assert not can_set_attributes(User)
+    assert isinstance(decoded, User)
+    assert decoded == user
+
+
+@dataclasses.dataclass
+class Payload:
+    name: str
+    content: bytes
+    checksum: types.Fixed = types.Fixed(4)
+    attachment: typing.Optional[bytes] = None
+
+
+def test_decode_zero_copy():
+    payload = Payload("report", b"x" * 5000, b"abcd", b"attached")
+    data = bytearray(BinaryEncoder(Payload).encode(payload))
+    decoder = BinaryDecoder(Payload, zero_copy=True)
+    decoded = decoder.decode(data)
+
+    assert decoded == payload
+    for value in (decoded.content, decoded.checksum, decoded.attachment):
+        assert isinstance(value, memoryview)
+        assert value.obj is data
+
+    # the slices are views of the data, not copies
+    data[-2] = ord("X")
+    assert decoded.attachment == b"attachXd"
+
+    # the data can not be resized while the slices are alive
+    with pytest.raises(BufferError):
+        data.clear()
+
+    assert type(BinaryDecoder(Payload).decode(bytes(data)).content) is bytes
+
+
+def test_decode_many_zero_copy():
+    payloads = [Payload(str(index), bytes([index]) * 10, b"abcd") for index in range(3)]
+    data = BinaryEncoder(Payload).encode_many(payloads)
+    decoded = BinaryDecoder(Payload, zero_copy=True).decode_many(data)
+
+    assert decoded == payloads
+    assert all(isinstance(payload.content, memoryview) for payload in decoded)
@@ -0,0 +1,184 @@
+import dataclasses
+import datetime
+import decimal
+import io
+import typing
+
+import pytest
+from fastavro import parse_schema, schemaless_reader, schemaless_writer
+
+from dataclasses_avroschema import binary, types
+from dataclasses_avroschema.encoder import BinaryEncoder, compile_encoder
+from dataclasses_avroschema.schema_generator import SchemaGenerator
+
+from .models import without_defaults
+
+
+def fastavro_read(klass, data):
+    schema = parse_schema(
+        without_defaults(SchemaGenerator(klass).avro_schema_to_python())
+    )
+    return schemaless_reader(io.BytesIO(data), schema)
+
+
+def test_encode(user_class, user):
+    data = BinaryEncoder(user_class).encode(user)
+    record = fastavro_read(user_class, data)
+
+    assert record["name"] == user.name
+    assert record["age"] == user.age
+    assert record["pets"] == user.pets
+    assert record["accounts"] == user.accounts
+    assert record["address"] == {"street": "Main street", "street_number": 10}
+    assert len(record["previous_addresses"]) == 2
+    assert record["friends"][0]["name"] == "peter"
+    assert record["friends"][0]["nickname"] is None
+    assert record["friends"][0]["contact"] == 5
+    assert record["birthday"] == user.birthday
+    assert record["created_at"] == user.created_at.replace(tzinfo=datetime.timezone.utc)
+    assert record["wake_up"] == user.wake_up
+    assert record["user_id"] == user.user_id
+    assert record["md5"] == user.md5
+    assert record["favorite_color"] == "YELLOW"
+    assert record["has_car"] is True
+    assert record["money"] == 10.5
+    assert record["nickname"] == "johnny"
+
+
+def test_encode_same_as_fastavro():
+    class User:
+        name: str
+        age: int
+        emails: typing.List[str]
+        has_car: bool = False
+        nickname: str = None
+
+    schema = parse_schema(
+        without_defaults(SchemaGenerator(User).avro_schema_to_python())
+    )
+    user = User("john", -123456789, ["a@b.com", ""], True, None)
+    expected = io.BytesIO()
+    schemaless_writer(expected, schema, user.__dict__)
+
+    assert BinaryEncoder(User).encode(user) == expected.getvalue()
+
+
+def test_encode_logical_type_arrays():
+    @dataclasses.dataclass
+    class Calendar:
+        days: typing.List[datetime.date]
+        alarms: typing.List[datetime.time]
+        events: typing.List[datetime.datetime]
+
+    calendar = Calendar(
+        [datetime.date(2020, 1, 2), datetime.date(1969, 7, 20)],
+        [datetime.time(7, 30, 15, 250999)],
+        [datetime.datetime(2020, 1, 2, 3, 4, 5, 6000)] * 70,
+    )
+    data = BinaryEncoder(Calendar).encode(calendar)
+    record = fastavro_read(Calendar, data)
+
+    assert record["days"] == calendar.days
+    assert record["alarms"] == [datetime.time(7, 30, 15, 250000)]
+    assert record["events"] == [
+        event.replace(tzinfo=datetime.timezone.utc) for event in calendar.events
+    ]
+    assert "to_logical_types" in BinaryEncoder(Calendar).source
+
+
+def test_encode_precise_types_same_as_fastavro():
+    @dataclasses.dataclass
+    class Payment:
+        paid_at: types.TimestampMicros
+        booked_at: types.LocalTimestampMillis
+        settled_at: typing.Optional[types.LocalTimestampMicros]
+        cutoff: types.TimeMicros
+        retries: typing.List[types.TimestampMicros]
+        amount: types.Decimal = types.Decimal(12, 2)
+        fee: types.Decimal = types.Decimal(6, 4, size=4)
+
+    payment = Payment(
+        datetime.datetime(2020, 1, 2, 3, 4, 5, 123456),
+        datetime.datetime(2020, 1, 2, 3, 4, 5, 123000),
+        datetime.datetime(1969, 12, 31, 23, 59, 59, 999999),
+        datetime.time(17, 30, 0, 1),
+        [datetime.datetime(2020, 1, 2, 3, 4, 5, 7)] * 3,
+        decimal.Decimal("-1234567890.12"),
+        decimal.Decimal("0.0125"),
+    )
+    schema = parse_schema(
+        without_defaults(SchemaGenerator(Payment).avro_schema_to_python())
+    )
+    expected = io.BytesIO()
+    schemaless_writer(expected, schema, dataclasses.asdict(payment))
+
+    assert BinaryEncoder(Payment).encode(payment) == expected.getvalue()
+
+    with pytest.raises(ValueError, match="is not a valid decimal of precision 12"):
+        BinaryEncoder(Payment).encode(
+            dataclasses.replace(payment, amount=decimal.Decimal("0.001"))
+        )
+
+
+def test_encode_into_and_many(user_class, user):
+    encoder = BinaryEncoder(user_class)
+    data = encoder.encode(user)
+
+    buffer = bytearray(b"header")
+    encoder.encode_into(user, buffer)
+    assert buffer == b"header" + data
+
+    assert encoder.encode_many([user, user]) == data + data
+    # the buffer is reused, the returned bytes are not modified
+    assert encoder.encode(user) == data
+
+
+def test_encoder_compiled_once(user_class):
+    assert compile_encoder(user_class) is compile_encoder(user_class)
+
+
+def test_encode_invalid_values(user_class, user):
+    encoder = BinaryEncoder(user_class)
+
+    user.favorite_color = "RED"
+    with pytest.raises(ValueError, match="'RED' is not a valid symbol"):
+        encoder.encode(user)
+
+    user.favorite_color = "BLUE"
+    user.md5 = b"abc"
+    with pytest.raises(ValueError, match="The fixed md5 must have 4 bytes"):
+        encoder.encode(user)
+
+    user.md5 = b"abcd"
+    user.contact = 10.5
+    with pytest.raises(ValueError, match="does not match any type of the union"):
+        encoder.encode(user)
+
+
+def test_encode_out_of_range_integers():
+    @dataclasses.dataclass
+    class Counter:
+        value: int
+
+    encoder = BinaryEncoder(Counter)
+
+    for value in (-(2**31), 2**31 - 1):
+        assert fastavro_read(Counter, encoder.encode(Counter(value))) == {
+            "value": value
+        }
+
+    for value in (-(2**31) - 1, 2**31):
+        with pytest.raises(ValueError, match="out of the range of an int"):
+            encoder.encode(Counter(value))
+
+
+def test_write_long_range():
+    for value in (-(2**63), 2**63 - 1):
+        buffer = bytearray()
+        binary.write_long(buffer, value)
+        assert binary.read_long(buffer, 0) == (value, len(buffer))
+        assert len(buffer) == 10
+
+    for value in (-(2**63) - 1, 2**63, -(2**70)):
+        with pytest.raises(ValueError, match="out of the range of a long"):
+            binary.write_long(bytearray(), value)
@@ -0,0 +1,90 @@
+import typing
+
+import faust
+import pytest
+from faust.serializers import codecs
+from faust.serializers.registry import Registry
+
+from dataclasses_avroschema import confluent
+from dataclasses_avroschema.encoder import BinaryEncoder
+from dataclasses_avroschema.faust_codec import AvroCodec, register_codec
+
+
+class Pet(faust.Record):
+    name: str
+    age: int
+
+
+class Owner(faust.Record):
+    name: str
+    pets: typing.List[Pet]
+    best_friend: Pet
+    nickname: typing.Optional[str] = None
+
+
+def make_owner() -> Owner:
+    return Owner(
+        name="john",
+        pets=[Pet(name="dog", age=2), Pet(name="cat", age=5)],
+        best_friend=Pet(name="dog", age=2),
+    )
+
+
+def test_dumps_and_loads():
+    codec = AvroCodec(Owner)
+    owner = make_owner()
+    data = codec.dumps(owner)
+
+    assert data == BinaryEncoder(Owner).encode(owner)
+    # the representation that faust.Record.dumps passes to the codec
+    assert codec.dumps(owner.to_representation()) == data
+    assert codec.loads(data) == owner
+    assert type(codec.loads(data).best_friend) is Pet
+
+
+def test_faust_registry():
+    codec = AvroCodec(Owner)
+    registry = Registry()
+    owner = make_owner()
+
+    data = registry.dumps_value(Owner, owner, serializer=codec)
+    decoded = registry.loads_value(Owner, data, serializer=codec)
+
+    assert data == codec.dumps(owner)
+    assert isinstance(decoded, Owner)
+    assert decoded == owner
+
+
+def test_confluent_framing():
+    schema_registry = confluent.InMemoryRegistry()
+    codec = AvroCodec(Owner, registry=schema_registry)
+    owner = make_owner()
+    data = codec.dumps(owner)
+
+    schema_id, payload = confluent.unframe(data)
+    assert bytes(payload) == AvroCodec(Owner).dumps(owner)
+    assert schema_registry.get_schema(schema_id)
+    assert codec.loads(data) == owner
+
+
+def test_chained_codecs():
+    codec = AvroCodec(Owner) | codecs.binary()
+    owner = make_owner()
+
+    assert codec.loads(codec.dumps(owner)) == owner
+    assert codec.nodes[0].record_class is Owner
+
+
+def test_register_codec():
+    codec = register_codec("avro-owner", Owner)
+
+    try:
+        assert codecs.get_codec("avro-owner") is codec
+        assert codecs.loads("avro-owner", codecs.dumps("avro-owner", make_owner()))
+    finally:
+        del codecs.codecs["avro-owner"]
+
+
+def test_invalid_payload():
+    with pytest.raises(ValueError):
+        AvroCodec(Owner, registry=confluent.InMemoryRegistry()).loads(b"\x01abcd")
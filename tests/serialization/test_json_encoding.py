@@ -0,0 +1,118 @@
+import dataclasses
+import datetime
+import io
+import json
+import typing
+import uuid
+
+import fastavro
+import pytest
+
+from dataclasses_avroschema import types
+from dataclasses_avroschema.json_encoding import JsonDecoder, JsonEncoder
+from dataclasses_avroschema.schema_generator import SchemaGenerator
+
+from .models import Address, without_defaults
+
+
+@dataclasses.dataclass
+class Order:
+    order_id: uuid.uuid4
+    lines: typing.List[Address]
+    prices: typing.Dict[str, float]
+    payload: bytes
+    created_at: datetime.datetime
+    note: typing.Union[None, str, Address]
+    checksum: types.Fixed = types.Fixed(2)
+    status: typing.Tuple[str] = ("NEW", "PAID")
+    paid: bool = False
+
+
+def make_order(**kwargs) -> Order:
+    values = dict(
+        order_id=uuid.UUID("a8098c1a-f86e-11da-bd1a-00112444be1e"),
+        lines=[Address('Main "street"\n', 1), Address("Ñandú", 2)],
+        prices={"coffee": 1.5, "té": -2.0},
+        payload=b"\x00\xff\x10",
+        created_at=datetime.datetime(2020, 1, 2, 3, 4, 5, 6000),
+        note=Address("Contact street", 3),
+        checksum=b"\x01\xfe",
+        status="PAID",
+        paid=True,
+    )
+    values.update(kwargs)
+    return Order(**values)
+
+
+def fastavro_json(instance) -> str:
+    schema = without_defaults(SchemaGenerator(type(instance)).avro_schema_to_python())
+    fo = io.StringIO()
+    fastavro.json_writer(
+        fo, fastavro.parse_schema(schema), [dataclasses.asdict(instance)]
+    )
+    return fo.getvalue()
+
+
+def test_round_trip(user_class, user):
+    data = JsonEncoder(user_class).encode(user)
+
+    assert isinstance(data, bytes)
+    assert JsonDecoder(user_class).decode(data) == user
+    assert JsonDecoder(user_class).decode(data.decode()) == user
+
+
+@pytest.mark.parametrize(
+    "order",
+    [make_order(), make_order(note=None, lines=[], prices={}), make_order(note="ñ")],
+)
+def test_same_as_fastavro(order):
+    data = JsonEncoder(Order).encode(order)
+
+    # compact json, without spaces
+    assert b", " not in data and b": " not in data
+    assert json.loads(data) == json.loads(fastavro_json(order))
+    assert JsonDecoder(Order).decode(fastavro_json(order)) == order
+
+
+def test_encoding():
+    data = json.loads(JsonEncoder(Order).encode(make_order()))
+
+    assert data["payload"] == "\x00\xff\x10"
+    assert data["created_at"] == 1577934245006
+    assert data["note"] == {"Address": {"street": "Contact street", "street_number": 3}}
+    assert data["paid"] == {"boolean": True}
+
+    data = json.loads(
+        JsonEncoder(Order).encode(make_order(prices={"nan": float("nan")}))
+    )
+    assert data["prices"]["nan"] != data["prices"]["nan"]
+
+
+def test_invalid_values():
+    encoder = JsonEncoder(Order)
+    decoder = JsonDecoder(Order)
+
+    with pytest.raises(ValueError, match="is not a valid symbol of the enum status"):
+        encoder.encode(make_order(status="LOST"))
+    with pytest.raises(ValueError, match="does not match any type of the union"):
+        encoder.encode(make_order(note=1))
+    with pytest.raises(ValueError, match="The fixed checksum must have 2 bytes"):
+        encoder.encode(make_order(checksum=b"a"))
+
+    data = json.loads(encoder.encode(make_order()))
+    data["note"] = {"int": 1}
+    with pytest.raises(ValueError, match="'int' is not a type of the union"):
+        decoder.decode(json.dumps(data))
+
+    data["note"] = None
+    data["status"] = "LOST"
+    with pytest.raises(ValueError, match="'LOST' is not a symbol of the enum status"):
+        decoder.decode(json.dumps(data))
+
+
+def test_source():
+    source = JsonEncoder(Order).source
+
+    assert "def json_encode_Order" in source
+    assert "asdict" not in source
+    assert "def json_decode_Order" in JsonDecoder(Order).source
@@ -0,0 +1,264 @@
+import dataclasses
+import datetime
+import decimal
+import io
+import json
+import typing
+
+import pytest
+from fastavro import parse_schema, schemaless_writer
+
+from dataclasses_avroschema import container, types
+from dataclasses_avroschema.decoder import compile_decoder
+from dataclasses_avroschema.encoder import BinaryEncoder
+from dataclasses_avroschema.resolution import (
+    ResolvingDecoder,
+    SchemaResolutionError,
+    compile_resolving_decoder,
+)
+from dataclasses_avroschema.schema_generator import SchemaGenerator
+
+WRITER_SCHEMA = {
+    "type": "record",
+    "name": "Event",
+    "namespace": "events",
+    "fields": [
+        {"name": "name", "type": "string"},
+        {"name": "count", "type": "int"},
+        {"name": "payload", "type": "bytes"},
+        {
+            "name": "removed",
+            "type": {
+                "type": "array",
+                "items": {
+                    "type": "record",
+                    "name": "Removed",
+                    "fields": [
+                        {"name": "values", "type": {"type": "map", "values": "long"}},
+                        {"name": "flag", "type": ["null", "boolean"]},
+                        {"name": "size", "type": "double"},
+                    ],
+                },
+            },
+        },
+        {
+            "name": "level",
+            "type": {"type": "enum", "name": "level", "symbols": ["LOW", "HIGH"]},
+        },
+        {"name": "value", "type": ["null", "int", "string"]},
+        {"name": "source", "type": "Removed"},
+    ],
+}
+
+
+def encode(record, schema=WRITER_SCHEMA):
+    fo = io.BytesIO()
+    schemaless_writer(fo, parse_schema(schema), record)
+    return fo.getvalue()
+
+
+def make_record(**kwargs):
+    record = {
+        "name": "click",
+        "count": 3,
+        "payload": "ñ".encode(),
+        "removed": [
+            {"values": {"a": 1, "b": 2**40}, "flag": True, "size": 1.5},
+            {"values": {}, "flag": None, "size": 2.5},
+        ],
+        "level": "HIGH",
+        "value": 10,
+        "source": {"values": {"c": 3}, "flag": False, "size": 0.5},
+    }
+    record.update(kwargs)
+    return record
+
+
+@dataclasses.dataclass
+class Event:
+    name: str
+    count: float
+    payload: str
+    value: typing.Union[str, int, None]
+    level: typing.Tuple[str] = ("LOW", "MEDIUM", "HIGH")
+    tags: typing.List[str] = dataclasses.field(default_factory=lambda: ["new"])
+    created_on: datetime.date = datetime.date(2020, 1, 2)
+    owner: typing.Optional[str] = None
+
+    @staticmethod
+    def extra_avro_attributes():
+        return {"namespace": "events"}
+
+
+def test_resolve():
+    decoder = ResolvingDecoder(Event, WRITER_SCHEMA)
+    events = decoder.decode_many(
+        encode(make_record()) + encode(make_record(value="ten", count=-70))
+    )
+
+    assert events == [
+        Event("click", 3.0, "ñ", 10, "HIGH", ["new"], datetime.date(2020, 1, 2)),
+        Event("click", -70.0, "ñ", "ten", "HIGH", ["new"], datetime.date(2020, 1, 2)),
+    ]
+    assert type(events[0].count) is float
+    # mutable defaults are not shared
+    assert events[0].tags is not events[1].tags
+
+
+def test_resolve_invalid_values():
+    decoder = ResolvingDecoder(Event, json.dumps(WRITER_SCHEMA))
+
+    @dataclasses.dataclass
+    class RenamedEvent:
+        value: str
+
+        @staticmethod
+        def extra_avro_attributes():
+            return {"aliases": ["Event"]}
+
+    with pytest.raises(ValueError, match="can not be read as string"):
+        ResolvingDecoder(RenamedEvent, WRITER_SCHEMA).decode(
+            encode(make_record(value=None))
+        )
+
+    level_schema = dict(WRITER_SCHEMA)
+    level_schema["fields"] = WRITER_SCHEMA["fields"][:4] + [
+        {
+            "name": "level",
+            "type": {"type": "enum", "name": "level", "symbols": ["LOW", "HIGHEST"]},
+        },
+        *WRITER_SCHEMA["fields"][5:],
+    ]
+    decoder = ResolvingDecoder(Event, level_schema)
+
+    assert decoder.decode(encode(make_record(level="LOW"), level_schema)).level == "LOW"
+    with pytest.raises(ValueError, match="HIGHEST is not a symbol of the enum level"):
+        decoder.decode(encode(make_record(level="HIGHEST"), level_schema))
+
+
+def test_resolution_errors():
+    @dataclasses.dataclass
+    class Event:
+        name: str
+        owner: str
+
+    with pytest.raises(
+        SchemaResolutionError,
+        match="Event.owner: the field is not in the writer schema and has no default",
+    ):
+        compile_resolving_decoder(WRITER_SCHEMA, Event)
+
+    @dataclasses.dataclass
+    class Event:
+        name: int
+
+    with pytest.raises(
+        SchemaResolutionError, match="Event.name: string can not be read as int"
+    ):
+        compile_resolving_decoder(WRITER_SCHEMA, Event)
+
+
+def test_resolving_decoder_is_cached():
+    decode = compile_resolving_decoder(WRITER_SCHEMA, Event)
+
+    assert compile_resolving_decoder(json.dumps(WRITER_SCHEMA), Event) is decode
+    assert "resolve_events_Event" in decode.__source__
+    # the schema of the class does not need to be resolved
+    assert compile_resolving_decoder(
+        SchemaGenerator(Event).avro_schema(), Event
+    ) is compile_decoder(Event, zero_copy=False)
+
+
+def test_read_container_with_old_schema():
+    @dataclasses.dataclass
+    class User:
+        name: str
+        age: int
+
+    users = [User("john", 20), User("jane", 30)]
+    fo = io.BytesIO()
+    container.write_container(fo, User, users)
+
+    @dataclasses.dataclass
+    class User:
+        name: str
+        email: str = "unknown"
+
+    assert list(container.read_container(fo.getvalue(), User)) == [
+        User("john"),
+        User("jane"),
+    ]
+
+    with pytest.raises(ValueError, match="is not the schema of User"):
+        container.ContainerReader(fo.getvalue(), User).check_schema()
+
+
+def test_resolve_encoded_by_previous_version():
+    @dataclasses.dataclass
+    class Point:
+        x: int
+        y: int
+
+    data = BinaryEncoder(Point).encode(Point(1, 2))
+    writer_schema = SchemaGenerator(Point).avro_schema()
+
+    @dataclasses.dataclass
+    class Point:
+        x: float
+        z: float = 0.0
+
+    assert ResolvingDecoder(Point, writer_schema).decode(data) == Point(1.0, 0.0)
+
+
+def test_resolve_logical_types():
+    created_at = datetime.datetime(2020, 1, 1, 12, 0, tzinfo=datetime.timezone.utc)
+    writer_schema = {
+        "type": "record",
+        "name": "Payment",
+        "fields": [
+            {
+                "name": "created_at",
+                "type": {"type": "long", "logicalType": "timestamp-millis"},
+            },
+            {
+                "name": "amount",
+                "type": {
+                    "type": "bytes",
+                    "logicalType": "decimal",
+                    "precision": 5,
+                    "scale": 2,
+                },
+            },
+        ],
+    }
+    data = encode(
+        {"created_at": created_at, "amount": decimal.Decimal("1.50")}, writer_schema
+    )
+
+    @dataclasses.dataclass
+    class Payment:
+        created_at: types.TimestampMicros
+        amount: types.Decimal = types.Decimal(6, 3)
+
+    # millis are read as micros and decimals with a larger scale
+    payment = ResolvingDecoder(Payment, writer_schema).decode(data)
+    assert payment.created_at == created_at.replace(tzinfo=None)
+    assert payment.amount == decimal.Decimal("1.50")
+
+    @dataclasses.dataclass
+    class Payment:  # noqa: F811
+        created_at: datetime.datetime
+        amount: types.Decimal = types.Decimal(5, 3)
+
+    with pytest.raises(
+        SchemaResolutionError,
+        match=r"Payment.amount: decimal\(5, 2\) can not be read as decimal\(5, 3\)",
+    ):
+        ResolvingDecoder(Payment, writer_schema)
+
+    writer_schema["fields"][0]["type"]["logicalType"] = "timestamp-micros"
+    with pytest.raises(
+        SchemaResolutionError,
+        match="Payment.created_at: timestamp-micros can not be read as timestamp-millis",
+    ):
+        ResolvingDecoder(Payment, writer_schema)
@@ -0,0 +1,89 @@
+import dataclasses
+
+import pytest
+
+from dataclasses_avroschema.validation import (
+    ValidationError,
+    ValidatorCompiler,
+    compile_validator,
+    validate,
+)
+
+from .models import Address, User, make_user
+
+
+def test_validate(user_class, user):
+    assert validate(user) is None
+    assert validate(user, user_class) is None
+    assert validate(make_user(age=2**31 - 1, contact="john", nickname=None)) is None
+
+
+@pytest.mark.parametrize(
+    "user, message",
+    [
+        (make_user(age=2**31), "User.age: 2147483648 is not a valid int"),
+        (make_user(age=True), "User.age: True is not a valid int"),
+        (make_user(name=b"john"), "User.name: b'john' is not a valid string"),
+        (make_user(pets="dog"), "User.pets: 'dog' is not a list"),
+        (make_user(pets=["dog", 1]), "User.pets: 1 is not a valid string"),
+        (make_user(accounts={1: 2}), "User.accounts: 1 is not a valid map key"),
+        (make_user(address=None), "User.address: None is not an instance of Address"),
+        (
+            make_user(previous_addresses=[Address("street", "1")]),
+            "Address.street_number: '1' is not a valid int",
+        ),
+        (make_user(friends=[1]), "User.friends: 1 is not an instance of User"),
+        (
+            make_user(friends=[make_user(md5=b"abc")]),
+            "User.md5: b'abc' is not valid for the fixed md5 of 4 bytes",
+        ),
+        (
+            make_user(favorite_color="RED"),
+            "User.favorite_color: 'RED' is not a valid symbol of the enum",
+        ),
+        (make_user(created_at="2020"), "User.created_at: '2020' is not a valid"),
+        (make_user(contact=2**40), "User.contact: 1099511627776 is not a valid int"),
+        (make_user(contact=1.5), "User.contact: 1.5 does not match any type"),
+        (make_user(money="1.5"), "User.money: '1.5' does not match any type"),
+    ],
+)
+def test_invalid_values(user, message):
+    with pytest.raises(ValidationError, match=message.replace("[", r"\[")):
+        validate(user)
+
+
+def test_validate_class():
+    with pytest.raises(ValidationError, match="is not an instance of User"):
+        validate(Address("street", 1), User)
+
+
+def test_long_range():
+    @dataclasses.dataclass
+    class Counter:
+        value: int
+        total: float
+
+    schema = {
+        "type": "record",
+        "name": "Counter",
+        "fields": [
+            {"name": "value", "type": ["null", "long"]},
+            {"name": "total", "type": "double"},
+        ],
+    }
+    validate_counter = ValidatorCompiler({"Counter": Counter}).build(schema, "Counter")
+
+    validate_counter(Counter(2**40, 1))
+    validate_counter(Counter(None, 1.5))
+    with pytest.raises(ValidationError, match="Counter.value: 9223372036854775808"):
+        validate_counter(Counter(2**63, 1.5))
+    with pytest.raises(ValidationError, match="Counter.total: None is not a valid"):
+        validate_counter(Counter(1, None))
+
+
+def test_validator_is_compiled():
+    source = compile_validator(User).__source__
+
+    assert compile_validator(User) is compile_validator(User)
+    assert "def validate_User" in source
+    assert "def validate_Address" in source
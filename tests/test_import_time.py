@@ -0,0 +1,38 @@
+import json
+import subprocess
+import sys
+
+IMPORT_CHECK = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import dataclasses_avroschema.schema_generator
+elapsed = time.perf_counter() - start
+
+print(json.dumps({
+    "elapsed": elapsed,
+    "faust": "faust" in sys.modules,
+    "inflect": "inflect" in sys.modules,
+}))
+"""
+
+
+def run_import_check():
+    output = subprocess.check_output([sys.executable, "-c", IMPORT_CHECK])
+    return json.loads(output)
+
+
+def test_import_does_not_load_optional_dependencies():
+    result = run_import_check()
+
+    assert not result["faust"]
+    assert not result["inflect"]
+
+
+def test_import_time():
+    # generous bound, it only catches heavy imports added at module level
+    elapsed = min(run_import_check()["elapsed"] for _ in range(3))
+
+    assert elapsed < 0.5